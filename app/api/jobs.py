@@ -0,0 +1,112 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.export import EXPORT_MEDIA_TYPES
+from app.core.jobs import JobQueueFull, JobRunner, job_runner
+from app.core.responses import model_response
+from app.models import Job, JobStatus
+from app.schemas.job import JobOut
+from app.services.user_jobs import (
+    BACKFILL_POST_COUNT_JOB,
+    BULK_CREATE_JOB,
+    EXPORT_JOB,
+    export_path,
+)
+
+router = APIRouter()
+
+# 작업이 가득 찼을 때 다시 시도할 때까지 대기 시간 (초)
+RETRY_AFTER_SECONDS = 30
+
+
+def get_job_runner() -> JobRunner:
+    return job_runner
+
+
+async def submit_job(request: Request, runner: JobRunner, kind: str, payload: dict):
+    """작업 등록 후 202 Accepted (Location: 상태 조회 URL)"""
+    try:
+        job = await runner.submit(kind, payload)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending jobs",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        ) from None
+    return model_response(
+        JobOut,
+        job,
+        status_code=202,
+        headers={"Location": str(request.url_for("get_job", job_id=job.id))},
+    )
+
+
+@router.post("/jobs/users/bulk", response_model=JobOut, status_code=202)
+async def submit_bulk_create_users(
+    request: Request,
+    users_data: list[dict],
+    batch_size: int = Query(
+        settings.ingest_batch_size, ge=1, le=50000, description="DB 적재 배치 크기"
+    ),
+    runner: JobRunner = Depends(get_job_runner),
+):
+    """대량 사용자 생성 작업 등록 (결과는 /users/bulk/ingest 와 같은 보고서)"""
+    return await submit_job(
+        request,
+        runner,
+        BULK_CREATE_JOB,
+        {"users": users_data, "batch_size": batch_size},
+    )
+
+
+@router.post("/jobs/users/backfill-post-count", response_model=JobOut, status_code=202)
+async def submit_backfill_post_count(
+    request: Request, runner: JobRunner = Depends(get_job_runner)
+):
+    """users.post_count 재계산 작업 등록"""
+    return await submit_job(request, runner, BACKFILL_POST_COUNT_JOB, {})
+
+
+@router.post("/jobs/users/export", response_model=JobOut, status_code=202)
+async def submit_export_users(
+    request: Request,
+    export_format: Literal["ndjson", "json"] = Query(
+        "ndjson", alias="format", description="출력 형식"
+    ),
+    batch_size: int = Query(1000, ge=1, le=10000, description="DB 배치 크기"),
+    runner: JobRunner = Depends(get_job_runner),
+):
+    """사용자 전체 파일 내보내기 작업 등록 (완료 후 /jobs/{id}/download)"""
+    return await submit_job(
+        request, runner, EXPORT_JOB, {"format": export_format, "batch_size": batch_size}
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobOut)
+async def get_job(job_id: int):
+    """작업 상태/진행률 조회"""
+    job = await Job.get_or_none(id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return model_response(JobOut, job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_job_result(job_id: int):
+    """내보내기 작업 결과 파일"""
+    job = await Job.get_or_none(id=job_id)
+    if job is None or job.kind != EXPORT_JOB:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+
+    export_format = job.payload.get("format", "ndjson")
+    path = export_path(job.id, export_format)
+    if not path.exists():
+        raise HTTPException(status_code=410, detail="Export file is gone")
+    return FileResponse(
+        path, media_type=EXPORT_MEDIA_TYPES[export_format], filename=path.name
+    )
@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.admission import admission_controller
+from app.core.cache import cache
+from app.core.compression import compression_cache
+from app.core.db_pool import pool_registry
+from app.core.metrics import metrics_registry
+from app.core.metrics_store import metrics_store
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Prometheus 스크레이프용 메트릭 (gunicorn 에서는 모든 워커의 합산)"""
+    return PlainTextResponse(
+        await metrics_store.collect(render_process_metrics()),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+def render_process_metrics() -> str:
+    """이 프로세스의 메트릭"""
+    return (
+        metrics_registry.render_prometheus()
+        + cache.render_prometheus()
+        + pool_registry.render_prometheus()
+        + compression_cache.render_prometheus()
+        + admission_controller.render_prometheus()
+    )
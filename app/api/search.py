@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.core.responses import model_response
+from app.core.search import search_terms
+from app.repositories.search_repository import SearchRepository, SearchScope
+from app.schemas.search import SearchResponse
+
+router = APIRouter()
+
+# offset 이 클수록 앞의 결과를 모두 정렬해야 하므로 상한을 둠
+MAX_SEARCH_OFFSET = 1000
+
+
+def get_search_repository() -> SearchRepository:
+    return SearchRepository()
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    scope: SearchScope = Query("all", description="검색 대상"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    repo: SearchRepository = Depends(get_search_repository),
+):
+    """게시글/댓글 전문 검색 (모든 단어 포함, 관련도 순)"""
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="No searchable terms in query")
+
+    hits, has_more = await repo.search(terms, scope=scope, limit=limit, offset=offset)
+    return model_response(
+        SearchResponse,
+        {
+            "message": f"Found {len(hits)} results for {q!r}",
+            "hits": hits,
+            "next_offset": offset + limit if has_more else None,
+        },
+    )
@@ -1,90 +1,301 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Literal
 
-from app.repositories.user_repository import UserRepository
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.dependencies import get_loaders
+from app.core.etag import not_modified, request_etag
+from app.core.export import EXPORT_MEDIA_TYPES, encode_export
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.projection import parse_fields
+from app.core.responses import dump_json, model_response
+from app.repositories.cached_user_repository import CachedUserRepository
+from app.repositories.loaders import UserLoaders
+from app.repositories.user_repository import (
+    USER_COLUMNS,
+    USER_RELATION_COLUMNS,
+    UserRepository,
+)
+from app.schemas.user import (
+    BulkCreateResponse,
+    UserListResponse,
+    UserNamesResponse,
+    UserOut,
+    UserPostCountResponse,
+    UserProjectionResponse,
+    UserThreadsResponse,
+    UserWithPosts,
+)
+from app.services.user_service import (
+    UserIngestService,
+    iter_csv_rows,
+    iter_lines,
+    iter_ndjson_rows,
+)
 
 router = APIRouter()
 
+# 대량 적재 본문 형식
+INGEST_PARSERS = {
+    "application/x-ndjson": iter_ndjson_rows,
+    "application/jsonl": iter_ndjson_rows,
+    "text/csv": iter_csv_rows,
+}
+
 
 def get_user_repository() -> UserRepository:
-    return UserRepository()
+    return CachedUserRepository(cache)
 
 
-@router.get("/users/")
+@router.get("/users/", response_model=UserListResponse | UserProjectionResponse)
 async def get_users(
-    optimized: bool = Query(False, description="N+1 문제 해결 여부"),
+    request: Request,
+    optimized: bool = Query(
+        False,
+        description="페이지 사용자의 posts/profile 을 함께 조회 (쿼리 3개, 아니면 1개)",
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    fields: str | None = Query(
+        None,
+        description="선택한 컬럼만 조회 (쉼표 구분, 관계는 posts.title 형식)",
+        examples=["id,name,posts.title,profile.bio"],
+    ),
     repo: UserRepository = Depends(get_user_repository),
 ):
-    """사용자 목록 조회 (N+1 문제 해결 옵션)"""
+    """사용자 목록 조회 (관계 prefetch 옵션, 키셋 페이지네이션, 컬럼 선택)
+
+    ETag: 페이지 사용자의 (id, updated_at) 기준 (fields 사용 시 선택한 컬럼 값).
+    ETag 를 먼저 확인하고 일치하지 않을 때만 관계를 읽고 직렬화한다.
+    """
+    try:
+        after_id = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+    if fields is not None:
+        try:
+            projection = parse_fields(fields, USER_COLUMNS, USER_RELATION_COLUMNS)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from None
+
+        rows, next_after_id = await repo.get_users_page_rows(
+            limit=limit, projection=projection, after_id=after_id
+        )
+        # 선택한 컬럼에 수정 시각이 없을 수 있으므로 읽은 값 자체를 버전으로 사용.
+        # profile 은 수정 시각이 없어 값을 먼저 붙이고 (사용자당 1행),
+        # posts 는 페이지 작성자 범위의 집계로 대신해 304 면 읽지 않는다
+        await repo.attach_relations(rows, projection, relations=("profile",))
+        posts_version = None
+        if "posts" in projection.relations:
+            posts_version = await repo.get_posts_version([row["id"] for row in rows])
+        etag = request_etag(request, next_after_id, rows, posts_version)
+        if response := not_modified(request, etag):
+            return response
+
+        await repo.attach_relations(rows, projection, relations=("posts",))
+        projection.drop_unselected_id(rows)
+        body = dump_json(
+            UserProjectionResponse,
+            {
+                "message": "Users fetched with column projection",
+                "users": rows,
+                "next_cursor": (
+                    encode_cursor(next_after_id) if next_after_id is not None else None
+                ),
+            },
+        )
+        return Response(body, headers={"ETag": etag}, media_type="application/json")
+
+    users, has_more = await repo.get_users_page(limit=limit, after_id=after_id)
+    # 마지막 페이지 뒤에 행이 추가되면 next_cursor 가 바뀌므로 has_more 포함
+    etag = request_etag(
+        request, has_more, [(user.id, user.updated_at) for user in users]
+    )
+    if response := not_modified(request, etag):
+        return response
+    if optimized:
+        await repo.prefetch_page_relations(users)
+    next_cursor = encode_cursor(users[-1].id) if has_more else None
+
     if optimized:
-        users = await repo.get_all_users_optimized()
-        return {
-            "message": "Users fetched with optimization (prefetch_related)",
-            "users": [{"id": u.id, "name": u.name, "email": u.email} for u in users],
-        }
+        message = "Users page fetched with posts/profile prefetched"
     else:
-        users = await repo.get_all_users()
-        return {
-            "message": "Users fetched without optimization (N+1 problem)",
-            "users": [{"id": u.id, "name": u.name, "email": u.email} for u in users],
-        }
+        message = "Users page fetched"
+    return model_response(
+        UserListResponse,
+        {"message": message, "users": users, "next_cursor": next_cursor},
+        headers={"ETag": etag},
+    )
+
+
+@router.get("/users/export")
+async def export_users(
+    export_format: Literal["ndjson", "json"] = Query(
+        "ndjson", alias="format", description="출력 형식"
+    ),
+    batch_size: int = Query(1000, ge=1, le=10000, description="DB 배치 크기"),
+    repo: UserRepository = Depends(get_user_repository),
+):
+    """사용자 전체 스트리밍 내보내기 (전체 목록을 메모리에 올리지 않음)"""
+    batches = repo.iter_users(batch_size=batch_size)
+    return StreamingResponse(
+        encode_export(batches, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+    )
+
+
+@router.get("/users/names-only", response_model=UserNamesResponse)
+async def get_user_names_only(
+    request: Request, repo: UserRepository = Depends(get_user_repository)
+):
+    """사용자 이름만 조회 (values 최적화, ETag: users 집계 버전)"""
+    etag = request_etag(request, await repo.get_users_version())
+    if response := not_modified(request, etag):
+        return response
+
+    names = await repo.get_user_names_only()
+    return model_response(
+        UserNamesResponse,
+        {"message": "User names only using values optimization", "names": names},
+        headers={"ETag": etag},
+    )
 
 
-@router.get("/users/{user_id}")
+@router.get("/users/{user_id}", response_model=UserWithPosts | UserOut)
 async def get_user(
     user_id: int,
+    request: Request,
     with_posts: bool = Query(False, description="게시글 포함 여부"),
     repo: UserRepository = Depends(get_user_repository),
+    loaders: UserLoaders = Depends(get_loaders),
 ):
-    """사용자 상세 조회"""
-    if with_posts:
-        user = await repo.get_user_with_posts(user_id)
-    else:
-        user = await repo.get_user_by_id(user_id)
-
+    """사용자 상세 조회 (ETag: User.updated_at, 게시글 포함 시 Post.updated_at 포함)"""
+    user = await repo.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    result = {"id": user.id, "name": user.name, "email": user.email}
+    if not with_posts:
+        etag = request_etag(request, user.id, user.updated_at)
+        if response := not_modified(request, etag):
+            return response
+        return model_response(UserOut, user, headers={"ETag": etag})
 
-    if with_posts:
-        await user.fetch_related("posts")
-        result["posts"] = [{"id": p.id, "title": p.title} for p in user.posts]
+    posts = await loaders.posts.load(user.id)
+    etag = request_etag(
+        request, user.id, user.updated_at, [(p.id, p.updated_at) for p in posts]
+    )
+    if response := not_modified(request, etag):
+        return response
+    return model_response(
+        UserWithPosts,
+        {"id": user.id, "name": user.name, "email": user.email, "posts": posts},
+        headers={"ETag": etag},
+    )
 
-    return result
 
+@router.get("/users/{user_id}/threads", response_model=UserThreadsResponse)
+async def get_user_threads(
+    user_id: int,
+    posts_limit: int = Query(20, ge=1, le=100, description="최근 게시글 수"),
+    comments_limit: int = Query(10, ge=1, le=100, description="게시글별 최근 댓글 수"),
+    repo: UserRepository = Depends(get_user_repository),
+):
+    """사용자 → 게시글 → 댓글(작성자 포함) 트리 (데이터 양과 무관하게 쿼리 수 고정)"""
+    user = await repo.get_user_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    posts, has_more = await repo.get_post_threads(
+        user.id, posts_limit=posts_limit, comments_limit=comments_limit
+    )
+    return model_response(
+        UserThreadsResponse,
+        {
+            "id": user.id,
+            "name": user.name,
+            "email": user.email,
+            "posts": posts,
+            "has_more_posts": has_more,
+        },
+    )
 
-@router.post("/users/")
+
+@router.post("/users/", response_model=UserOut)
 async def create_user(
     name: str, email: str, repo: UserRepository = Depends(get_user_repository)
 ):
     """사용자 생성"""
     user = await repo.create_user(name=name, email=email)
-    return {"id": user.id, "name": user.name, "email": user.email}
+    return model_response(UserOut, user)
 
 
-@router.post("/users/bulk")
+@router.post("/users/bulk", response_model=BulkCreateResponse)
 async def bulk_create_users(
     users_data: list[dict], repo: UserRepository = Depends(get_user_repository)
 ):
     """대량 사용자 생성 (bulk_create 최적화)"""
     users = await repo.bulk_create_users(users_data)
-    return {
-        "message": f"Created {len(users)} users using bulk_create",
-        "users": [{"id": u.id, "name": u.name, "email": u.email} for u in users],
-    }
+    return model_response(
+        BulkCreateResponse,
+        {"message": f"Created {len(users)} users using bulk_create", "users": users},
+    )
+
+
+@router.post("/users/bulk/ingest")
+async def ingest_users(
+    request: Request,
+    batch_size: int = Query(
+        settings.ingest_batch_size, ge=1, le=50000, description="DB 적재 배치 크기"
+    ),
+    repo: UserRepository = Depends(get_user_repository),
+):
+    """스트리밍 대량 적재 (NDJSON / CSV 본문, 행 단위 검증 후 배치 COPY)"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    parser = INGEST_PARSERS.get(content_type.lower())
+    if parser is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported content type, use one of {sorted(INGEST_PARSERS)}",
+        )
+
+    service = UserIngestService(repo, batch_size=batch_size)
+    return await service.ingest(parser(iter_lines(request.stream())))
 
 
-@router.get("/users/stats/post-count")
+@router.get("/users/stats/post-count", response_model=UserPostCountResponse)
 async def get_users_with_post_count(
+    request: Request,
+    live: bool = Query(False, description="posts 실시간 집계 (정확하지만 느림)"),
     repo: UserRepository = Depends(get_user_repository),
 ):
-    """사용자별 게시글 수 집계 (annotate 사용)"""
-    stats = await repo.get_users_with_post_count()
-    return {"message": "User post count statistics using annotate", "stats": stats}
+    """사용자별 게시글 수 (기본: 비정규화 컬럼, live: annotate 집계)
 
+    ETag: users 집계 버전 (live 는 posts 집계 버전 포함)
+    """
+    version = [await repo.get_users_version()]
+    if live:
+        version.append(await repo.get_posts_version())
+    etag = request_etag(request, *version)
+    if response := not_modified(request, etag):
+        return response
 
-@router.get("/users/names-only")
-async def get_user_names_only(repo: UserRepository = Depends(get_user_repository)):
-    """사용자 이름만 조회 (values 최적화)"""
-    names = await repo.get_user_names_only()
-    return {"message": "User names only using values optimization", "names": names}
+    stats = await repo.get_users_with_post_count(live=live)
+    if live:
+        message = "User post count statistics using annotate"
+    else:
+        message = "User post count statistics using precomputed post_count"
+    return model_response(
+        UserPostCountResponse,
+        {"message": message, "stats": stats},
+        headers={"ETag": etag},
+    )
@@ -0,0 +1,260 @@
+"""부하 제어 (route 별 동시 실행 상한 + 대기열, 클라이언트별 요청 속도 제한)
+
+느린 엔드포인트로 요청이 몰리면 DB 커넥션 풀 앞에 대기가 쌓이고, 같은 풀을 쓰는 다른
+엔드포인트의 지연시간까지 함께 늘어난다. 비싼 route 의 동시 실행 수를 풀 크기보다
+작게 제한하고, 상한을 넘은 요청은 짧은 대기열에서 기다리게 한다. 대기열이 가득
+찼거나 queue_timeout 안에 차례가 오지 않으면 바로 거절해(503 + Retry-After) 풀을
+비싼 요청이 독점하지 않게 한다.
+
+- 요청마다 dict 조회와 카운터 연산만 하고, 대기할 때만 Future 를 만든다
+- 슬롯은 반납 시 대기열의 다음 요청에게 바로 넘긴다 (FIFO, 새 요청이 새치기하지 않음)
+- 제한은 프로세스(워커) 단위이므로 전체 동시 실행 수는 워커 수 x 상한
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qsl
+
+from app.core.config import settings
+from app.core.metrics import LATENCY_BUCKETS, Histogram, escape_label, histogram_lines
+
+# FastAPI(pydantic) 가 bool 쿼리 파라미터로 받아들이는 값 (대소문자 무시)
+_TRUE_VALUES = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_VALUES = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+def _normalize_query_value(value: str) -> str:
+    """bool 로 해석되는 값은 "true"/"false" 로 통일 (?optimized=1 과 =true 를 같게 취급)"""
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return "true"
+    if lowered in _FALSE_VALUES:
+        return "false"
+    return value
+
+
+class ConcurrencyLimiter:
+    """동시 실행 상한 + 제한된 대기열 (대기열이 가득 차거나 timeout 이면 거절)"""
+
+    def __init__(self, limit: int, max_queue: int, queue_timeout: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected = {"queue_full": 0, "timeout": 0}
+        # 대기열을 거쳐 들어간 요청의 대기 시간
+        self.queue_wait = Histogram(LATENCY_BUCKETS)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """슬롯을 얻으면 True (이후 반드시 release), 거절되면 False"""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.rejected["queue_full"] += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await future
+        except BaseException as exc:
+            if future.cancelled():
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass  # release 가 이미 건너뛰며 꺼냄
+            else:
+                # 슬롯을 넘겨받은 직후 timeout/취소: 다음 대기자에게 넘김
+                self.release()
+            if isinstance(exc, TimeoutError):
+                self.rejected["timeout"] += 1
+                return False
+            raise
+        self.admitted += 1
+        self.queue_wait.observe(time.perf_counter() - start)
+        return True
+
+    def release(self) -> None:
+        """슬롯 반납 (대기자가 있으면 active 를 줄이지 않고 그대로 넘김)"""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+class TokenBucketLimiter:
+    """클라이언트별 토큰 버킷 (초당 rate 개 충전, 최대 burst 개)
+
+    버킷은 max_clients 개까지 LRU 로 유지한다. 밀려난 클라이언트는 다음 요청에서
+    가득 찬 버킷으로 다시 시작한다.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        # 클라이언트 → [남은 토큰, 마지막 갱신 시각]
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self.limited = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def check(self, client: str) -> float:
+        """요청 하나를 허용하면 0, 아니면 토큰 하나가 찰 때까지 남은 시간(초)"""
+        now = time.monotonic()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            if len(self._buckets) >= self.max_clients:
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[client] = [float(self.burst), now]
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        self.limited += 1
+        return (1 - bucket[0]) / self.rate
+
+
+class AdmissionController:
+    """route 별 ConcurrencyLimiter 와 선택적 TokenBucketLimiter 묶음
+
+    route_limits 키는 "METHOD 경로" 또는 "METHOD 경로?이름=값" 이다. 쿼리 조건이 있는
+    키는 요청 쿼리에 같은 (이름, 값) 쌍이 있을 때 경로만 있는 키보다 우선한다.
+    bool 로 해석되는 값은 FastAPI 와 같게 비교한다 (1/True/yes 는 모두 true).
+    상한이 0 이면 제한하지 않는다 (예: 싼 변형을 비싼 변형의 제한에서 제외).
+    """
+
+    def __init__(
+        self,
+        route_limits: dict[str, int],
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+        rate_limit: float = 0.0,
+        rate_burst: int = 1,
+        rate_max_clients: int = 10000,
+    ):
+        self.retry_after = retry_after
+        # 이름 → limiter (None 이면 제한 없음)
+        self.limiters: dict[str, ConcurrencyLimiter | None] = {}
+        # (method, path) → (쿼리 조건별 limiter, 기본 limiter)
+        self._routes: dict[tuple[str, str], tuple[dict, ConcurrencyLimiter | None]] = {}
+        for name, limit in route_limits.items():
+            method, _, target = name.partition(" ")
+            path, _, query = target.partition("?")
+            limiter = (
+                ConcurrencyLimiter(limit, max_queue, queue_timeout) if limit else None
+            )
+            self.limiters[name] = limiter
+            by_query, default = self._routes.get((method.upper(), path), ({}, None))
+            if query:
+                param, _, value = query.partition("=")
+                by_query[(param, _normalize_query_value(value))] = limiter
+            else:
+                default = limiter
+            self._routes[(method.upper(), path)] = (by_query, default)
+
+        self.rate_limiter = (
+            TokenBucketLimiter(rate_limit, rate_burst, rate_max_clients)
+            if rate_limit > 0
+            else None
+        )
+
+    def route_limiter(
+        self, method: str, path: str, query_string: bytes
+    ) -> ConcurrencyLimiter | None:
+        """요청에 적용할 limiter (설정되지 않은 route 는 None)"""
+        route = self._routes.get((method, path))
+        if route is None:
+            return None
+        by_query, default = route
+        if by_query and query_string:
+            for param, value in parse_qsl(query_string.decode("latin-1")):
+                pair = (param, _normalize_query_value(value))
+                if pair in by_query:
+                    return by_query[pair]
+        return default
+
+    def render_prometheus(self) -> str:
+        limiters = {
+            name: limiter
+            for name, limiter in sorted(self.limiters.items())
+            if limiter is not None
+        }
+        lines = []
+        if limiters:
+            gauges = (
+                ("admission_limit", "Configured concurrency limit.", "limit"),
+                ("admission_in_flight", "Requests holding a slot.", "active"),
+                ("admission_queued", "Requests waiting for a slot.", "queued"),
+            )
+            for metric, help_text, attr in gauges:
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+                for name, limiter in limiters.items():
+                    lines.append(
+                        f'{metric}{{route="{escape_label(name)}"}} '
+                        f"{getattr(limiter, attr)}"
+                    )
+
+            lines += [
+                "# HELP admission_rejected_total Requests rejected with 503.",
+                "# TYPE admission_rejected_total counter",
+            ]
+            for name, limiter in limiters.items():
+                for reason, count in limiter.rejected.items():
+                    lines.append(
+                        f'admission_rejected_total{{route="{escape_label(name)}",'
+                        f'reason="{reason}"}} {count}'
+                    )
+
+            lines += [
+                "# HELP admission_queue_wait_seconds Time queued before admission.",
+                "# TYPE admission_queue_wait_seconds histogram",
+            ]
+            for name, limiter in limiters.items():
+                lines += histogram_lines(
+                    "admission_queue_wait_seconds",
+                    f'route="{escape_label(name)}"',
+                    limiter.queue_wait,
+                )
+
+        if self.rate_limiter is not None:
+            lines += [
+                "# HELP rate_limited_total Requests rejected with 429.",
+                "# TYPE rate_limited_total counter",
+                f"rate_limited_total {self.rate_limiter.limited}",
+                "# HELP rate_limit_clients Clients with a tracked token bucket.",
+                "# TYPE rate_limit_clients gauge",
+                f"rate_limit_clients {len(self.rate_limiter)}",
+            ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# 프로세스 전역 부하 제어기
+admission_controller = AdmissionController(
+    route_limits=settings.admission_route_limits,
+    max_queue=settings.admission_max_queue,
+    queue_timeout=settings.admission_queue_timeout,
+    retry_after=settings.admission_retry_after,
+    rate_limit=settings.rate_limit_per_second,
+    rate_burst=settings.rate_limit_burst,
+    rate_max_clients=settings.rate_limit_max_clients,
+)
@@ -0,0 +1,185 @@
+"""읽기 캐시 (TTL + LRU, single-flight)
+
+CacheBackend 는 저장소 인터페이스다. 프로세스 내 InMemoryCache 를 기본으로
+제공하며, Redis 등 외부 저장소는 같은 인터페이스로 구현한다 (값은 JSON 으로
+표현 가능한 평범한 dict/list 로만 저장하므로 직렬화만 추가하면 된다).
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.config import settings
+
+# 캐시에 키가 없음을 나타내는 값 (None 도 저장 가능한 값이므로 구분)
+MISSING = object()
+
+
+class _LoaderCancelled(Exception):
+    """로딩하던 요청이 취소됨 (대기자는 취소되지 않고 다시 시도)"""
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """값 반환 (없거나 만료되었으면 MISSING)"""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """값 저장 (ttl 초 후 만료, None 이면 기본 TTL)"""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """키 삭제"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """전체 삭제"""
+
+
+class InMemoryCache(CacheBackend):
+    """프로세스 내 TTL + LRU 캐시 (엔트리 수로 메모리 상한)"""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        default_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.evictions = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = self._clock() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class Cache:
+    """백엔드 앞단: single-flight 로딩과 hit/miss 집계"""
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        # 키별 진행 중인 로딩 (같은 키의 동시 miss 는 로더를 한 번만 실행)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+        cache_none: bool = False,
+    ) -> Any:
+        """캐시된 값을 반환하고, 없으면 loader 결과를 저장 후 반환"""
+        if not self.enabled:
+            return await loader()
+
+        value = await self.backend.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _LoaderCancelled:
+                # 로딩하던 요청만 취소됨: 먼저 깨어난 대기자가 다음 로더가 된다
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                exc = _LoaderCancelled()
+            future.set_exception(exc)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            # 로딩 중 invalidate 되었다면 오래된 값을 저장하지 않음
+            if self._inflight.get(key) is future and (value is not None or cache_none):
+                await self.backend.set(key, value, ttl)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._inflight.pop(key, None)
+        await self.backend.delete(*keys)
+
+    async def clear(self) -> None:
+        self._inflight.clear()
+        await self.backend.clear()
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP cache_hits_total Cache hits.",
+            "# TYPE cache_hits_total counter",
+            f"cache_hits_total {self.hits}",
+            "# HELP cache_misses_total Cache misses.",
+            "# TYPE cache_misses_total counter",
+            f"cache_misses_total {self.misses}",
+        ]
+        if isinstance(self.backend, InMemoryCache):
+            lines += [
+                "# HELP cache_entries Entries currently held in the cache.",
+                "# TYPE cache_entries gauge",
+                f"cache_entries {len(self.backend)}",
+                "# HELP cache_evictions_total LRU evictions.",
+                "# TYPE cache_evictions_total counter",
+                f"cache_evictions_total {self.backend.evictions}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 읽기 캐시
+cache = Cache(
+    InMemoryCache(
+        max_entries=settings.cache_max_entries,
+        default_ttl=settings.cache_ttl_seconds,
+    ),
+    enabled=settings.cache_enabled,
+)
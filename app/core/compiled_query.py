@@ -0,0 +1,90 @@
+"""컴파일된 SQL 캐시 (반복 호출 시 QuerySet/pypika 쿼리 생성 생략)
+
+Tortoise 는 쿼리를 실행할 때마다 QuerySet 을 복제하며 조건을 해석하고, pypika 쿼리
+트리를 만든 뒤 SQL 문자열을 생성한다. 같은 형태(shape)의 쿼리는 SQL 이 같고 값만
+다르므로, 처음 한 번만 Param 자리표시자로 QuerySet 을 만들어 (SQL, 값 목록)을 얻고
+이후 호출은 값만 바인딩해 커넥션에서 바로 실행한다. 결과 행은 Tortoise executor 와
+같이 Model._init_from_db 로 모델 인스턴스를 만든다.
+
+- SQL 은 커넥션의 dialect 별로 한 번 컴파일한다 (복제본 라우팅은 실행 시 _choose_db)
+- asyncpg 는 커넥션별 prepared statement 캐시(SQL 문자열 키, DB_STATEMENT_CACHE_SIZE)를
+  쓰므로 SQL 문자열이 항상 같으면 서버 측 prepared statement 를 재사용한다
+- Param 값은 필드 변환(to_db_value)을 거치지 않으므로 드라이버가 받는 형태(int 등)로 넘긴다
+- prefetch_related / select_related 는 지원하지 않는다 (관계는 따로 컴파일해 붙인다)
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from pypika_tortoise.terms import ValueWrapper
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+
+class Param(ValueWrapper):
+    """컴파일 시 자리표시자가 되는 값 (실행 시 같은 이름의 인자로 바인딩)
+
+    Tortoise 는 필터 값이 pypika Term 이면 변환 없이 그대로 쓰고, 파라미터화할 때
+    값 목록에 이 객체를 넣으므로 목록에서 위치를 찾을 수 있다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(self)
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+
+def param_limit[MODEL: Model](queryset: QuerySet[MODEL], name: str) -> QuerySet[MODEL]:
+    """LIMIT 을 Param 으로 (QuerySet.limit 은 int 만 받으므로 복제본에 직접 지정)"""
+    queryset = queryset._clone()
+    queryset._limit = Param(name)
+    return queryset
+
+
+class CompiledQuery[MODEL: Model]:
+    """build() 가 만드는 QuerySet 의 SQL 을 한 번만 생성해 재사용
+
+    예: CompiledQuery(User, lambda: User.filter(id=Param("user_id")).limit(1))
+        await query.first(user_id=1)
+    """
+
+    def __init__(self, model: type[MODEL], build: Callable[[], QuerySet[MODEL]]):
+        self.model = model
+        self._build = build
+        # dialect → (SQL, 값 목록: 상수 또는 Param)
+        self._compiled: dict[str, tuple[str, list[Any]]] = {}
+
+    def compile(self, conn: BaseDBAsyncClient) -> tuple[str, list[Any]]:
+        dialect = conn.capabilities.dialect
+        compiled = self._compiled.get(dialect)
+        if compiled is None:
+            queryset = self._build().using_db(conn)
+            queryset._make_query()
+            compiled = queryset.query.get_parameterized_sql()
+            self._compiled[dialect] = compiled
+        return compiled
+
+    def bind(self, conn: BaseDBAsyncClient, **params: Any) -> tuple[str, list[Any]]:
+        """커넥션 dialect 의 SQL 과 Param 자리에 params 를 채운 값 목록"""
+        sql, values = self.compile(conn)
+        return sql, [
+            params[value.name] if isinstance(value, Param) else value
+            for value in values
+        ]
+
+    async def rows(self, **params: Any) -> list:
+        """바인딩한 SQL 을 실행해 원시 행(컬럼명 → 값 매핑) 목록 반환"""
+        conn = self.model._choose_db()
+        _, rows = await conn.execute_query(*self.bind(conn, **params))
+        return rows
+
+    async def all(self, **params: Any) -> list[MODEL]:
+        init = self.model._init_from_db
+        return [init(**row) for row in await self.rows(**params)]
+
+    async def first(self, **params: Any) -> MODEL | None:
+        rows = await self.rows(**params)
+        return self.model._init_from_db(**rows[0]) if rows else None
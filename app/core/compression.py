@@ -0,0 +1,232 @@
+"""응답 압축 코덱과 Accept-Encoding 협상
+
+gzip 은 표준 라이브러리, br/zstd 는 brotli/zstandard 패키지가 설치되어 있을 때만
+사용한다 (prod 의존성 그룹). q 값이 같으면 서버 선호 순서 zstd > br > gzip.
+
+강한 ETag 가 있는 응답(같은 본문이 반복되는 리소스)은 (본문 해시, 인코딩)별 압축
+결과를 CompressedBodyCache 에 보관해 자주 요청되는 응답을 매번 다시 압축하지 않는다.
+ETag 는 버전 집계로 만든 값일 수 있어 본문을 식별하지 못하므로 키로 쓰지 않는다.
+"""
+
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict, defaultdict
+
+from app.core.config import settings
+from app.core.metrics import escape_label
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+# 동적 응답 기준 압축 수준 (최고 수준은 CPU 대비 이득이 작음)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+class _ZlibStream:
+    def __init__(self):
+        # wbits 16+: gzip 헤더/트레일러
+        self._compressor = zlib.compressobj(
+            GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class Codec:
+    """Content-Encoding 하나 (전체 압축 + 청크 단위 스트리밍 압축)
+
+    compress 는 스레드 풀에서 동시에 호출될 수 있으므로 호출마다 새 압축기를 쓴다.
+    """
+
+    def __init__(self, name: str, compress, stream):
+        self.name = name
+        self.compress = compress
+        # 청크마다 flush 하는 스트리밍 압축기 (compress(chunk), finish())
+        self.stream = stream
+
+
+def _available_codecs() -> dict[str, Codec]:
+    codecs = {}
+    if zstandard is not None:
+        codecs["zstd"] = Codec(
+            "zstd",
+            lambda data: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+            _ZstdStream,
+        )
+    if brotli is not None:
+        codecs["br"] = Codec(
+            "br",
+            lambda data: brotli.compress(data, quality=BROTLI_QUALITY),
+            _BrotliStream,
+        )
+    codecs["gzip"] = Codec(
+        "gzip", lambda data: gzip.compress(data, GZIP_LEVEL, mtime=0), _ZlibStream
+    )
+    return codecs
+
+
+# 서버 선호 순서
+CODECS = _available_codecs()
+
+
+def negotiate(
+    accept_encoding: str | None, codecs: dict[str, Codec] = CODECS
+) -> Codec | None:
+    """Accept-Encoding 에서 q 값이 가장 높은 코덱 (없거나 모두 q=0 이면 None)"""
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name, codec in codecs.items():
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = codec, weight
+    return best
+
+
+def body_digest(body: bytes) -> bytes:
+    """압축 캐시 키로 쓰는 원본 본문 해시"""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class CompressedBodyCache:
+    """(본문 해시, 인코딩)별 압축 본문 LRU (전체 바이트 수로 메모리 상한) 와 압축 통계"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+        # 인코딩별 [응답 수, 원본 바이트, 압축 바이트] (캐시 hit 포함)
+        self._totals: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: bytes, encoding: str) -> bytes | None:
+        body = self._entries.get((digest, encoding))
+        if body is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end((digest, encoding))
+        return body
+
+    def set(self, digest: bytes, encoding: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        key = (digest, encoding)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def record(self, encoding: str, original_size: int, compressed_size: int) -> None:
+        totals = self._totals[encoding]
+        totals[0] += 1
+        totals[1] += original_size
+        totals[2] += compressed_size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP compression_responses_total Compressed responses.",
+            "# TYPE compression_responses_total counter",
+            "# HELP compression_input_bytes_total Response bytes before compression.",
+            "# TYPE compression_input_bytes_total counter",
+            "# HELP compression_output_bytes_total Response bytes after compression.",
+            "# TYPE compression_output_bytes_total counter",
+        ]
+        for encoding, (count, original, compressed) in sorted(self._totals.items()):
+            label = f'encoding="{escape_label(encoding)}"'
+            lines += [
+                f"compression_responses_total{{{label}}} {count}",
+                f"compression_input_bytes_total{{{label}}} {original}",
+                f"compression_output_bytes_total{{{label}}} {compressed}",
+            ]
+        lines += [
+            "# HELP compression_cache_hits_total Compressed bodies reused by body hash.",
+            "# TYPE compression_cache_hits_total counter",
+            f"compression_cache_hits_total {self.hits}",
+            "# HELP compression_cache_misses_total Cache lookups that had to compress.",
+            "# TYPE compression_cache_misses_total counter",
+            f"compression_cache_misses_total {self.misses}",
+            "# HELP compression_cache_bytes Compressed bytes held in the cache.",
+            "# TYPE compression_cache_bytes gauge",
+            f"compression_cache_bytes {self.size}",
+            "# HELP compression_cache_evictions_total LRU evictions.",
+            "# TYPE compression_cache_evictions_total counter",
+            f"compression_cache_evictions_total {self.evictions}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 압축 본문 캐시
+compression_cache = CompressedBodyCache(settings.compression_cache_max_bytes)
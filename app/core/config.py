@@ -1,6 +1,6 @@
 import os
-import socket
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -17,27 +17,78 @@ class Settings(BaseSettings):
     pg_password: str = "password"
     pg_host: str = "localhost"
     pg_port: int = 5432
-    database_url: str = "sqlite://db.sqlite3"
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Docker 환경에서는 'db', 로컬에서는 'localhost' 사용
-        if self._is_docker_environment():
-            self.pg_host = "db"
-        else:
-            self.pg_host = "localhost"
-
-        # DATABASE_URL 자동 생성
-        self.database_url = f"postgres://{self.pg_user}:{self.pg_password}@{self.pg_host}:{self.pg_port}/{self.pg_name}"
-
-    def _is_docker_environment(self) -> bool:
-        """Docker 환경인지 확인"""
-        try:
-            # Docker 환경에서는 'db' 호스트에 연결 가능
-            socket.gethostbyname("db")
-            return True
-        except socket.gaierror:
-            return False
+    # 비어 있으면 PG_* 설정으로 구성 (Docker 에서는 PG_HOST=db 를 명시)
+    database_url: str = ""
+    # 시작 시 모델로 테이블 생성 (배포환경은 aerich 마이그레이션을 신뢰하고 끔)
+    db_generate_schemas: bool = True
+
+    # 읽기 복제본 URL 목록 (비어 있으면 모든 쿼리를 primary 로)
+    database_replica_urls: list[str] = []
+    # 쓰기 후 이 시간(초) 동안 읽기를 primary 로 고정 (복제 지연 대비)
+    replica_sticky_seconds: float = 2.0
+
+    # 커넥션 풀 설정 (PostgreSQL/asyncpg, SQLite 에서는 무시)
+    # 워커 수 x db_pool_max_size 가 DB 의 max_connections 를 넘지 않게 설정
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    # PgBouncer transaction 모드 뒤에서는 0 (prepared statement 캐시 비활성화)
+    db_statement_cache_size: int = 100
+    # 이 시간(초) 동안 쓰이지 않은 커넥션은 닫음 (0 이면 유지)
+    db_max_inactive_connection_lifetime: float = 300.0
+    # 쿼리 기본 타임아웃 (초, None 이면 무제한)
+    db_command_timeout: float | None = 30.0
+
+    # 읽기 캐시 설정
+    cache_enabled: bool = True
+    cache_ttl_seconds: float = 30.0
+    cache_max_entries: int = 10000
+
+    # 응답 압축 (gzip, brotli/zstandard 설치 시 br/zstd)
+    compression_enabled: bool = True
+    # 이 크기(바이트) 미만 응답은 압축하지 않음
+    compression_min_size: int = 1024
+    # 이 크기(바이트) 이상은 스레드 풀에서 압축 (이벤트 루프 블로킹 방지)
+    compression_threadpool_min_size: int = 256 * 1024
+    # ETag 별 압축 본문 캐시 상한 (바이트, 0 이면 사용 안 함)
+    compression_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # 대량 적재 배치 크기 (COPY / 다중 행 INSERT 한 번에 보내는 행 수)
+    ingest_batch_size: int = 1000
+
+    # 백그라운드 작업 (대량 적재/backfill/내보내기)
+    # 프로세스당 동시 실행 작업 수 (0 이면 이 프로세스는 작업을 실행하지 않음)
+    job_workers: int = 2
+    # 프로세스당 대기 + 실행 중 작업 상한 (초과 시 503)
+    job_max_pending: int = 100
+    # 이 시간(초) 동안 갱신이 없는 running 작업은 중단된 것으로 보고 다시 실행
+    job_stale_seconds: float = 300.0
+    # 중단된 채 발견된 횟수가 이 값에 이르면 다시 실행하지 않고 failed 로 기록
+    job_max_attempts: int = 3
+    # 내보내기 작업 결과 파일 디렉터리
+    job_output_dir: str = "var/jobs"
+
+    # 부하 제어 (DB 커넥션 풀 앞에서 비싼 요청의 동시 실행 수 제한, 프로세스 단위)
+    admission_enabled: bool = True
+    # "METHOD 경로[?이름=값]" → 동시 실행 상한 (0 이면 제한 없음, 쿼리 조건 키가 우선)
+    # 제한 route 상한의 합이 db_pool_max_size 보다 작아야 다른 요청이 쓸 커넥션이 남음
+    admission_route_limits: dict[str, int] = {
+        "GET /api/v1/users/": 4,
+        # 관계 prefetch 로 요청당 쿼리가 3개라 기본 형태보다 낮게 제한
+        "GET /api/v1/users/?optimized=true": 2,
+        "GET /api/v1/users/stats/post-count": 4,
+    }
+    # route 별 대기열 길이 (가득 차면 바로 503)
+    admission_max_queue: int = 32
+    # 대기열에서 이 시간(초) 안에 차례가 오지 않으면 503
+    admission_queue_timeout: float = 1.0
+    # 503 응답의 Retry-After (초)
+    admission_retry_after: int = 1
+    # 클라이언트(IP)별 초당 요청 수 (0 이면 사용 안 함, 초과 시 429)
+    rate_limit_per_second: float = 0.0
+    # 순간적으로 허용하는 요청 수 (토큰 버킷 크기)
+    rate_limit_burst: int = 50
+    # 토큰 버킷을 유지하는 클라이언트 수 상한 (LRU)
+    rate_limit_max_clients: int = 10000
 
     # 보안 설정
     secret_key: str = "dev-secret-key"
@@ -46,6 +97,20 @@ class Settings(BaseSettings):
     # 로깅 설정
     log_level: str = "INFO"
 
+    # 워커 간 메트릭 합산 디렉터리 (gunicorn.conf.py 가 지정, 비어 있으면 프로세스 단위)
+    metrics_multiproc_dir: str = ""
+    # 워커가 자기 메트릭을 파일에 쓰는 주기 (초, 다른 워커 값의 최대 지연)
+    metrics_flush_seconds: float = 5.0
+
+    @model_validator(mode="after")
+    def _default_database_url(self) -> "Settings":
+        if not self.database_url:
+            self.database_url = (
+                f"postgres://{self.pg_user}:{self.pg_password}"
+                f"@{self.pg_host}:{self.pg_port}/{self.pg_name}"
+            )
+        return self
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,85 @@
+"""요청 단위 DataLoader
+
+같은 이벤트 루프 틱 안에서 호출된 load(key) 들을 모아 batch_load_fn 한 번으로
+처리하고, 결과는 로더 인스턴스(= 요청)가 살아있는 동안 키별로 캐시한다.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any
+
+
+class DataLoader[K: Hashable, V]:
+    def __init__(
+        self,
+        batch_load_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        default_factory: Callable[[], Any] | None = None,
+    ):
+        self.batch_load_fn = batch_load_fn
+        # batch_load_fn 결과에 없는 키의 값 (예: 게시글 없는 사용자 → [])
+        self.default_factory = default_factory
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        # 실행 중인 배치 태스크 (이벤트 루프는 약한 참조만 가지므로 완료까지 보관)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                # 현재 틱의 다른 load() 호출이 큐에 쌓인 뒤 한 번에 실행
+                loop.call_soon(self._dispatch)
+        # 같은 키의 호출자가 future 를 공유하므로 한 호출자의 취소가 전파되지 않게 함
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        return await asyncio.gather(*(self.load(key) for key in keys))
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 알고 있는 값을 캐시에 채움"""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.create_task(self._run_batch(keys))
+        self._tasks.add(task)
+        task.add_done_callback(lambda task: self._batch_done(task, keys))
+
+    def _batch_done(self, task: asyncio.Task, keys: list[K]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            # 배치 태스크가 (시작 전이라도) 취소됨: 대기자가 멈추지 않도록 오류로 깨움
+            self._fail(keys, RuntimeError("DataLoader batch was cancelled"))
+
+    async def _run_batch(self, keys: list[K]) -> None:
+        try:
+            results = await self.batch_load_fn(keys)
+        except Exception as exc:
+            self._fail(keys, exc)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            elif self.default_factory is not None:
+                future.set_result(self.default_factory())
+            else:
+                future.set_result(None)
+
+    def _fail(self, keys: list[K], exc: BaseException) -> None:
+        for key in keys:
+            # 실패한 키는 캐시하지 않음 (같은 요청 안에서 재시도 가능)
+            future = self._futures.pop(key, None)
+            if future is not None and not future.done():
+                future.set_exception(exc)
+                # 대기자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+                future.exception()
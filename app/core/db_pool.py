@@ -0,0 +1,157 @@
+"""커넥션 풀 계측
+
+asyncpg 풀을 얇은 프록시로 감싸서 acquire 대기 시간과 대기자 수를 기록한다.
+Tortoise 는 풀에 acquire()/release() 만 호출하므로 AsyncpgDBClient.create_pool
+하나만 감싸면 일반 쿼리와 트랜잭션 모두 집계된다. 풀 크기/유휴 커넥션 수는
+asyncpg 풀에서 스크레이프 시점에 읽는다.
+
+SQLite 는 풀 없이 단일 커넥션을 쓰므로 풀 메트릭이 없다.
+"""
+
+import time
+from typing import Any
+
+from app.core.metrics import Histogram, escape_label, histogram_lines
+from app.core.query_tracker import get_current_stats
+
+# acquire 대기 시간 버킷 (초)
+POOL_WAIT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    5.0,
+)
+
+
+class InstrumentedPool:
+    """acquire 대기를 집계하는 풀 프록시 (그 외 속성은 원래 풀에 위임)"""
+
+    def __init__(self, pool: Any):
+        self._pool = pool
+        self.waiters = 0
+        self.in_use = 0
+        self.acquire_wait = Histogram(POOL_WAIT_BUCKETS)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    async def acquire(self, *, timeout: float | None = None) -> Any:
+        self.waiters += 1
+        start = time.perf_counter()
+        try:
+            connection = await self._pool.acquire(timeout=timeout)
+        finally:
+            self.waiters -= 1
+            waited = time.perf_counter() - start
+            self.acquire_wait.observe(waited)
+            # 요청 단위 대기 시간 (X-DB-Pool-Wait 헤더)
+            stats = get_current_stats()
+            if stats is not None:
+                stats.pool_wait += waited
+        self.in_use += 1
+        return connection
+
+    async def release(self, connection: Any, *, timeout: float | None = None) -> None:
+        self.in_use -= 1
+        await self._pool.release(connection, timeout=timeout)
+
+    def snapshot(self) -> dict:
+        return {
+            "size": self._pool.get_size(),
+            "max_size": self._pool.get_max_size(),
+            "in_use": self.in_use,
+            "idle": self._pool.get_idle_size(),
+            "waiters": self.waiters,
+            "acquire_count": self.acquire_wait.count,
+            "acquire_wait_p95": self.acquire_wait.quantile(0.95),
+        }
+
+
+class PoolRegistry:
+    """커넥션 이름별 계측 풀"""
+
+    def __init__(self):
+        self._pools: dict[str, InstrumentedPool] = {}
+
+    def register(self, name: str, pool: Any) -> InstrumentedPool:
+        instrumented = InstrumentedPool(pool)
+        self._pools[name] = instrumented
+        return instrumented
+
+    def unregister(self, name: str) -> None:
+        self._pools.pop(name, None)
+
+    def clear(self) -> None:
+        self._pools.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        return {name: pool.snapshot() for name, pool in sorted(self._pools.items())}
+
+    def render_prometheus(self) -> str:
+        if not self._pools:
+            return ""
+
+        gauges = (
+            ("db_pool_size", "Open connections in the pool.", "size"),
+            ("db_pool_max_size", "Configured maximum pool size.", "max_size"),
+            ("db_pool_in_use", "Connections checked out of the pool.", "in_use"),
+            ("db_pool_idle", "Idle connections in the pool.", "idle"),
+            ("db_pool_waiters", "Tasks waiting to acquire a connection.", "waiters"),
+        )
+        snapshot = self.snapshot()
+        lines = []
+        for metric, help_text, key in gauges:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            for name, values in snapshot.items():
+                lines.append(
+                    f'{metric}{{connection="{escape_label(name)}"}} {values[key]}'
+                )
+
+        lines += [
+            "# HELP db_pool_acquire_wait_seconds Time spent waiting for a connection.",
+            "# TYPE db_pool_acquire_wait_seconds histogram",
+        ]
+        for name, pool in sorted(self._pools.items()):
+            lines += histogram_lines(
+                "db_pool_acquire_wait_seconds",
+                f'connection="{escape_label(name)}"',
+                pool.acquire_wait,
+            )
+        return "\n".join(lines) + "\n"
+
+
+def install_pool_instrumentation() -> None:
+    """AsyncpgDBClient 가 만드는 풀을 계측 풀로 감쌈 (중복 호출 안전)"""
+    try:
+        from tortoise.backends.asyncpg.client import AsyncpgDBClient
+    except ImportError:
+        return
+
+    create_pool = AsyncpgDBClient.create_pool
+    if getattr(create_pool, "__pool_instrumented__", False):
+        return
+
+    async def instrumented_create_pool(self, **kwargs):
+        pool = await create_pool(self, **kwargs)
+        return pool_registry.register(self.connection_name, pool)
+
+    async def instrumented_close(self):
+        await close(self)
+        pool_registry.unregister(self.connection_name)
+
+    close = AsyncpgDBClient._close
+    instrumented_create_pool.__pool_instrumented__ = True
+    AsyncpgDBClient.create_pool = instrumented_create_pool
+    AsyncpgDBClient._close = instrumented_close
+
+
+# 프로세스 전역 풀 메트릭
+pool_registry = PoolRegistry()
@@ -0,0 +1,94 @@
+"""읽기 복제본 라우팅
+
+Settings.database_replica_urls 가 설정되면 TORTOISE_ORM 에 replica1, replica2 ...
+커넥션과 ReplicaRouter 가 등록된다. 읽기는 복제본에 라운드 로빈으로, 쓰기는
+default(primary) 로 보낸다.
+
+복제 지연 때문에 방금 쓴 데이터가 복제본에 없을 수 있으므로, 쓰기 후
+replica_sticky_seconds 동안은 같은 요청(contextvar)의 읽기를 primary 로 보낸다.
+요청 사이의 read-your-writes 는 ReadYourWritesMiddleware 가 쿠키로 이어 준다.
+"""
+
+import itertools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+PRIMARY_CONNECTION = "default"
+REPLICA_CONNECTION_PREFIX = "replica"
+
+
+@dataclass
+class RoutingState:
+    """요청 단위 라우팅 상태 (하위 태스크와 공유되도록 변경 가능한 객체로 보관)"""
+
+    # 이 시각(time.time)까지 읽기를 primary 로 보냄
+    primary_until: float = 0.0
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar(
+    "db_routing_state", default=None
+)
+
+
+def get_routing_state() -> RoutingState:
+    """현재 컨텍스트의 라우팅 상태 (없으면 생성)"""
+    state = _routing_state.get()
+    if state is None:
+        state = RoutingState()
+        _routing_state.set(state)
+    return state
+
+
+@contextmanager
+def routing_scope(primary_until: float = 0.0) -> Iterator[RoutingState]:
+    """블록 안에서 새 라우팅 상태 사용 (요청 단위)"""
+    state = RoutingState(primary_until)
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+def mark_write(sticky_seconds: float | None = None) -> None:
+    """쓰기 발생 기록: sticky_seconds 동안 읽기를 primary 로 고정
+
+    ORM 을 거치지 않는 raw SQL 쓰기(connections.get("default"))에서도 호출한다.
+    """
+    if sticky_seconds is None:
+        sticky_seconds = settings.replica_sticky_seconds
+    state = get_routing_state()
+    state.primary_until = max(state.primary_until, time.time() + sticky_seconds)
+
+
+def replica_connection_names(count: int) -> list[str]:
+    return [f"{REPLICA_CONNECTION_PREFIX}{i}" for i in range(1, count + 1)]
+
+
+class ReplicaRouter:
+    """Tortoise 라우터: 읽기는 복제본, 쓰기는 primary"""
+
+    def __init__(
+        self,
+        replicas: list[str] | None = None,
+        sticky_seconds: float | None = None,
+    ):
+        if replicas is None:
+            replicas = replica_connection_names(len(settings.database_replica_urls))
+        self.replicas = tuple(replicas)
+        self.sticky_seconds = sticky_seconds
+        self._next_replica = itertools.cycle(self.replicas)
+
+    def db_for_read(self, model) -> str:
+        if not self.replicas or time.time() < get_routing_state().primary_until:
+            return PRIMARY_CONNECTION
+        return next(self._next_replica)
+
+    def db_for_write(self, model) -> str:
+        mark_write(self.sticky_seconds)
+        return PRIMARY_CONNECTION
@@ -1 +1,7 @@
 # 공통 의존성 주입
+from app.repositories.loaders import UserLoaders
+
+
+def get_loaders() -> UserLoaders:
+    """요청마다 새 로더 (배치/캐시 범위 = 요청 하나)"""
+    return UserLoaders()
@@ -0,0 +1,44 @@
+"""ETag / 조건부 GET
+
+본문 대신 데이터 버전(updated_at, count/max 집계 등)으로 강한 ETag 를 계산하고,
+If-None-Match 가 일치하면 본문을 만들거나 직렬화하지 않고 304 를 반환한다.
+같은 데이터라도 경로/쿼리 파라미터에 따라 표현이 달라지므로 둘 다 ETag 에 포함한다.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def compute_etag(*parts: Any) -> str:
+    """parts 의 repr 해시로 만든 강한 ETag (따옴표 포함)"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def request_etag(request: Request, *version: Any) -> str:
+    """요청 경로/쿼리와 데이터 버전으로 만든 ETag"""
+    query = sorted(request.query_params.multi_items())
+    return compute_etag(request.url.path, query, *version)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 값이 etag 와 일치하는지 (약한 비교, RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """If-None-Match 가 etag 와 일치하면 304 응답, 아니면 None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
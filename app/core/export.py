@@ -0,0 +1,42 @@
+"""배치 단위 행 스트림을 NDJSON / JSON 배열 바이트 청크로 인코딩"""
+
+import json
+from collections.abc import AsyncIterator
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _dumps(row: dict) -> str:
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+async def ndjson_chunks(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """한 줄에 한 행 (배치 하나가 청크 하나)"""
+    async for batch in batches:
+        yield "".join(_dumps(row) + "\n" for row in batch).encode()
+
+
+async def json_array_chunks(
+    batches: AsyncIterator[list[dict]],
+) -> AsyncIterator[bytes]:
+    """전체를 하나의 JSON 배열로 (배열을 메모리에 만들지 않고 순차 출력)"""
+    yield b"["
+    first = True
+    async for batch in batches:
+        chunk = ",".join(_dumps(row) for row in batch)
+        if not first:
+            chunk = "," + chunk
+        first = False
+        yield chunk.encode()
+    yield b"]"
+
+
+def encode_export(
+    batches: AsyncIterator[list[dict]], export_format: str
+) -> AsyncIterator[bytes]:
+    if export_format == "ndjson":
+        return ndjson_chunks(batches)
+    return json_array_chunks(batches)
@@ -0,0 +1,244 @@
+"""백그라운드 작업 실행기 (프로세스 내 asyncio 워커 풀)
+
+요청 핸들러는 Job 행을 만들고 바로 202 를 반환한다. 워커는 큐에서 작업 id 를 꺼내
+queued → running 을 조건부 UPDATE 로 선점한 뒤 JOB_HANDLERS 에 등록된 핸들러를 실행한다.
+
+- 작업은 jobs 테이블에 있으므로 재시작해도 남는다. 시작할 때와 주기적으로
+  queued 작업, job_stale_seconds 동안 갱신이 없는 running 작업(프로세스가 죽어 중단된
+  작업)을 다시 큐에 넣는다. 실행 중인 작업은 주기적으로 updated_at 을 갱신한다
+- 실행할 때마다 attempts 를 늘린다. 중단된 running 작업이 max_attempts 번 실행된
+  뒤라면 (예: 매번 프로세스를 죽이는 작업) 다시 넣지 않고 failed 로 기록한다
+- 선점이 조건부 UPDATE 이므로 여러 프로세스(gunicorn 워커)가 같은 작업을 큐에 넣어도
+  한 번만 실행된다
+- 중단된 작업은 처음부터 다시 실행되므로 핸들러는 재실행해도 안전해야 한다
+- 대기 + 실행 중 작업 수는 max_pending 으로 제한한다 (초과 시 JobQueueFull)
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from tortoise import connections, timezone
+from tortoise.expressions import F
+
+from app.core.config import settings
+from app.core.db_router import PRIMARY_CONNECTION
+from app.models import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job, "JobContext"], Awaitable[dict[str, Any] | None]]
+
+# 작업 종류별 핸들러 (job_handler 데코레이터로 등록)
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """kind 작업을 실행할 핸들러 등록 (반환값 dict 가 Job.result 로 저장됨)"""
+
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 max_pending 에 도달"""
+
+
+class JobContext:
+    """핸들러에 전달되는 실행 컨텍스트 (진행률 기록)"""
+
+    def __init__(self, job: Job):
+        self.job = job
+
+    async def set_progress(self, progress: int, total: int | None = None) -> None:
+        self.job.progress = progress
+        if total is not None:
+            self.job.total = total
+        await Job.filter(id=self.job.id).update(
+            progress=self.job.progress, total=self.job.total, updated_at=timezone.now()
+        )
+
+
+class JobRunner:
+    """bounded 워커 풀 (workers 개 태스크가 큐의 작업을 순서대로 실행)"""
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        stale_seconds: float,
+        max_attempts: int = 3,
+        handlers: dict[str, JobHandler] = JOB_HANDLERS,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.stale_seconds = stale_seconds
+        self.max_attempts = max_attempts
+        self.handlers = handlers
+        self._queue: asyncio.Queue[int] = asyncio.Queue()
+        # 큐에 있거나 실행 중인 작업 (같은 작업을 두 번 넣지 않음)
+        self._scheduled: set[int] = set()
+        self._running: set[int] = set()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    @property
+    def pending(self) -> int:
+        return len(self._scheduled)
+
+    async def submit(self, kind: str, payload: dict[str, Any]) -> Job:
+        """작업 생성 후 큐에 추가 (워커가 없으면 DB 에만 남아 다른 프로세스가 실행)"""
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if self.pending >= self.max_pending:
+            raise JobQueueFull(f"{self.pending} jobs pending")
+
+        job = await Job.create(kind=kind, payload=payload)
+        self._enqueue(job.id)
+        return job
+
+    async def start(self) -> None:
+        """중단/대기 작업을 복구하고 워커와 주기 점검 태스크 시작"""
+        if self.started or self.workers <= 0:
+            return
+        for job_id in await self.recover():
+            self._enqueue(job_id)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._monitor(), name="job-monitor"))
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중이던 작업은 queued 로 되돌려 다음 시작 때 다시 실행)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._scheduled.clear()
+        self._queue = asyncio.Queue()
+
+    async def join(self) -> None:
+        """큐에 있는 작업이 모두 끝날 때까지 대기"""
+        await self._queue.join()
+
+    async def recover(self) -> list[int]:
+        """오래 갱신되지 않은 running 작업을 queued 로 되돌리고 queued 작업 id 반환
+
+        이미 max_attempts 번 실행된 작업은 되돌리지 않고 failed 로 기록한다.
+        """
+        now = timezone.now()
+        stale = Job.filter(
+            status=JobStatus.RUNNING,
+            updated_at__lt=now - timedelta(seconds=self.stale_seconds),
+        )
+        failed = await stale.filter(attempts__gte=self.max_attempts).update(
+            status=JobStatus.FAILED,
+            finished_at=now,
+            updated_at=now,
+            error=f"Interrupted {self.max_attempts} times",
+        )
+        if failed:
+            logger.error(
+                "Marked %d jobs failed after %d attempts", failed, self.max_attempts
+            )
+        requeued = await stale.update(status=JobStatus.QUEUED, updated_at=now)
+        if requeued:
+            logger.warning("Requeued %d interrupted jobs", requeued)
+        return (
+            await Job.filter(status=JobStatus.QUEUED)
+            .using_db(connections.get(PRIMARY_CONNECTION))
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    async def run_job(self, job_id: int) -> bool:
+        """작업 하나를 선점해 실행 (다른 워커가 이미 선점했으면 False)"""
+        now = timezone.now()
+        claimed = await Job.filter(id=job_id, status=JobStatus.QUEUED).update(
+            status=JobStatus.RUNNING,
+            started_at=now,
+            updated_at=now,
+            attempts=F("attempts") + 1,
+        )
+        if not claimed:
+            return False
+
+        # 방금 쓴 행이므로 복제본이 아닌 primary 에서 읽음
+        job = await Job.get(id=job_id).using_db(connections.get(PRIMARY_CONNECTION))
+        self._running.add(job_id)
+        try:
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                raise LookupError(f"Unknown job kind: {job.kind}")
+            result = await handler(job, JobContext(job))
+        except asyncio.CancelledError:
+            # 종료 중 취소: 다음 시작 때 처음부터 다시 실행
+            await Job.filter(id=job_id).update(
+                status=JobStatus.QUEUED, updated_at=timezone.now()
+            )
+            raise
+        except Exception as exc:
+            logger.exception("Job %d (%s) failed", job_id, job.kind)
+            await self._finish(
+                job_id, JobStatus.FAILED, error=f"{type(exc).__name__}: {exc}"
+            )
+        else:
+            await self._finish(job_id, JobStatus.SUCCEEDED, result=result)
+        finally:
+            self._running.discard(job_id)
+        return True
+
+    async def _finish(self, job_id: int, status: JobStatus, **fields: Any) -> None:
+        now = timezone.now()
+        await Job.filter(id=job_id).update(
+            status=status, finished_at=now, updated_at=now, **fields
+        )
+
+    def _enqueue(self, job_id: int) -> None:
+        if job_id in self._scheduled:
+            return
+        self._scheduled.add(job_id)
+        self._queue.put_nowait(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self.run_job(job_id)
+            except Exception:
+                logger.exception("Job %d could not be run", job_id)
+            finally:
+                self._scheduled.discard(job_id)
+                self._queue.task_done()
+
+    async def _monitor(self) -> None:
+        """실행 중 작업의 updated_at 갱신 + 다른 프로세스가 남긴 작업 복구"""
+        while True:
+            await asyncio.sleep(self.stale_seconds / 3)
+            try:
+                if self._running:
+                    await Job.filter(id__in=list(self._running)).update(
+                        updated_at=timezone.now()
+                    )
+                for job_id in await self.recover():
+                    self._enqueue(job_id)
+            except Exception:
+                logger.exception("Job monitor failed")
+
+
+# 프로세스 전역 작업 실행기 (lifespan 에서 시작/종료)
+job_runner = JobRunner(
+    workers=settings.job_workers,
+    max_pending=settings.job_max_pending,
+    stale_seconds=settings.job_stale_seconds,
+    max_attempts=settings.job_max_attempts,
+)
@@ -0,0 +1,233 @@
+"""고정 메모리 요청 메트릭 집계
+
+요청마다 행을 쌓는 대신 (method, route 템플릿) 별로 카운터와 고정 버킷
+히스토그램만 유지한다. 시계열 수는 max_series 로 제한되며, 초과분은
+overflow 시계열 하나로 합쳐진다.
+"""
+
+from bisect import bisect_left
+
+# 지연시간 버킷 (초)
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# 요청당 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+UNMATCHED_ROUTE = "<unmatched>"
+OVERFLOW_ROUTE = "<overflow>"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (메모리 사용량은 버킷 수에 비례)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """버킷 내 선형 보간으로 분위수 추정 (histogram_quantile 과 동일한 방식)"""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if i == len(self.bounds):
+                    # +Inf 버킷에 걸리면 마지막 유한 경계를 반환
+                    return float(self.bounds[-1])
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return float(self.bounds[-1])
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Prometheus 형식의 (le, 누적 개수) 목록"""
+        result = []
+        total = 0
+        for bound, bucket_count in zip(self.bounds, self.counts, strict=False):
+            total += bucket_count
+            result.append((_format_number(bound), total))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class RouteMetrics:
+    """하나의 (method, route) 시계열"""
+
+    __slots__ = ("status_counts", "latency", "queries", "db_time")
+
+    def __init__(self):
+        self.status_counts: dict[str, int] = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_time = 0.0
+
+    def observe(
+        self, status: int, duration: float, query_count: int, db_time: float
+    ) -> None:
+        status_class = f"{status // 100}xx"
+        self.status_counts[status_class] = self.status_counts.get(status_class, 0) + 1
+        self.latency.observe(duration)
+        self.queries.observe(query_count)
+        self.db_time += db_time
+
+
+class MetricsRegistry:
+    """(method, route 템플릿) 별 메트릭 저장소"""
+
+    def __init__(self, max_series: int = 200):
+        self.max_series = max_series
+        self._series: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str | None,
+        status: int,
+        duration: float,
+        query_count: int = 0,
+        db_time: float = 0.0,
+    ) -> None:
+        key = (method, route or UNMATCHED_ROUTE)
+        series = self._series.get(key)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                key = ("OTHER", OVERFLOW_ROUTE)
+                series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = RouteMetrics()
+        series.observe(status, duration, query_count, db_time)
+
+    def snapshot(self) -> list[dict]:
+        """시계열별 요약 통계"""
+        result = []
+        for (method, route), series in sorted(self._series.items()):
+            latency = series.latency
+            queries = series.queries
+            result.append(
+                {
+                    "method": method,
+                    "route": route,
+                    "count": latency.count,
+                    "status": dict(series.status_counts),
+                    "latency_avg": latency.sum / latency.count,
+                    "latency_p50": latency.quantile(0.5),
+                    "latency_p95": latency.quantile(0.95),
+                    "latency_p99": latency.quantile(0.99),
+                    "queries_avg": queries.sum / queries.count,
+                    "queries_p95": queries.quantile(0.95),
+                    "db_time_total": series.db_time,
+                }
+            )
+        return result
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = [
+            "# HELP http_requests_total Total HTTP requests by status class.",
+            "# TYPE http_requests_total counter",
+        ]
+        for labels, series in self._labelled_series():
+            for status_class, count in sorted(series.status_counts.items()):
+                lines.append(
+                    f'http_requests_total{{{labels},status="{status_class}"}} {count}'
+                )
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for labels, series in self._labelled_series():
+            lines += histogram_lines(
+                "http_request_duration_seconds", labels, series.latency
+            )
+
+        lines += [
+            "# HELP http_request_duration_quantile_seconds Estimated latency quantiles.",
+            "# TYPE http_request_duration_quantile_seconds gauge",
+        ]
+        for labels, series in self._labelled_series():
+            for q in QUANTILES:
+                lines.append(
+                    f"http_request_duration_quantile_seconds"
+                    f'{{{labels},quantile="{q}"}} '
+                    f"{_format_number(series.latency.quantile(q))}"
+                )
+
+        lines += [
+            "# HELP http_request_queries SQL queries executed per request.",
+            "# TYPE http_request_queries histogram",
+        ]
+        for labels, series in self._labelled_series():
+            lines += histogram_lines("http_request_queries", labels, series.queries)
+
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL queries.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for labels, series in self._labelled_series():
+            lines.append(
+                f"http_request_db_seconds_total{{{labels}}} "
+                f"{_format_number(series.db_time)}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _labelled_series(self):
+        for (method, route), series in sorted(self._series.items()):
+            yield (
+                f'method="{escape_label(method)}",route="{escape_label(route)}"',
+                series,
+            )
+
+
+def histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    lines = [
+        f'{name}_bucket{{{labels},le="{le}"}} {count}'
+        for le, count in histogram.cumulative()
+    ]
+    lines.append(f"{name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# 프로세스 전역 메트릭 저장소
+metrics_registry = MetricsRegistry()
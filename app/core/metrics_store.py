@@ -0,0 +1,222 @@
+"""gunicorn 워커 간 메트릭 합산 (파일 기반 multiprocess 저장소)
+
+메트릭은 워커 프로세스마다 따로 집계되고 스크레이프는 워커 하나에만 도달한다.
+워커마다 자기 exposition 텍스트를 metrics_multiproc_dir 의 파일에 주기적으로 쓰고,
+/metrics 는 디렉터리의 파일을 모두 합쳐 반환한다 (어느 워커가 받아도 전체 값).
+
+- counter/histogram 은 합산한다. 종료된 워커의 값은 마스터(gunicorn child_exit)가
+  archive.prom 에 누적하므로 워커 교체(max_requests)로 값이 줄어들지 않는다
+- gauge 는 살아 있는 워커의 값만 합산하고, quantile 라벨이 있는 추정치는 워커 중
+  최댓값을 쓴다 (prometheus_client multiprocess 모드의 livesum/max 와 같은 규칙)
+- 다른 워커의 값은 최대 flush_seconds 만큼 늦을 수 있다
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE = "archive.prom"
+# archive 에 합친 워커 파일 이름을 기록하는 주석 (읽는 쪽이 중복 합산하지 않게)
+ARCHIVED_PREFIX = "# archived "
+# 기록해 두는 최근 archive 워커 수 (삭제 직전 파일을 읽은 요청만 걸러내면 충분)
+MAX_ARCHIVED_NAMES = 64
+
+
+class _Family:
+    __slots__ = ("help", "type", "samples")
+
+    def __init__(self, help_text: str, metric_type: str):
+        self.help = help_text
+        self.type = metric_type
+        # "이름{라벨}" → 값 (출력 순서 유지)
+        self.samples: dict[str, int | float] = {}
+
+
+def parse_exposition(text: str) -> dict[str, _Family]:
+    """이 앱이 만드는 exposition 텍스트를 metric 별로 파싱 (HELP 다음 TYPE, 그다음 샘플)"""
+    families: dict[str, _Family] = {}
+    help_texts: dict[str, str] = {}
+    current: _Family | None = None
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name, _, help_text = line[7:].partition(" ")
+            help_texts[name] = help_text
+        elif line.startswith("# TYPE "):
+            name, _, metric_type = line[7:].partition(" ")
+            current = families.setdefault(
+                name, _Family(help_texts.get(name, ""), metric_type)
+            )
+        elif line and not line.startswith("#") and current is not None:
+            # 라벨 값에 공백이 있을 수 있으므로 마지막 공백으로 값을 나눔
+            series, _, value = line.rpartition(" ")
+            current.samples[series] = _parse_number(value)
+    return families
+
+
+def merge_expositions(texts: list[str], archived: str = "") -> str:
+    """살아 있는 워커들의 텍스트와 archive 를 합친 exposition 텍스트"""
+    families: dict[str, _Family] = {}
+    for text in texts:
+        _merge_into(families, text, live=True)
+    _merge_into(families, archived, live=False)
+    return _render(families)
+
+
+def _merge_into(families: dict[str, _Family], text: str, live: bool) -> None:
+    for name, family in parse_exposition(text).items():
+        if family.type == "gauge" and not live:
+            continue
+        merged = families.setdefault(name, _Family(family.help, family.type))
+        for series, value in family.samples.items():
+            current = merged.samples.get(series)
+            if current is None:
+                merged.samples[series] = value
+            elif family.type == "gauge" and 'quantile="' in series:
+                merged.samples[series] = max(current, value)
+            else:
+                merged.samples[series] = current + value
+
+
+def _render(families: dict[str, _Family]) -> str:
+    lines = []
+    for name, family in families.items():
+        lines += [f"# HELP {name} {family.help}", f"# TYPE {name} {family.type}"]
+        lines += [
+            f"{series} {_format_number(value)}"
+            for series, value in family.samples.items()
+        ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _parse_number(value: str) -> int | float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _format_number(value: int | float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsStore:
+    """워커별 메트릭 파일 쓰기/합산 (directory 가 없으면 자기 프로세스 값만 반환)"""
+
+    def __init__(self, directory: str | None, flush_seconds: float = 5.0):
+        self.directory = Path(directory) if directory else None
+        self.flush_seconds = flush_seconds
+        self._render: Callable[[], str] | None = None
+        self._task: asyncio.Task | None = None
+        # (pid, 파일 이름): fork 후 첫 쓰기에서 정함 (pid 재사용 시에도 이름이 겹치지 않음)
+        self._file: tuple[int, str] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    async def start(self, render: Callable[[], str]) -> None:
+        """주기적으로 render() 결과를 이 워커의 파일에 씀"""
+        if not self.enabled or self._task is not None:
+            return
+        self._render = render
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._task = asyncio.create_task(self._flush_loop(), name="metrics-flush")
+
+    async def stop(self) -> None:
+        """flush 중지 후 마지막 값을 씀 (마스터가 종료된 워커의 값을 archive 에 누적)"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.to_thread(self.write, self._render())
+
+    async def collect(self, own: str) -> str:
+        """이 워커의 최신 값을 쓴 뒤 모든 워커의 값을 합친 텍스트"""
+        if not self.enabled:
+            return own
+        return await asyncio.to_thread(self._write_and_merge, own)
+
+    def write(self, text: str) -> None:
+        """이 워커의 파일을 원자적으로 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)"""
+        path = self.directory / self._file_name()
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+
+    def archive(self, pid: int) -> None:
+        """종료된 워커의 counter/histogram 을 archive 에 누적하고 파일 삭제 (마스터 전용)"""
+        if not self.enabled:
+            return
+        paths = list(self.directory.glob(f"{pid}-*.prom"))
+        if not paths:
+            return
+        archived, names = self._read_archive()
+        families: dict[str, _Family] = {}
+        for text in [archived, *(path.read_text() for path in paths)]:
+            _merge_into(families, text, live=False)  # gauge 는 버림
+        names = (names + [path.name for path in paths])[-MAX_ARCHIVED_NAMES:]
+        tmp = self.directory / (ARCHIVE_FILE + ".tmp")
+        tmp.write_text(ARCHIVED_PREFIX + " ".join(names) + "\n" + _render(families))
+        os.replace(tmp, self.directory / ARCHIVE_FILE)
+        # archive 를 먼저 교체하므로 그 사이에 읽은 요청은 archive 의 이름 목록으로 거름
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """이전 실행이 남긴 파일 삭제 (마스터 시작 시)"""
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path in self.directory.iterdir():
+            if path.suffix in (".prom", ".tmp"):
+                path.unlink(missing_ok=True)
+
+    def _write_and_merge(self, own: str) -> str:
+        self.write(own)
+        texts: dict[str, str] = {}
+        for path in self.directory.glob("*-*.prom"):
+            try:
+                texts[path.name] = path.read_text()
+            except FileNotFoundError:
+                continue  # 방금 archive 됨 (아래에서 archive 로 읽음)
+        # 워커 파일을 먼저 읽고 archive 를 나중에 읽어야 종료 직후 워커가 빠지지 않음
+        archived, names = self._read_archive()
+        for name in names:
+            texts.pop(name, None)
+        return merge_expositions(list(texts.values()), archived)
+
+    def _read_archive(self) -> tuple[str, list[str]]:
+        try:
+            text = (self.directory / ARCHIVE_FILE).read_text()
+        except FileNotFoundError:
+            return "", []
+        header, _, body = text.partition("\n")
+        return body, header.removeprefix(ARCHIVED_PREFIX).split()
+
+    def _file_name(self) -> str:
+        pid = os.getpid()
+        if self._file is None or self._file[0] != pid:
+            self._file = (pid, f"{pid}-{time.time_ns()}.prom")
+        return self._file[1]
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.write, self._render())
+            except Exception:
+                logger.exception("Metrics flush failed")
+            await asyncio.sleep(self.flush_seconds)
+
+
+# 프로세스 전역 메트릭 저장소 (lifespan 에서 flush 시작/종료)
+metrics_store = MetricsStore(
+    settings.metrics_multiproc_dir or None, settings.metrics_flush_seconds
+)
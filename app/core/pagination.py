@@ -0,0 +1,32 @@
+"""키셋(커서) 페이지네이션 유틸리티
+
+커서는 마지막 행의 id 를 담은 불투명(opaque) 문자열이다. 클라이언트는 값을
+해석하지 않고 이전 응답의 next_cursor 를 그대로 돌려보낸다.
+"""
+
+import base64
+import binascii
+import json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(last_id: int) -> str:
+    """마지막 id 를 URL-safe 커서 문자열로 인코딩"""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """커서 문자열에서 마지막 id 를 복원 (형식 오류 시 ValueError)"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = payload["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
@@ -0,0 +1,52 @@
+"""fields= 컬럼 선택 파싱
+
+"id,name,posts.title,profile.bio" 처럼 쉼표로 구분한 필드 목록을 본 모델 컬럼과
+관계별 컬럼으로 나눈다. 허용 목록에 없는 필드는 ValueError.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Projection:
+    """선택한 컬럼 (relations: 관계 이름 → 관계 모델 컬럼)"""
+
+    columns: tuple[str, ...]
+    relations: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    def drop_unselected_id(self, rows: list[dict]) -> None:
+        """조회용으로 함께 읽은 id 를 제거 (id 를 선택하지 않은 경우)"""
+        if "id" not in self.columns:
+            for row in rows:
+                del row["id"]
+
+
+def parse_fields(
+    spec: str,
+    columns: tuple[str, ...],
+    relations: Mapping[str, tuple[str, ...]],
+) -> Projection:
+    """fields 문자열을 Projection 으로 (순서 유지, 중복 제거)"""
+    selected: dict[str, None] = {}
+    selected_relations: dict[str, dict[str, None]] = {}
+
+    for name in (part.strip() for part in spec.split(",")):
+        if not name:
+            continue
+        relation, _, column = name.rpartition(".")
+        if not relation:
+            if column not in columns:
+                raise ValueError(f"Unknown field: {name}")
+            selected[column] = None
+            continue
+        if column not in relations.get(relation, ()):
+            raise ValueError(f"Unknown field: {name}")
+        selected_relations.setdefault(relation, {})[column] = None
+
+    if not selected and not selected_relations:
+        raise ValueError("No fields selected")
+    return Projection(
+        columns=tuple(selected),
+        relations={name: tuple(cols) for name, cols in selected_relations.items()},
+    )
@@ -0,0 +1,156 @@
+"""요청 단위 SQL 쿼리 추적
+
+Tortoise ORM 커넥션 클래스의 execute_* 메서드를 감싸서, 현재 요청의
+contextvar 에 등록된 QueryStats 에 쿼리 수/DB 시간/가장 느린 쿼리/
+반복된 SQL 형태(fingerprint)를 기록한다.
+"""
+
+import importlib
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+# 계측 대상 메서드
+_EXECUTE_METHODS = (
+    "execute_insert",
+    "execute_many",
+    "execute_query",
+    "execute_query_dict",
+    "execute_script",
+)
+
+# 계측 대상 백엔드 (설치되지 않은 드라이버는 건너뜀)
+_BACKEND_MODULES = (
+    "tortoise.backends.sqlite",
+    "tortoise.backends.asyncpg",
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """한 요청 동안 실행된 쿼리 통계"""
+
+    count: int = 0
+    total_time: float = 0.0
+    slowest_sql: str | None = None
+    slowest_time: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+    # 커넥션 풀 acquire 대기 시간 합계 (PostgreSQL 풀 사용 시)
+    pool_wait: float = 0.0
+
+    def record(self, sql: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_sql = sql
+        self.fingerprints[fingerprint(sql)] += 1
+
+    def repeated(self, min_count: int = 2) -> list[tuple[str, int]]:
+        """min_count 번 이상 실행된 SQL 형태 (많이 실행된 순)"""
+        return [
+            (shape, count)
+            for shape, count in self.fingerprints.most_common()
+            if count >= min_count
+        ]
+
+    @property
+    def max_repeat(self) -> int:
+        """가장 많이 반복된 SQL 형태의 실행 횟수"""
+        if not self.fingerprints:
+            return 0
+        return self.fingerprints.most_common(1)[0][1]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+# 중첩 호출(super() 경유 등)을 한 번만 세기 위한 플래그
+_in_query: ContextVar[bool] = ContextVar("in_query", default=False)
+_installed = False
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """리터럴/바인드 파라미터를 제거한 SQL 형태 반환"""
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def get_current_stats() -> QueryStats | None:
+    """현재 컨텍스트의 쿼리 통계 반환 (추적 중이 아니면 None)"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행되는 쿼리를 새 QueryStats 에 기록"""
+    if not _installed:
+        install_query_instrumentation()
+
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _instrument(method):
+    @wraps(method)
+    async def wrapper(self, query, *args, **kwargs):
+        stats = _current_stats.get()
+        if stats is None or _in_query.get():
+            return await method(self, query, *args, **kwargs)
+
+        token = _in_query.set(True)
+        start = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            stats.record(query, time.perf_counter() - start)
+            _in_query.reset(token)
+
+    wrapper.__query_instrumented__ = True
+    return wrapper
+
+
+def _iter_client_classes(cls: type) -> Iterator[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_client_classes(subclass)
+
+
+def install_query_instrumentation() -> None:
+    """Tortoise 커넥션 클래스의 execute_* 메서드를 계측 (중복 호출 안전)"""
+    global _installed
+
+    for module in _BACKEND_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+
+    for cls in _iter_client_classes(BaseDBAsyncClient):
+        for name in _EXECUTE_METHODS:
+            method = cls.__dict__.get(name)
+            if method is None or getattr(method, "__isabstractmethod__", False):
+                continue
+            if getattr(method, "__query_instrumented__", False):
+                continue
+            setattr(cls, name, _instrument(method))
+    _installed = True
@@ -0,0 +1,40 @@
+"""pydantic-core 직렬화 응답
+
+FastAPI 기본 경로(jsonable_encoder 또는 response_model 직렬화 → dict → json.dumps)를
+거치지 않고, TypeAdapter 로 검증과 JSON 직렬화를 Rust(pydantic-core)에서 한 번에
+수행해 바이트로 응답한다. ORM 객체는 from_attributes 로 바로 읽는다.
+"""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@cache
+def get_adapter(schema: Any) -> TypeAdapter:
+    """스키마별 TypeAdapter (생성 비용이 크므로 재사용)"""
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, data: Any) -> bytes:
+    """data 를 schema 로 검증한 뒤 JSON 바이트로 직렬화"""
+    adapter = get_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def model_response(
+    schema: Any,
+    data: Any,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """schema 로 직렬화한 JSON 응답 (response_model 은 문서용으로만 지정)"""
+    return Response(
+        dump_json(schema, data),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,138 @@
+"""게시글/댓글 전문 검색 스키마
+
+- PostgreSQL: search_vector(tsvector) 컬럼 + GIN 인덱스, 트리거로 title/content 변경 시 갱신
+  (배포환경은 마이그레이션 4번이 같은 스키마를 만든다)
+- SQLite: FTS5 external content 테이블(posts_fts, comments_fts) + 트리거
+
+텍스트 검색 설정은 'simple' 이다 (PostgreSQL 에 한국어 형태소 분석기가 없으므로
+언어와 무관하게 공백/구두점 기준 토큰화, 소문자화만 한다).
+
+install_search_schema 는 generate_schemas 직후(개발환경, 테스트)에 호출하며
+여러 번 실행해도 안전하다.
+"""
+
+import re
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+SEARCH_CONFIG = "simple"
+
+# 제목 일치가 본문 일치보다 높은 순위 (PostgreSQL: A/B 가중치, SQLite: bm25 열 가중치)
+POSTGRES_SCHEMA = f"""
+ALTER TABLE "posts" ADD COLUMN IF NOT EXISTS "search_vector" tsvector;
+ALTER TABLE "comments" ADD COLUMN IF NOT EXISTS "search_vector" tsvector;
+CREATE INDEX IF NOT EXISTS "idx_posts_search_vector" ON "posts" USING GIN ("search_vector");
+CREATE INDEX IF NOT EXISTS "idx_comments_search_vector" ON "comments" USING GIN ("search_vector");
+
+CREATE OR REPLACE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION comments_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.content, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "posts_search_vector_trigger" ON "posts";
+CREATE TRIGGER "posts_search_vector_trigger"
+    BEFORE INSERT OR UPDATE OF "title", "content" ON "posts"
+    FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update();
+
+DROP TRIGGER IF EXISTS "comments_search_vector_trigger" ON "comments";
+CREATE TRIGGER "comments_search_vector_trigger"
+    BEFORE INSERT OR UPDATE OF "content" ON "comments"
+    FOR EACH ROW EXECUTE FUNCTION comments_search_vector_update();
+"""
+
+# 기존 행 채우기 (컬럼을 새로 추가했을 때만)
+POSTGRES_BACKFILL = f"""
+UPDATE "posts" SET "search_vector" =
+    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("title", '')), 'A') ||
+    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("content", '')), 'B')
+WHERE "search_vector" IS NULL;
+UPDATE "comments" SET "search_vector" = to_tsvector('{SEARCH_CONFIG}', coalesce("content", ''))
+WHERE "search_vector" IS NULL;
+"""
+
+SQLITE_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS "posts_fts" USING fts5(
+    title, content, content='posts', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS "posts_fts_insert" AFTER INSERT ON "posts" BEGIN
+    INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS "posts_fts_delete" AFTER DELETE ON "posts" BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS "posts_fts_update" AFTER UPDATE OF title, content ON "posts"
+BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS "comments_fts" USING fts5(
+    content, content='comments', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS "comments_fts_insert" AFTER INSERT ON "comments" BEGIN
+    INSERT INTO comments_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS "comments_fts_delete" AFTER DELETE ON "comments" BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS "comments_fts_update" AFTER UPDATE OF content ON "comments"
+BEGIN
+    INSERT INTO comments_fts(comments_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+    INSERT INTO comments_fts(rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+# 이미 있는 행을 FTS 인덱스에 반영 (테이블을 새로 만들었을 때만)
+SQLITE_REBUILD = """
+INSERT INTO posts_fts(posts_fts) VALUES ('rebuild');
+INSERT INTO comments_fts(comments_fts) VALUES ('rebuild');
+"""
+
+_TERM = re.compile(r"\w+")
+
+
+async def install_search_schema(conn: BaseDBAsyncClient) -> None:
+    """검색 컬럼/인덱스/트리거 생성 (이미 있으면 그대로, 새로 만들면 기존 행 색인)"""
+    dialect = conn.capabilities.dialect
+    if dialect == "postgres":
+        rows = await conn.execute_query_dict(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'posts' AND column_name = 'search_vector'"
+        )
+        await conn.execute_script(POSTGRES_SCHEMA)
+        if not rows:
+            await conn.execute_script(POSTGRES_BACKFILL)
+    elif dialect == "sqlite":
+        rows = await conn.execute_query_dict(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+        )
+        await conn.execute_script(SQLITE_SCHEMA)
+        if not rows:
+            await conn.execute_script(SQLITE_REBUILD)
+    else:
+        raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+
+def search_terms(query: str) -> list[str]:
+    """검색어에서 단어만 추출 (소문자, 중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(term.lower() for term in _TERM.findall(query)))
+
+
+def fts5_match_query(terms: list[str]) -> str:
+    """FTS5 MATCH 식 (모든 단어 포함, 사용자 입력의 연산자는 따옴표로 무력화)"""
+    return " ".join(f'"{term}"' for term in terms)
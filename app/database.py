@@ -1,10 +1,56 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
 
 from app.core.config import settings
+from app.core.db_pool import install_pool_instrumentation
+from app.core.db_router import replica_connection_names
+from app.core.search import install_search_schema
+
+
+def build_connection_config(database_url: str) -> str | dict:
+    """DB URL 을 Tortoise 커넥션 설정으로 변환
+
+    PostgreSQL 은 Settings 의 풀 설정을 credentials 에 넣는다 (URL 쿼리
+    파라미터로 지정한 값이 우선). 그 외 DB 는 URL 을 그대로 사용한다.
+    """
+    config = expand_db_url(database_url)
+    if config["engine"] != "tortoise.backends.asyncpg":
+        return database_url
+
+    pool_options = {
+        "minsize": settings.db_pool_min_size,
+        "maxsize": settings.db_pool_max_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+        "max_inactive_connection_lifetime": (
+            settings.db_max_inactive_connection_lifetime
+        ),
+        "command_timeout": settings.db_command_timeout,
+    }
+    config["credentials"] = {**pool_options, **config["credentials"]}
+    return config
+
+
+def build_connections() -> dict[str, str | dict]:
+    """primary(default) + 읽기 복제본(replica1, replica2 ...) 커넥션"""
+    replica_urls = settings.database_replica_urls
+    return {
+        "default": build_connection_config(settings.database_url),
+        **{
+            name: build_connection_config(url)
+            for name, url in zip(
+                replica_connection_names(len(replica_urls)), replica_urls, strict=True
+            )
+        },
+    }
+
 
 # Tortoise ORM 설정
 TORTOISE_ORM = {
-    "connections": {"default": settings.database_url},
+    "connections": build_connections(),
     "apps": {
         "models": {
             "models": [
@@ -12,20 +58,50 @@ TORTOISE_ORM = {
                 "app.models.post",
                 "app.models.comment",
                 "app.models.profile",
+                "app.models.job",
                 "aerich.models",
             ],
             "default_connection": "default",
         },
     },
+    # 복제본이 있을 때만 읽기/쓰기 분리
+    "routers": (
+        ["app.core.db_router.ReplicaRouter"] if settings.database_replica_urls else []
+    ),
 }
 
 
-async def init_db():
-    """데이터베이스 초기화"""
-    await Tortoise.init(config=TORTOISE_ORM)
-    await Tortoise.generate_schemas()
+async def init_db(timings: dict[str, float] | None = None) -> bool:
+    """데이터베이스 초기화 (새로 초기화했으면 True)
+
+    이미 초기화되어 있으면(테스트, 벤치마크 등) 건너뛴다. DB_GENERATE_SCHEMAS 가
+    꺼져 있으면 마이그레이션으로 스키마가 준비되었다고 보고 테이블 생성을 생략한다.
+    timings 를 넘기면 단계별 소요 시간(초)을 기록한다.
+    """
+    timings = {} if timings is None else timings
+    if Tortoise._inited:
+        return False
+
+    with _phase(timings, "db_init"):
+        install_pool_instrumentation()
+        await Tortoise.init(config=TORTOISE_ORM)
+    if settings.db_generate_schemas:
+        with _phase(timings, "generate_schemas"):
+            await Tortoise.generate_schemas()
+            # 전문 검색 색인(tsvector/FTS5)은 모델 필드가 아니므로 따로 생성
+            await install_search_schema(Tortoise.get_connection("default"))
+    return True
 
 
 async def close_db():
     """데이터베이스 연결 종료"""
     await Tortoise.close_connections()
+
+
+@contextmanager
+def _phase(timings: dict[str, float], name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
@@ -0,0 +1,75 @@
+import math
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.admission import AdmissionController, admission_controller
+
+
+class AdmissionMiddleware:
+    """부하 제어 미들웨어 (순수 ASGI)
+
+    클라이언트별 속도 제한(429)을 먼저 확인하고, 제한이 설정된 route 는 슬롯을 얻은
+    요청만 실행한다 (대기열 초과/timeout 시 503). 두 응답 모두 Retry-After 를 포함한다.
+    슬롯은 응답 본문 전송이 끝날 때까지 유지된다.
+
+    속도 제한의 클라이언트 키는 scope["client"] 이다. 프록시 뒤에서는 uvicorn 이
+    신뢰하는 프록시(FORWARDED_ALLOW_IPS)의 요청에 한해 X-Forwarded-For 로 바꿔 둔다.
+    """
+
+    def __init__(
+        self, app: ASGIApp, controller: AdmissionController = admission_controller
+    ):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rate_limiter = self.controller.rate_limiter
+        if rate_limiter is not None:
+            client = scope.get("client")
+            wait = rate_limiter.check(client[0] if client else "")
+            if wait:
+                await _reject(scope, receive, send, 429, "Too many requests", wait)
+                return
+
+        limiter = self.controller.route_limiter(
+            scope["method"], scope["path"], scope["query_string"]
+        )
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            await _reject(
+                scope,
+                receive,
+                send,
+                503,
+                "Server is busy, retry later",
+                self.controller.retry_after,
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+async def _reject(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    status_code: int,
+    detail: str,
+    retry_after: float,
+) -> None:
+    response = JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+    await response(scope, receive, send)
@@ -0,0 +1,166 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import (
+    CODECS,
+    Codec,
+    CompressedBodyCache,
+    body_digest,
+    compression_cache,
+    negotiate,
+)
+from app.core.config import settings
+
+# 압축 대상 Content-Type (이미 압축된 이미지/아카이브 등은 제외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/jsonl",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어 (순수 ASGI, Accept-Encoding 협상)
+
+    본문이 한 번에 오는 응답은 minimum_size 이상일 때만 압축하고,
+    threadpool_min_size 이상이면 스레드 풀에서 압축해 이벤트 루프를 막지 않는다.
+    강한 ETag 가 있는 응답은 (본문 해시, 인코딩)별 압축 결과를 캐시에서 재사용한다.
+    스트리밍 응답은 크기를 알 수 없으므로 청크마다 flush 하며 압축한다.
+
+    압축한 응답의 ETag 는 nginx 처럼 약한 ETag(W/)로 바꾼다 (If-None-Match 는
+    약한 비교이므로 핸들러의 304 판단은 그대로 동작).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        threadpool_min_size: int | None = None,
+        cache: CompressedBodyCache = compression_cache,
+        codecs: dict[str, Codec] = CODECS,
+    ):
+        self.app = app
+        self.minimum_size = (
+            settings.compression_min_size if minimum_size is None else minimum_size
+        )
+        self.threadpool_min_size = (
+            settings.compression_threadpool_min_size
+            if threadpool_min_size is None
+            else threadpool_min_size
+        )
+        self.cache = cache
+        self.codecs = codecs
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codec = negotiate(_accept_encoding(scope), self.codecs)
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+
+        # http.response.start 는 첫 본문을 보고 압축 여부를 정한 뒤 보냄
+        start_message: Message | None = None
+        stream = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, stream
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if start_message is None:
+                # 이미 시작된 응답: 스트리밍 압축 중이거나 그대로 전달
+                if stream is not None:
+                    message["body"] = _stream_chunk(stream, message)
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(scope=start)
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if not _compressible(start["status"], headers):
+                await send(start)
+                await send(message)
+            elif more_body:
+                stream = codec.stream()
+                _set_encoding(headers, codec, length=None)
+                await send(start)
+                message["body"] = stream.compress(body)
+                await send(message)
+            elif len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+            else:
+                compressed = await self._compress(codec, body, headers.get("etag"))
+                _set_encoding(headers, codec, length=len(compressed))
+                await send(start)
+                await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compress(self, codec: Codec, body: bytes, etag: str | None) -> bytes:
+        offload = len(body) >= self.threadpool_min_size
+        # 강한 ETag 가 있는 응답만 캐시 (ETag 가 같아도 본문이 다를 수 있으므로 키는 해시)
+        digest = None
+        if etag is not None and not etag.startswith("W/"):
+            if offload:
+                digest = await run_in_threadpool(body_digest, body)
+            else:
+                digest = body_digest(body)
+            if (cached := self.cache.get(digest, codec.name)) is not None:
+                self.cache.record(codec.name, len(body), len(cached))
+                return cached
+
+        if offload:
+            compressed = await run_in_threadpool(codec.compress, body)
+        else:
+            compressed = codec.compress(body)
+        self.cache.record(codec.name, len(body), len(compressed))
+        if digest is not None:
+            self.cache.set(digest, codec.name, compressed)
+        return compressed
+
+
+def _accept_encoding(scope: Scope) -> str | None:
+    for name, value in scope.get("headers", ()):
+        if name == b"accept-encoding":
+            return value.decode("latin-1")
+    return None
+
+
+def _compressible(status: int, headers: MutableHeaders) -> bool:
+    if status < 200 or status in (204, 304) or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+def _set_encoding(headers: MutableHeaders, codec: Codec, length: int | None) -> None:
+    headers["Content-Encoding"] = codec.name
+    if length is None:
+        del headers["Content-Length"]
+    else:
+        headers["Content-Length"] = str(length)
+    headers.add_vary_header("Accept-Encoding")
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+def _stream_chunk(stream, message: Message) -> bytes:
+    chunk = stream.compress(message.get("body", b""))
+    if not message.get("more_body", False):
+        chunk += stream.finish()
+    return chunk
@@ -1,64 +1,132 @@
 import logging
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-logger = logging.getLogger(__name__)
-
-
-class QueryMonitorMiddleware(BaseHTTPMiddleware):
-    """쿼리 성능 모니터링 미들웨어"""
-
-    def __init__(self, app):
-        super().__init__(app)
-        self.query_stats: list[dict] = []
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-
-        # 쿼리 카운터 초기화
-        query_count_before = self._get_query_count()
+from app.core.db_pool import install_pool_instrumentation
+from app.core.metrics import MetricsRegistry, metrics_registry
+from app.core.query_tracker import (
+    QueryStats,
+    install_query_instrumentation,
+    track_queries,
+)
 
-        response = await call_next(request)
-
-        # 실행 시간 계산
-        process_time = time.time() - start_time
-        query_count_after = self._get_query_count()
-        query_count = query_count_after - query_count_before
+logger = logging.getLogger(__name__)
 
-        # 통계 저장
-        stats = {
-            "path": request.url.path,
-            "method": request.method,
-            "process_time": round(process_time, 4),
-            "query_count": query_count,
-            "timestamp": time.time(),
-        }
 
-        self.query_stats.append(stats)
+class QueryMonitorMiddleware:
+    """쿼리 성능 모니터링 미들웨어 (순수 ASGI)
+
+    BaseHTTPMiddleware 와 달리 별도 태스크/메모리 스트림 없이 send 만 감싸므로
+    스트리밍 응답도 그대로 전달된다. 성능 헤더는 http.response.start 시점의
+    값이 기록된다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = metrics_registry,
+        repeat_threshold: int = 5,
+    ):
+        self.app = app
+        # route 템플릿/메서드 별 고정 크기 집계 (요청마다 행을 쌓지 않음)
+        self.registry = registry
+        # 같은 SQL 형태가 이 횟수 이상 반복되면 N+1 의심으로 경고
+        self.repeat_threshold = repeat_threshold
+        install_query_instrumentation()
+        install_pool_instrumentation()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        # 요청 단위 쿼리 추적
+        with track_queries() as query_stats:
+
+            async def send_with_headers(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                    # 응답 헤더에 성능 정보 추가
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-process-time", f"{elapsed:.6f}".encode()),
+                        (b"x-query-count", str(query_stats.count).encode()),
+                        (b"x-db-time", f"{query_stats.total_time:.6f}".encode()),
+                        (
+                            b"x-query-max-repeat",
+                            str(query_stats.max_repeat).encode(),
+                        ),
+                        (
+                            b"x-db-pool-wait",
+                            f"{query_stats.pool_wait:.6f}".encode(),
+                        ),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                process_time = (time.perf_counter_ns() - start_ns) / 1e9
+                self._record(scope, status_code, process_time, query_stats)
+
+    def _record(
+        self,
+        scope: Scope,
+        status_code: int,
+        process_time: float,
+        query_stats: QueryStats,
+    ) -> None:
+        method = scope["method"]
+        path = scope["path"]
+
+        # 통계 집계 (route 템플릿 기준, 매칭 실패 시 하나의 시계열로 묶음)
+        route = scope.get("route")
+        self.registry.observe(
+            method=method,
+            route=getattr(route, "path", None),
+            status=status_code,
+            duration=process_time,
+            query_count=query_stats.count,
+            db_time=query_stats.total_time,
+        )
 
-        # 로그 출력
+        # 로그 출력 (비활성 레벨이면 포맷팅 비용 없음)
         logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Time: {process_time:.4f}s, Queries: {query_count}"
+            "%s %s - Time: %.4fs, Queries: %d, DB Time: %.4fs, Pool Wait: %.4fs",
+            method,
+            path,
+            process_time,
+            query_stats.count,
+            query_stats.total_time,
+            query_stats.pool_wait,
         )
+        if not query_stats.count:
+            return
 
-        # 응답 헤더에 성능 정보 추가
-        response.headers["X-Process-Time"] = str(process_time)
-        response.headers["X-Query-Count"] = str(query_count)
-
-        return response
-
-    def _get_query_count(self) -> int:
-        """현재 쿼리 수 반환 (실제 구현 필요)"""
-        # Tortoise ORM의 쿼리 카운터 구현
-        return 0
+        logger.debug(
+            "Slowest query (%.4fs): %s",
+            query_stats.slowest_time,
+            query_stats.slowest_sql,
+        )
+        for shape, count in query_stats.repeated(self.repeat_threshold):
+            logger.warning(
+                "Possible N+1 on %s %s: same SQL shape executed %d times: %s",
+                method,
+                path,
+                count,
+                shape,
+            )
 
     def get_stats(self) -> list[dict]:
-        """성능 통계 반환"""
-        return self.query_stats
+        """성능 통계 반환 (route 별 집계)"""
+        return self.registry.snapshot()
 
     def clear_stats(self):
         """통계 초기화"""
-        self.query_stats.clear()
+        self.registry.clear()
@@ -0,0 +1,67 @@
+import math
+import time
+from http.cookies import SimpleCookie
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.db_router import routing_scope
+
+STICKY_COOKIE = "db_primary_until"
+
+
+class ReadYourWritesMiddleware:
+    """요청 사이 read-your-writes 보장 (순수 ASGI)
+
+    쓰기가 있었던 요청의 응답에 primary 고정 만료 시각을 쿠키로 내려 주고,
+    다음 요청에서 쿠키가 유효하면 그 시각까지 읽기를 primary 로 보낸다.
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float | None = None):
+        self.app = app
+        self.sticky_seconds = (
+            settings.replica_sticky_seconds
+            if sticky_seconds is None
+            else sticky_seconds
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 쿠키 값은 클라이언트가 바꿀 수 있으므로 고정 기간 이내로 제한
+        primary_until = min(_read_cookie(scope), time.time() + self.sticky_seconds)
+        with routing_scope(primary_until) as state:
+
+            async def send_with_cookie(message: Message) -> None:
+                if (
+                    message["type"] == "http.response.start"
+                    and state.primary_until > primary_until
+                ):
+                    max_age = math.ceil(state.primary_until - time.time())
+                    cookie = (
+                        f"{STICKY_COOKIE}={state.primary_until:.3f}; "
+                        f"Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+                    )
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"set-cookie", cookie.encode("latin-1")),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
+
+
+def _read_cookie(scope: Scope) -> float:
+    for name, value in scope.get("headers", ()):
+        if name != b"cookie":
+            continue
+        morsel = SimpleCookie(value.decode("latin-1")).get(STICKY_COOKIE)
+        if morsel is None:
+            continue
+        try:
+            return float(morsel.value)
+        except ValueError:
+            return 0.0
+    return 0.0
@@ -1,6 +1,7 @@
 from .comment import Comment
+from .job import Job, JobStatus
 from .post import Post
 from .profile import Profile
 from .user import User
 
-__all__ = ["User", "Post", "Comment", "Profile"]
+__all__ = ["User", "Post", "Comment", "Profile", "Job", "JobStatus"]
@@ -5,11 +5,11 @@ from tortoise.models import Model
 class Comment(Model):
     id = fields.IntField(pk=True)
     content = fields.TextField()
-    created_at = fields.DatetimeField(auto_now_add=True)
+    created_at = fields.DatetimeField(auto_now_add=True, db_index=True)
 
-    # 외래키 관계
-    post = fields.ForeignKeyField("models.Post", related_name="comments")
-    user = fields.ForeignKeyField("models.User", related_name="comments")
+    # 외래키 관계 (PostgreSQL 은 FK 컬럼에 인덱스를 자동으로 만들지 않음)
+    post = fields.ForeignKeyField("models.Post", related_name="comments", db_index=True)
+    user = fields.ForeignKeyField("models.User", related_name="comments", db_index=True)
 
     class Meta:
         table = "comments"
@@ -0,0 +1,35 @@
+from enum import StrEnum
+
+from tortoise import fields
+from tortoise.models import Model
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(Model):
+    """백그라운드 작업 (재시작 후에도 남도록 DB 에 보관, app.core.jobs 가 실행)"""
+
+    id = fields.IntField(pk=True)
+    kind = fields.CharField(max_length=50)
+    status = fields.CharEnumField(JobStatus, default=JobStatus.QUEUED, db_index=True)
+    # 작업 입력 (재시작 시 다시 실행할 수 있도록 요청 본문을 그대로 저장)
+    payload = fields.JSONField(default=dict)
+    result = fields.JSONField(null=True)
+    error = fields.TextField(null=True)
+    # 진행률 (처리한 항목 수 / 전체, 전체를 모르면 null)
+    progress = fields.IntField(default=0)
+    total = fields.IntField(null=True)
+    attempts = fields.IntField(default=0)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    # 진행 상황을 기록할 때마다 갱신 (멈춘 running 작업 판단 기준)
+    updated_at = fields.DatetimeField(auto_now=True)
+    started_at = fields.DatetimeField(null=True)
+    finished_at = fields.DatetimeField(null=True)
+
+    class Meta:
+        table = "jobs"
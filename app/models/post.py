@@ -1,7 +1,11 @@
 from typing import TYPE_CHECKING
 
 from tortoise import fields
+from tortoise.expressions import F
 from tortoise.models import Model
+from tortoise.signals import post_delete, post_save
+
+from .user import User
 
 if TYPE_CHECKING:
     from .comment import Comment
@@ -11,7 +15,7 @@ class Post(Model):
     id = fields.IntField(pk=True)
     title = fields.CharField(max_length=200)
     content = fields.TextField()
-    created_at = fields.DatetimeField(auto_now_add=True)
+    created_at = fields.DatetimeField(auto_now_add=True, db_index=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
     # 외래키 관계
@@ -22,3 +26,26 @@ class Post(Model):
 
     class Meta:
         table = "posts"
+        # 사용자별 최신 게시글 (user_id 단독 조회/FK 도 이 인덱스의 선두 컬럼으로 처리)
+        indexes = (("user", "created_at"),)
+
+
+# users.post_count 비정규화 컬럼 유지
+# (bulk_create / 쿼리셋 delete 는 시그널이 발생하지 않으므로 backfill 로 보정)
+@post_save(Post)
+async def increment_user_post_count(sender, instance, created, using_db, update_fields):
+    if created:
+        await (
+            User.filter(id=instance.user_id)
+            .using_db(using_db)
+            .update(post_count=F("post_count") + 1)
+        )
+
+
+@post_delete(Post)
+async def decrement_user_post_count(sender, instance, using_db):
+    await (
+        User.filter(id=instance.user_id)
+        .using_db(using_db)
+        .update(post_count=F("post_count") - 1)
+    )
@@ -14,6 +14,8 @@ class User(Model):
     email = fields.CharField(max_length=100, unique=True)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
+    # 게시글 수 (Post 생성/삭제 시그널로 갱신, 집계 쿼리 없이 조회)
+    post_count = fields.IntField(default=0)
 
     # 관계 설정 (N+1 문제 해결을 위해)
     posts: fields.ReverseRelation["Post"]
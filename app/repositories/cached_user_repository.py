@@ -0,0 +1,119 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from tortoise.signals import post_delete, post_save
+
+from app.core.cache import Cache, cache
+from app.models import Post, User
+from app.repositories.user_repository import USER_BY_ID, UserRepository
+
+# 목록성 캐시 키 (사용자 생성 시 함께 무효화)
+USER_LIST_KEYS = ("users:names-only", "users:stats:post-count", "users:version")
+# users.post_count 가 들어간 목록성 캐시 키
+POST_COUNT_KEYS = ("users:stats:post-count", "users:version")
+
+
+def user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+async def _load_jsonable(loader: Callable[[], Awaitable[Any]]) -> Any:
+    """loader 결과를 JSON 으로 표현 가능한 값으로 변환 (datetime → ISO 문자열)"""
+    return to_jsonable_python(await loader())
+
+
+class CachedUserRepository(UserRepository):
+    """읽기 캐시를 앞에 둔 사용자 리포지토리 (쓰기 시 관련 키 무효화)
+
+    캐시에는 모델 인스턴스 대신 JSON 으로 표현 가능한 dict/list 를 저장하므로
+    (datetime 은 ISO 문자열) 외부 캐시 백엔드에서도 그대로 사용할 수 있다.
+    캐시 hit 과 miss 가 같은 값을 반환하도록 로더 결과도 변환해 반환한다.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        """사용자 ID로 조회 (캐시)"""
+        row = await self.cache.get_or_load(
+            user_key(user_id), lambda: self._load_user_row(user_id)
+        )
+        if row is None:
+            return None
+        # ISO 문자열로 저장한 datetime 을 필드 타입으로 되돌림
+        fields_map = User._meta.fields_map
+        return User._init_from_db(
+            **{
+                key: fields_map[key].to_python_value(value)
+                for key, value in row.items()
+            }
+        )
+
+    async def create_user(self, name: str, email: str) -> User:
+        """사용자 생성 (목록 캐시 무효화)"""
+        user = await super().create_user(name=name, email=email)
+        await self.cache.invalidate(user_key(user.id), *USER_LIST_KEYS)
+        return user
+
+    async def bulk_create_users(self, users_data: list[dict]) -> list[User]:
+        """대량 사용자 생성 (목록 캐시 무효화)"""
+        users = await super().bulk_create_users(users_data)
+        user_keys = [user_key(u.id) for u in users if u.id is not None]
+        await self.cache.invalidate(*user_keys, *USER_LIST_KEYS)
+        return users
+
+    async def insert_users_batch(self, rows: list[tuple[str, str]]) -> list[str]:
+        """배치 삽입 (목록 캐시 무효화)"""
+        inserted = await super().insert_users_batch(rows)
+        if inserted:
+            await self.cache.invalidate(*USER_LIST_KEYS)
+        return inserted
+
+    async def get_users_with_post_count(self, live: bool = False) -> list[dict]:
+        """사용자별 게시글 수 조회 (live 집계는 캐시하지 않음)"""
+        if live:
+            return await super().get_users_with_post_count(live=True)
+        loader = super().get_users_with_post_count
+        return await self.cache.get_or_load(
+            "users:stats:post-count", lambda: _load_jsonable(loader)
+        )
+
+    async def backfill_post_counts(self) -> int:
+        """post_count 재계산 (여러 사용자 행이 바뀌므로 캐시 전체 비움)"""
+        updated = await super().backfill_post_counts()
+        await self.cache.clear()
+        return updated
+
+    async def get_users_version(self) -> dict:
+        """users 테이블 버전 (캐시, 캐시된 목록과 같은 시점 기준)"""
+        loader = super().get_users_version
+        return await self.cache.get_or_load(
+            "users:version", lambda: _load_jsonable(loader)
+        )
+
+    async def get_user_names_only(self) -> list[dict]:
+        """사용자 이름만 조회 (캐시)"""
+        loader = super().get_user_names_only
+        return await self.cache.get_or_load(
+            "users:names-only", lambda: _load_jsonable(loader)
+        )
+
+    async def _load_user_row(self, user_id: int) -> dict | None:
+        rows = await USER_BY_ID.rows(user_id=user_id)
+        return to_jsonable_python(dict(rows[0])) if rows else None
+
+
+# 게시글 생성/삭제 시그널(app.models.post)이 쿼리셋 update 로 users.post_count 를
+# 바꾸므로 그 값이 들어간 캐시도 무효화 (모델 쪽 핸들러 다음에 등록됨)
+@post_save(Post)
+async def invalidate_post_count_on_create(
+    sender, instance, created, using_db, update_fields
+):
+    if created:
+        await cache.invalidate(user_key(instance.user_id), *POST_COUNT_KEYS)
+
+
+@post_delete(Post)
+async def invalidate_post_count_on_delete(sender, instance, using_db):
+    await cache.invalidate(user_key(instance.user_id), *POST_COUNT_KEYS)
@@ -0,0 +1,20 @@
+from collections import defaultdict
+
+from app.core.dataloader import DataLoader
+from app.models import Post
+
+
+async def load_posts_by_user(user_ids: list[int]) -> dict[int, list[Post]]:
+    """user_id IN (...) 한 번으로 여러 사용자의 게시글 조회"""
+    posts = await Post.filter(user_id__in=user_ids).order_by("id")
+    grouped: dict[int, list[Post]] = defaultdict(list)
+    for post in posts:
+        grouped[post.user_id].append(post)
+    return grouped
+
+
+class UserLoaders:
+    """요청 하나 동안 공유되는 사용자 관계 로더 모음"""
+
+    def __init__(self):
+        self.posts = DataLoader(load_posts_by_user, default_factory=list)
@@ -0,0 +1,78 @@
+from typing import Literal
+
+from app.core.search import SEARCH_CONFIG, fts5_match_query
+from app.models import Post
+
+SearchScope = Literal["all", "posts", "comments"]
+
+# 검색 결과 본문 미리보기 길이 (문자)
+EXCERPT_LENGTH = 200
+
+# 게시글/댓글 검색 (역색인: PostgreSQL GIN(tsvector), SQLite FTS5)
+# 두 쿼리 모두 (kind, id, post_id, user_id, title, excerpt, rank) 를 반환한다.
+POSTGRES_POSTS = f"""
+SELECT 'post' AS kind, p.id, p.id AS post_id, p.user_id, p.title,
+       left(p.content, {EXCERPT_LENGTH}) AS excerpt,
+       ts_rank_cd(p.search_vector, query) AS rank
+FROM posts p, plainto_tsquery('{SEARCH_CONFIG}', $1) query
+WHERE p.search_vector @@ query
+"""
+POSTGRES_COMMENTS = f"""
+SELECT 'comment' AS kind, c.id, c.post_id, c.user_id, NULL AS title,
+       left(c.content, {EXCERPT_LENGTH}) AS excerpt,
+       ts_rank_cd(c.search_vector, query) AS rank
+FROM comments c, plainto_tsquery('{SEARCH_CONFIG}', $1) query
+WHERE c.search_vector @@ query
+"""
+
+# bm25 는 작을수록 관련도가 높으므로 부호를 바꾼다 (제목 가중치 10, 본문 1)
+SQLITE_POSTS = f"""
+SELECT 'post' AS kind, p.id, p.id AS post_id, p.user_id, p.title,
+       substr(p.content, 1, {EXCERPT_LENGTH}) AS excerpt,
+       -bm25(posts_fts, 10.0, 1.0) AS rank
+FROM posts_fts JOIN posts p ON p.id = posts_fts.rowid
+WHERE posts_fts MATCH ?
+"""
+SQLITE_COMMENTS = f"""
+SELECT 'comment' AS kind, c.id, c.post_id, c.user_id, NULL AS title,
+       substr(c.content, 1, {EXCERPT_LENGTH}) AS excerpt,
+       -bm25(comments_fts) AS rank
+FROM comments_fts JOIN comments c ON c.id = comments_fts.rowid
+WHERE comments_fts MATCH ?
+"""
+
+
+class SearchRepository:
+    """게시글/댓글 전문 검색 (app.core.search 가 만든 색인 사용)
+
+    관련도 내림차순, 같으면 최신(id 큰) 순으로 정렬하고 offset 으로 페이지를 나눈다.
+    """
+
+    async def search(
+        self,
+        terms: list[str],
+        scope: SearchScope = "all",
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[dict], bool]:
+        """모든 단어를 포함하는 게시글/댓글 (결과, 다음 페이지 존재 여부)"""
+        # 검색은 읽기 전용이므로 복제본이 있으면 복제본에서 실행
+        conn = Post._choose_db()
+        if conn.capabilities.dialect == "postgres":
+            parts = {"posts": POSTGRES_POSTS, "comments": POSTGRES_COMMENTS}
+            selected = [sql for name, sql in parts.items() if scope in ("all", name)]
+            # $1 을 모든 부분 쿼리가 공유
+            values = [" ".join(terms)]
+            paging = "LIMIT $2 OFFSET $3"
+        else:
+            parts = {"posts": SQLITE_POSTS, "comments": SQLITE_COMMENTS}
+            selected = [sql for name, sql in parts.items() if scope in ("all", name)]
+            values = [fts5_match_query(terms)] * len(selected)
+            paging = "LIMIT ? OFFSET ?"
+
+        sql = " UNION ALL ".join(selected) + (
+            f" ORDER BY rank DESC, kind DESC, id DESC {paging}"
+        )
+        # 다음 페이지 여부 확인을 위해 한 건 더 조회
+        rows = await conn.execute_query_dict(sql, [*values, limit + 1, offset])
+        return rows[:limit], len(rows) > limit
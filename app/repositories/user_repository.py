@@ -1,11 +1,45 @@
-from tortoise.functions import Count
-from tortoise.queryset import QuerySet
+from collections import defaultdict
+from collections.abc import AsyncIterator, Collection
 
-from app.models import User
+from pypika_tortoise import Order, Table
+from pypika_tortoise.analytics import Count as WindowCount
+from pypika_tortoise.analytics import RowNumber
+from tortoise import connections
+from tortoise.functions import Count, Max, Sum
+
+from app.core.compiled_query import CompiledQuery, Param, param_limit
+from app.core.config import settings
+from app.core.db_router import PRIMARY_CONNECTION, mark_write
+from app.core.projection import Projection
+from app.models import Comment, Post, Profile, User
+
+# SQLite 다중 행 INSERT 한 문장당 행 수 (행당 바인드 변수 2개)
+SQLITE_ROWS_PER_INSERT = 500
+
+# 목록 조회 fields= 로 선택 가능한 컬럼 (관계는 "posts.title" 형식)
+USER_COLUMNS = ("id", "name", "email", "post_count", "created_at", "updated_at")
+USER_RELATION_COLUMNS = {
+    "posts": ("id", "title", "content", "created_at", "updated_at"),
+    "profile": ("id", "bio", "avatar_url", "birth_date"),
+}
+
+# 요청마다 실행되는 조회는 SQL 을 한 번만 생성해 재사용 (app.core.compiled_query)
+USER_BY_ID = CompiledQuery(User, lambda: User.filter(id=Param("user_id")).limit(1))
+USERS_FIRST_PAGE = CompiledQuery(
+    User, lambda: param_limit(User.all().order_by("id"), "limit")
+)
+USERS_PAGE_AFTER = CompiledQuery(
+    User,
+    lambda: param_limit(User.filter(id__gt=Param("after_id")).order_by("id"), "limit"),
+)
 
 
 class UserRepository:
-    """사용자 데이터 접근 계층"""
+    """사용자 데이터 접근 계층
+
+    복제본이 설정되면 ORM 쿼리는 ReplicaRouter 에 따라 읽기는 복제본,
+    쓰기(create/bulk_create 등)는 primary 로 간다.
+    """
 
     async def get_all_users(self) -> list[User]:
         """모든 사용자 조회 (N+1 문제 발생)"""
@@ -15,13 +49,200 @@ class UserRepository:
         """모든 사용자 조회 (N+1 문제 해결)"""
         return await User.all().prefetch_related("posts", "profile")
 
+    async def get_users_page(
+        self, limit: int, after_id: int | None = None
+    ) -> tuple[list[User], bool]:
+        """id 기준 키셋 페이지 조회 (OFFSET 없이 PK 인덱스 탐색)
+
+        (페이지 사용자 목록, 다음 페이지 존재 여부)를 반환한다. 관계가 필요하면
+        ETag 를 확인한 뒤 prefetch_page_relations 를 호출한다.
+        """
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        if after_id is None:
+            users = await USERS_FIRST_PAGE.all(limit=limit + 1)
+        else:
+            users = await USERS_PAGE_AFTER.all(after_id=after_id, limit=limit + 1)
+        has_more = len(users) > limit
+        return users[:limit], has_more
+
+    async def prefetch_page_relations(self, users: list[User]) -> None:
+        """페이지 사용자에 대해서만 posts/profile prefetch"""
+        if users:
+            await User.fetch_for_list(users, "posts", "profile")
+
+    async def get_users_page_rows(
+        self, limit: int, projection: Projection, after_id: int | None = None
+    ) -> tuple[list[dict], int | None]:
+        """선택한 users 컬럼만 조회하는 키셋 페이지 (모델 인스턴스 없이 dict)
+
+        관계 없이 users 컬럼만 SELECT 한다 (id 는 항상 포함). 관계 컬럼은
+        attach_relations 로 붙인다. (행 목록, 다음 페이지의 after_id 또는 None)을 반환한다.
+        """
+        # 커서와 관계 묶기에 id 가 필요하므로 항상 조회 (응답에서는 drop_unselected_id)
+        columns = projection.columns
+        if "id" not in columns:
+            columns = ("id", *columns)
+
+        query = User.all()
+        if after_id is not None:
+            query = query.filter(id__gt=after_id)
+        rows = await query.order_by("id").limit(limit + 1).values(*columns)
+        next_after_id = rows[limit - 1]["id"] if len(rows) > limit else None
+        return rows[:limit], next_after_id
+
+    async def attach_relations(
+        self,
+        rows: list[dict],
+        projection: Projection,
+        relations: Collection[str] | None = None,
+    ) -> None:
+        """get_users_page_rows 결과에 선택한 관계 컬럼을 붙임 (relations 로 일부만)
+
+        관계마다 IN 쿼리 하나로 해당 컬럼만 읽는다 (posts 는 목록, profile 은 dict 또는 None).
+        """
+        user_ids = [row["id"] for row in rows]
+        if not user_ids:
+            return
+        for name, columns in projection.relations.items():
+            if relations is not None and name not in relations:
+                continue
+            if name == "posts":
+                await self._attach_posts(rows, user_ids, columns)
+            elif name == "profile":
+                await self._attach_profiles(rows, user_ids, columns)
+
+    async def _attach_posts(
+        self, rows: list[dict], user_ids: list[int], columns: tuple[str, ...]
+    ) -> None:
+        posts_by_user: dict[int, list[dict]] = defaultdict(list)
+        posts = (
+            await Post.filter(user_id__in=user_ids)
+            .order_by("user_id", "id")
+            .values("user_id", *columns)
+        )
+        for post in posts:
+            posts_by_user[post.pop("user_id")].append(post)
+        for row in rows:
+            row["posts"] = posts_by_user.get(row["id"], [])
+
+    async def _attach_profiles(
+        self, rows: list[dict], user_ids: list[int], columns: tuple[str, ...]
+    ) -> None:
+        profiles = await Profile.filter(user_id__in=user_ids).values(
+            "user_id", *columns
+        )
+        profile_by_user = {profile.pop("user_id"): profile for profile in profiles}
+        for row in rows:
+            row["profile"] = profile_by_user.get(row["id"])
+
+    async def iter_users(
+        self, batch_size: int = 1000, fields: tuple[str, ...] = ("id", "name", "email")
+    ) -> AsyncIterator[list[dict]]:
+        """전체 사용자를 id 키셋 배치 단위로 순회 (메모리 사용량은 배치 크기에 비례)
+
+        서버 측 커서와 달리 배치 사이에 커넥션/트랜잭션을 점유하지 않는다.
+        """
+        after_id = 0
+        while True:
+            batch = (
+                await User.filter(id__gt=after_id)
+                .order_by("id")
+                .limit(batch_size)
+                .values(*fields)
+            )
+            if not batch:
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1]["id"]
+
     async def get_user_by_id(self, user_id: int) -> User | None:
         """사용자 ID로 조회"""
-        return await User.filter(id=user_id).first()
+        return await USER_BY_ID.first(user_id=user_id)
 
-    async def get_user_with_posts(self, user_id: int) -> User | None:
-        """사용자와 게시글 함께 조회 (N+1 문제 해결)"""
-        return await User.filter(id=user_id).prefetch_related("posts").first()
+    async def get_post_threads(
+        self, user_id: int, posts_limit: int, comments_limit: int
+    ) -> tuple[list[dict], bool]:
+        """사용자의 최근 게시글과 게시글별 최근 댓글(작성자 포함) 트리
+
+        게시글/댓글 수와 무관하게 쿼리 2개로 조회한다.
+        - 게시글: (user_id, created_at) 인덱스로 최근 posts_limit 개
+        - 댓글: ROW_NUMBER() 윈도 함수로 게시글마다 최근 comments_limit 개만 남기고
+          작성자는 JOIN 으로 함께 읽음 (게시글별 전체 댓글 수도 같은 쿼리에서 계산)
+
+        (게시글 dict 목록, 더 오래된 게시글 존재 여부)를 반환한다.
+        """
+        posts = (
+            await Post.filter(user_id=user_id)
+            .order_by("-created_at", "-id")
+            .limit(posts_limit + 1)
+            .values("id", "title", "content", "created_at")
+        )
+        has_more = len(posts) > posts_limit
+        posts = posts[:posts_limit]
+
+        comments_by_post: dict[int, list[dict]] = defaultdict(list)
+        comment_counts: dict[int, int] = {}
+        if posts:
+            rows = await self._latest_comments(
+                [post["id"] for post in posts], comments_limit
+            )
+            for row in rows:
+                comment_counts[row["post_id"]] = row["comment_count"]
+                comments_by_post[row["post_id"]].append(
+                    {
+                        "id": row["id"],
+                        "content": row["content"],
+                        "created_at": row["created_at"],
+                        "author": {"id": row["author_id"], "name": row["author_name"]},
+                    }
+                )
+
+        for post in posts:
+            post["comment_count"] = comment_counts.get(post["id"], 0)
+            post["comments"] = comments_by_post.get(post["id"], [])
+        return posts, has_more
+
+    async def _latest_comments(self, post_ids: list[int], limit: int) -> list[dict]:
+        # 윈도 함수는 ORM 쿼리셋으로 표현할 수 없어 pypika 로 작성 (DB 방언별 SQL 생성)
+        conn = Comment._choose_db()
+        comments, users = Table("comments"), Table("users")
+        ranked = (
+            conn.query_class.from_(comments)
+            .select(
+                comments.id,
+                comments.post_id,
+                comments.user_id,
+                comments.content,
+                comments.created_at,
+                RowNumber()
+                .over(comments.post_id)
+                .orderby(comments.created_at, order=Order.desc)
+                .orderby(comments.id, order=Order.desc)
+                .as_("comment_rank"),
+                WindowCount(comments.id).over(comments.post_id).as_("comment_count"),
+            )
+            .where(comments.post_id.isin(post_ids))
+        ).as_("ranked")
+        query = (
+            conn.query_class.from_(ranked)
+            .join(users)
+            .on(users.id == ranked.user_id)
+            .select(
+                ranked.id,
+                ranked.post_id,
+                ranked.content,
+                ranked.created_at,
+                ranked.comment_count,
+                users.id.as_("author_id"),
+                users.name.as_("author_name"),
+            )
+            .where(ranked.comment_rank <= limit)
+            .orderby(ranked.post_id)
+            .orderby(ranked.comment_rank)
+        )
+        return await conn.execute_query_dict(query.get_sql())
 
     async def create_user(self, name: str, email: str) -> User:
         """사용자 생성"""
@@ -30,16 +251,109 @@ class UserRepository:
     async def bulk_create_users(self, users_data: list[dict]) -> list[User]:
         """대량 사용자 생성 (bulk_create 최적화)"""
         users = [User(**data) for data in users_data]
-        return await User.bulk_create(users)
+        # bulk_create 는 None 을 반환하므로 만든 인스턴스를 돌려줌
+        await User.bulk_create(users, batch_size=settings.ingest_batch_size)
+        return users
+
+    async def get_users_with_post_count(self, live: bool = False) -> list[dict]:
+        """사용자별 게시글 수 조회
+
+        기본은 비정규화된 users.post_count 컬럼을 읽는다 (JOIN/GROUP BY 없음).
+        live=True 면 posts 를 직접 집계한다 (annotate 사용, 항상 정확하지만 느림).
+        """
+        if live:
+            return (
+                await User.all()
+                .annotate(live_post_count=Count("posts"))
+                .values("id", "name", "email", post_count="live_post_count")
+            )
+        return await User.all().values("id", "name", "email", "post_count")
 
-    async def get_users_with_post_count(self) -> QuerySet:
-        """사용자별 게시글 수 집계 (annotate 사용)"""
-        return (
+    async def backfill_post_counts(self) -> int:
+        """users.post_count 를 posts 실제 개수로 재계산, 갱신된 행 수 반환"""
+        # raw SQL 쓰기는 라우터를 거치지 않으므로 primary 로 직접 보내고 기록
+        conn = connections.get(PRIMARY_CONNECTION)
+        mark_write()
+        updated, _ = await conn.execute_query(
+            'UPDATE "users" SET "post_count" = ('
+            'SELECT COUNT(*) FROM "posts" WHERE "posts"."user_id" = "users"."id")'
+        )
+        return updated
+
+    async def get_users_version(self) -> dict:
+        """users 테이블 버전 (ETag 용 집계: 행 수, 최대 id, 최근 수정 시각, 게시글 수 합계)
+
+        post_count 는 시그널의 쿼리셋 update 로 바뀌어 updated_at 이 갱신되지 않으므로
+        합계를 함께 본다.
+        """
+        rows = (
             await User.all()
-            .annotate(post_count=Count("posts"))
-            .values("id", "name", "email", "post_count")
+            .annotate(
+                count=Count("id"),
+                max_id=Max("id"),
+                updated_at=Max("updated_at"),
+                post_total=Sum("post_count"),
+            )
+            .values("count", "max_id", "updated_at", "post_total")
         )
+        return rows[0]
+
+    async def get_posts_version(self, user_ids: list[int] | None = None) -> dict:
+        """posts 버전 (ETag 용 집계: 행 수, 최근 수정 시각, user_ids 로 작성자 한정)"""
+        query = Post.all() if user_ids is None else Post.filter(user_id__in=user_ids)
+        rows = await query.annotate(
+            count=Count("id"), updated_at=Max("updated_at")
+        ).values("count", "updated_at")
+        return rows[0]
 
     async def get_user_names_only(self) -> list[dict]:
         """사용자 이름만 조회 (values 최적화)"""
         return await User.all().values("id", "name")
+
+    async def insert_users_batch(self, rows: list[tuple[str, str]]) -> list[str]:
+        """(name, email) 배치 삽입, email 중복 행은 건너뛰고 삽입된 email 목록 반환
+
+        PostgreSQL 은 COPY(copy_records_to_table)로 임시 테이블에 적재한 뒤
+        INSERT ... SELECT ... ON CONFLICT 로 옮기고, 그 외(SQLite)는 다중 행
+        INSERT ... ON CONFLICT 를 사용한다.
+        """
+        if not rows:
+            return []
+
+        # raw SQL 쓰기는 라우터를 거치지 않으므로 primary 로 직접 보내고 기록
+        conn = connections.get(PRIMARY_CONNECTION)
+        mark_write()
+        if conn.capabilities.dialect == "postgres":
+            return await self._copy_users_batch(conn, rows)
+
+        inserted: list[str] = []
+        # SQLite 바인드 변수 수 제한을 넘지 않도록 문장 단위로 나눔
+        for start in range(0, len(rows), SQLITE_ROWS_PER_INSERT):
+            chunk = rows[start : start + SQLITE_ROWS_PER_INSERT]
+            values_sql = ",".join(
+                ["(?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"] * len(chunk)
+            )
+            _, result = await conn.execute_query(
+                'INSERT INTO "users" ("name", "email", "created_at", "updated_at") '
+                f"VALUES {values_sql} "
+                'ON CONFLICT ("email") DO NOTHING RETURNING "email"',
+                [value for row in chunk for value in row],
+            )
+            inserted += [row[0] for row in result]
+        return inserted
+
+    async def _copy_users_batch(self, conn, rows: list[tuple[str, str]]) -> list[str]:
+        async with conn.acquire_connection() as raw, raw.transaction():
+            await raw.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS "users_ingest" '
+                '("name" VARCHAR(100), "email" VARCHAR(100)) ON COMMIT DELETE ROWS'
+            )
+            await raw.copy_records_to_table(
+                "users_ingest", records=rows, columns=["name", "email"]
+            )
+            result = await raw.fetch(
+                'INSERT INTO "users" ("name", "email", "created_at", "updated_at") '
+                'SELECT "name", "email", now(), now() FROM "users_ingest" '
+                'ON CONFLICT ("email") DO NOTHING RETURNING "email"'
+            )
+        return [row["email"] for row in result]
@@ -0,0 +1,21 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    """검색 결과 한 건 (댓글은 title 이 없고 post_id 가 소속 게시글)"""
+
+    kind: Literal["post", "comment"]
+    id: int
+    post_id: int
+    user_id: int
+    title: str | None
+    excerpt: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    message: str
+    hits: list[SearchHit]
+    next_offset: int | None = None
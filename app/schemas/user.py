@@ -1 +1,113 @@
 # Pydantic 스키마
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class UserCreate(BaseModel):
+    """사용자 생성 입력"""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+    name: str = Field(min_length=1, max_length=100)
+    email: str = Field(min_length=3, max_length=100, pattern=r"^[^@\s]+@[^@\s]+$")
+
+
+class UserOut(BaseModel):
+    """사용자 기본 정보"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: str
+
+
+class UserNameOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class UserPostCount(UserOut):
+    post_count: int
+
+
+class PostSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+
+
+class UserWithPosts(UserOut):
+    posts: list[PostSummary]
+
+
+class CommentAuthor(BaseModel):
+    id: int
+    name: str
+
+
+class CommentOut(BaseModel):
+    id: int
+    content: str
+    created_at: datetime
+    author: CommentAuthor
+
+
+class PostThread(BaseModel):
+    """게시글과 최근 댓글 (comment_count 는 잘리기 전 전체 댓글 수)"""
+
+    id: int
+    title: str
+    content: str
+    created_at: datetime
+    comment_count: int
+    comments: list[CommentOut]
+
+
+class UserThreadsResponse(UserOut):
+    posts: list[PostThread]
+    has_more_posts: bool
+
+
+class UserListResponse(BaseModel):
+    message: str
+    users: list[UserOut]
+    next_cursor: str | None = None
+
+
+class UserProjectionResponse(BaseModel):
+    """fields= 로 선택한 컬럼만 담은 목록"""
+
+    message: str
+    users: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+class UserNamesResponse(BaseModel):
+    message: str
+    names: list[UserNameOut]
+
+
+class UserPostCountResponse(BaseModel):
+    message: str
+    stats: list[UserPostCount]
+
+
+class BulkCreatedUser(BaseModel):
+    """bulk_create 결과 (한 번의 INSERT 라 DB 에 따라 id 가 채워지지 않음)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int | None = None
+    name: str
+    email: str
+
+
+class BulkCreateResponse(BaseModel):
+    message: str
+    users: list[BulkCreatedUser]
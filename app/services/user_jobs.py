@@ -0,0 +1,97 @@
+"""사용자 관련 백그라운드 작업 핸들러 (app.core.jobs 에 등록)
+
+모두 처음부터 다시 실행해도 안전하다 (적재는 email 충돌을 건너뛰고,
+backfill/내보내기는 결과를 덮어쓴다).
+"""
+
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.export import encode_export
+from app.core.jobs import JobContext, job_handler
+from app.models import Job, User
+from app.repositories.cached_user_repository import CachedUserRepository
+from app.services.user_service import UserIngestService
+
+BULK_CREATE_JOB = "users.bulk_create"
+BACKFILL_POST_COUNT_JOB = "users.backfill_post_count"
+EXPORT_JOB = "users.export"
+
+EXPORT_EXTENSIONS = {"ndjson": "ndjson", "json": "json"}
+
+
+def _repository() -> CachedUserRepository:
+    # 요청과 같은 캐시를 무효화하도록 API 와 같은 리포지토리 사용
+    return CachedUserRepository(cache)
+
+
+def export_path(job_id: int, export_format: str) -> Path:
+    return Path(settings.job_output_dir) / (
+        f"users-export-{job_id}.{EXPORT_EXTENSIONS[export_format]}"
+    )
+
+
+@job_handler(BULK_CREATE_JOB)
+async def bulk_create_users(job: Job, context: JobContext) -> dict:
+    """payload.users 를 배치 단위로 적재 (보고서 형식은 /users/bulk/ingest 와 같음)"""
+    rows = job.payload["users"]
+    batch_size = job.payload.get("batch_size") or settings.ingest_batch_size
+    await context.set_progress(0, len(rows))
+
+    async def numbered_rows() -> AsyncIterator[tuple[int, dict | str]]:
+        for row_no, row in enumerate(rows, start=1):
+            yield row_no, row if isinstance(row, dict) else "Row must be a JSON object"
+            if row_no % batch_size == 0:
+                await context.set_progress(row_no)
+
+    report = await UserIngestService(_repository(), batch_size).ingest(numbered_rows())
+    await context.set_progress(len(rows))
+    return report
+
+
+@job_handler(BACKFILL_POST_COUNT_JOB)
+async def backfill_post_count(job: Job, context: JobContext) -> dict:
+    """users.post_count 재계산 (scripts/backfill_post_count.py 와 같음)"""
+    updated = await _repository().backfill_post_counts()
+    await context.set_progress(updated, updated)
+    return {"updated": updated}
+
+
+@job_handler(EXPORT_JOB)
+async def export_users(job: Job, context: JobContext) -> dict:
+    """사용자 전체를 파일로 내보내기 (완료 후 /jobs/{id}/download 로 받음)"""
+    export_format = job.payload.get("format", "ndjson")
+    batch_size = job.payload.get("batch_size", 1000)
+    path = export_path(job.id, export_format)
+    partial = path.with_suffix(path.suffix + ".part")
+    await run_in_threadpool(path.parent.mkdir, parents=True, exist_ok=True)
+
+    rows = 0
+    await context.set_progress(0, await User.all().count())
+
+    async def counted_batches() -> AsyncIterator[list[dict]]:
+        nonlocal rows
+        async for batch in _repository().iter_users(batch_size=batch_size):
+            yield batch
+            rows += len(batch)
+            await context.set_progress(rows)
+
+    # 파일 쓰기는 스레드 풀에서 (이벤트 루프 블로킹 방지), 완료 후 이름 변경
+    file = await run_in_threadpool(open, partial, "wb")
+    try:
+        async for chunk in encode_export(counted_batches(), export_format):
+            await run_in_threadpool(file.write, chunk)
+    finally:
+        await run_in_threadpool(file.close)
+    await run_in_threadpool(os.replace, partial, path)
+
+    return {
+        "format": export_format,
+        "rows": rows,
+        "bytes": path.stat().st_size,
+    }
@@ -1 +1,162 @@
 # 비즈니스 로직 계층
+import csv
+import json
+from collections import Counter
+from collections.abc import AsyncIterator
+
+from pydantic import ValidationError
+
+from app.repositories.user_repository import UserRepository
+from app.schemas.user import UserCreate
+
+# 응답에 담는 오류 행 수 상한 (전체 개수는 별도로 집계)
+MAX_REPORTED_ERRORS = 100
+INVALID_UTF8 = "Line is not valid UTF-8"
+
+
+def _decode_line(line: bytes) -> str | None:
+    """UTF-8 로 디코딩 (실패 시 None, 파서가 해당 줄을 오류 행으로 보고)"""
+    try:
+        return line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return None
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, str | None]]:
+    """바이트 청크 스트림을 (줄 번호, 줄) 로 분할 (청크 경계에 걸친 줄도 처리)
+
+    UTF-8 이 아닌 줄은 None 으로 넘겨, 앞서 적재한 배치와 무관하게 그 줄만 오류 처리한다.
+    """
+    # 아직 끝나지 않은 줄의 조각 (긴 줄도 줄이 끝날 때 한 번만 이어 붙임)
+    parts: list[bytes] = []
+    line_no = 0
+    async for chunk in chunks:
+        *lines, rest = chunk.split(b"\n")
+        if lines:
+            parts.append(lines[0])
+            lines[0] = b"".join(parts)
+            parts = []
+            for line in lines:
+                line_no += 1
+                yield line_no, _decode_line(line)
+        if rest:
+            parts.append(rest)
+    if parts:
+        yield line_no + 1, _decode_line(b"".join(parts))
+
+
+async def iter_ndjson_rows(
+    lines: AsyncIterator[tuple[int, str | None]],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """NDJSON 한 줄 = 한 행 (파싱 실패 시 오류 메시지)"""
+    async for line_no, line in lines:
+        if line is None:
+            yield line_no, INVALID_UTF8
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_no, f"Invalid JSON: {exc.msg}"
+            continue
+        yield line_no, row if isinstance(row, dict) else "Row must be a JSON object"
+
+
+async def iter_csv_rows(
+    lines: AsyncIterator[tuple[int, str | None]],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """헤더가 있는 CSV (따옴표 안 줄바꿈 포함 레코드는 여러 줄을 모아 파싱)"""
+    header: list[str] | None = None
+    pending: list[str] = []
+    start_line = 0
+    async for line_no, line in lines:
+        if line is None:
+            # 모으던 레코드도 함께 버림 (레코드 시작 줄로 보고)
+            yield (start_line if pending else line_no), INVALID_UTF8
+            pending = []
+            continue
+        if not pending:
+            start_line = line_no
+        pending.append(line)
+        record = "\n".join(pending)
+        if record.count('"') % 2:
+            continue  # 닫히지 않은 따옴표 필드
+        pending = []
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start_line, dict(zip(header, values, strict=True))
+
+    if pending:
+        yield start_line, "Unterminated quoted field"
+
+
+class UserIngestService:
+    """스트리밍 대량 적재: 행 단위 검증 후 batch_size 단위로 DB 에 적재"""
+
+    def __init__(self, repo: UserRepository, batch_size: int):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    async def ingest(self, rows: AsyncIterator[tuple[int, dict | str]]) -> dict:
+        report = {
+            "received": 0,
+            "inserted": 0,
+            "conflicts": 0,
+            "invalid": 0,
+            "batches": [],
+            "errors": [],
+        }
+        batch: list[tuple[str, str]] = []
+
+        async for line_no, row in rows:
+            report["received"] += 1
+            error = row if isinstance(row, str) else None
+            if error is None:
+                try:
+                    user = UserCreate.model_validate(row)
+                except ValidationError as exc:
+                    error = "; ".join(
+                        f"{'.'.join(map(str, e['loc']))}: {e['msg']}"
+                        for e in exc.errors()
+                    )
+                else:
+                    batch.append((user.name, user.email))
+
+            if error is not None:
+                report["invalid"] += 1
+                if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                    report["errors"].append({"line": line_no, "error": error})
+
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, report)
+                batch = []
+
+        if batch:
+            await self._flush(batch, report)
+        return report
+
+    async def _flush(self, batch: list[tuple[str, str]], report: dict) -> None:
+        inserted = await self.repo.insert_users_batch(batch)
+        # 배치 안 중복 email 도 충돌로 집계
+        conflicts = Counter(email for _, email in batch) - Counter(inserted)
+        report["inserted"] += len(inserted)
+        report["conflicts"] += conflicts.total()
+        report["batches"].append(
+            {
+                "batch": len(report["batches"]) + 1,
+                "rows": len(batch),
+                "inserted": len(inserted),
+                "conflicts": sorted(conflicts.elements()),
+            }
+        )
@@ -0,0 +1,133 @@
+"""배포환경 gunicorn 설정 (uvicorn 워커 N 개)
+
+환경 변수로 조정한다.
+- WEB_CONCURRENCY: 워커 수 (기본: 사용 가능한 CPU 수)
+- GUNICORN_PRELOAD: 1 이면 마스터에서 앱을 import 한 뒤 fork (메모리 공유, 빠른 워커 기동)
+- UVICORN_LOOP / UVICORN_HTTP: auto(기본, uvloop/httptools 가 설치되어 있으면 사용),
+  asyncio/uvloop, h11/httptools
+- GUNICORN_TIMEOUT / GUNICORN_GRACEFUL_TIMEOUT / GUNICORN_KEEPALIVE (초)
+- GUNICORN_MAX_REQUESTS: 워커당 처리 요청 수 후 재시작 (0 이면 사용 안 함)
+- FORWARDED_ALLOW_IPS: X-Forwarded-For 를 믿을 프록시 IP/CIDR (쉼표 구분). uvicorn 워커가
+  이 프록시에서 온 요청만 클라이언트 주소를 헤더 값으로 바꾼다 (속도 제한의 클라이언트 키)
+
+- METRICS_MULTIPROC_DIR: 워커 메트릭 파일 디렉터리 (기본: /dev/shm 아래 마스터별 디렉터리)
+
+/metrics 의 값(요청 메트릭, 캐시, 부하 제어, 커넥션 풀)은 워커마다 집계되므로 워커가
+METRICS_MULTIPROC_DIR 에 자기 값을 주기적으로 쓰고, 스크레이프를 받은 워커가 모두
+합쳐 반환한다 (app/core/metrics_store.py). 마스터는 시작 시 디렉터리를 비우고, 종료된
+워커의 counter/histogram 을 누적해 두므로 max_requests 로 워커가 바뀌어도 값이 유지된다.
+
+DB 커넥션 풀은 워커별로 lifespan 에서 만든다 (fork 이후). 워커 수 x DB_POOL_MAX_SIZE
+가 DB 의 max_connections 를 넘지 않게 잡는다.
+
+무중단 재시작: 마스터에 SIGHUP 을 보내면 새 워커를 띄운 뒤 기존 워커를
+graceful_timeout 안에 종료한다. GUNICORN_PRELOAD=1 이면 코드가 마스터에 로드되어
+있으므로 새 코드 반영에는 SIGUSR2(새 마스터 기동) 후 이전 마스터에 SIGQUIT 을 보낸다.
+"""
+
+import os
+import shutil
+import tempfile
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:
+    from uvicorn.workers import UvicornWorker
+
+
+def _available_cpus() -> int:
+    # 컨테이너 cpuset 제한을 반영 (os.cpu_count 는 호스트 전체 CPU 수)
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """이벤트 루프/HTTP 파서를 환경 변수로 고를 수 있는 uvicorn 워커"""
+
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "loop": os.getenv("UVICORN_LOOP", "auto"),
+        "http": os.getenv("UVICORN_HTTP", "auto"),
+    }
+
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+# 비동기 워커는 워커 하나가 CPU 코어 하나를 채우므로 CPU 수만큼 (2*CPU+1 은 동기 워커 기준)
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus()))
+worker_class = TunedUvicornWorker
+preload_app = _env_bool("GUNICORN_PRELOAD")
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# 메모리 누수 대비 주기적 워커 교체 (jitter 로 동시 재시작 방지)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = max_requests // 10
+
+# 워커 간 메트릭 합산 (앱 설정 metrics_multiproc_dir 로 전달, 마스터 pid 로 실행마다 분리)
+os.environ.setdefault(
+    "METRICS_MULTIPROC_DIR",
+    os.path.join(
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+        f"app-metrics-{os.getpid()}",
+    ),
+)
+
+# 앞단 프록시(nginx)가 보낸 X-Forwarded-For 만 신뢰 (그 외 요청의 헤더는 무시)
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1,::1")
+
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+# 워커 하트비트 파일을 디스크 대신 메모리에 (컨테이너 overlayfs 에서 블로킹 방지)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def on_starting(server):
+    from app.core.metrics_store import MetricsStore
+
+    MetricsStore(os.environ["METRICS_MULTIPROC_DIR"]).clear()
+    server.log.info(
+        "Starting %d %s workers (preload=%s, loop=%s, http=%s)",
+        server.cfg.workers,
+        TunedUvicornWorker.__name__,
+        server.cfg.preload_app,
+        TunedUvicornWorker.CONFIG_KWARGS["loop"],
+        TunedUvicornWorker.CONFIG_KWARGS["http"],
+    )
+
+
+def post_fork(server, worker):
+    """fork 직후: 마스터에서 물려받은 DB 상태를 버리고 워커 lifespan 이 새로 초기화"""
+    from tortoise import Tortoise, connections
+
+    if Tortoise._inited:
+        # 소켓은 부모와 공유되므로 닫지 않고 참조만 버림 (닫으면 부모 커넥션도 끊김)
+        connections._clear_storage()
+        Tortoise._inited = False
+
+    from app.core.db_pool import pool_registry
+
+    pool_registry.clear()
+    worker.log.debug("Worker %s forked, DB is initialized in lifespan", worker.pid)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 counter/histogram 을 합산 archive 로 옮김 (마스터에서 실행)"""
+    from app.core.metrics_store import MetricsStore
+
+    MetricsStore(os.environ["METRICS_MULTIPROC_DIR"]).archive(worker.pid)
+
+
+def on_exit(server):
+    """마스터 종료 시 워커 메트릭 파일 정리"""
+    shutil.rmtree(os.environ["METRICS_MULTIPROC_DIR"], ignore_errors=True)
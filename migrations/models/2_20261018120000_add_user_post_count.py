@@ -0,0 +1,14 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD "post_count" INT NOT NULL DEFAULT 0;
+        UPDATE "users" SET "post_count" = (
+    SELECT COUNT(*) FROM "posts" WHERE "posts"."user_id" = "users"."id"
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" DROP COLUMN "post_count";"""
@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_posts_created_a1aafc" ON "posts" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_posts_user_id_0499f5" ON "posts" ("user_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_comments_created_34e3bf" ON "comments" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_comments_post_id_019422" ON "comments" ("post_id");
+        CREATE INDEX IF NOT EXISTS "idx_comments_user_id_d0d99f" ON "comments" ("user_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_comments_user_id_d0d99f";
+        DROP INDEX IF EXISTS "idx_comments_post_id_019422";
+        DROP INDEX IF EXISTS "idx_comments_created_34e3bf";
+        DROP INDEX IF EXISTS "idx_posts_user_id_0499f5";
+        DROP INDEX IF EXISTS "idx_posts_created_a1aafc";"""
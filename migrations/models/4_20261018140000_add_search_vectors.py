@@ -0,0 +1,45 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "posts" ADD COLUMN IF NOT EXISTS "search_vector" tsvector;
+        ALTER TABLE "comments" ADD COLUMN IF NOT EXISTS "search_vector" tsvector;
+        UPDATE "posts" SET "search_vector" =
+            setweight(to_tsvector('simple', coalesce("title", '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce("content", '')), 'B');
+        UPDATE "comments" SET "search_vector" = to_tsvector('simple', coalesce("content", ''));
+        CREATE INDEX IF NOT EXISTS "idx_posts_search_vector" ON "posts" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_comments_search_vector" ON "comments" USING GIN ("search_vector");
+        CREATE OR REPLACE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(NEW.content, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        CREATE OR REPLACE FUNCTION comments_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('simple', coalesce(NEW.content, ''));
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        CREATE TRIGGER "posts_search_vector_trigger"
+            BEFORE INSERT OR UPDATE OF "title", "content" ON "posts"
+            FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update();
+        CREATE TRIGGER "comments_search_vector_trigger"
+            BEFORE INSERT OR UPDATE OF "content" ON "comments"
+            FOR EACH ROW EXECUTE FUNCTION comments_search_vector_update();"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "comments_search_vector_trigger" ON "comments";
+        DROP TRIGGER IF EXISTS "posts_search_vector_trigger" ON "posts";
+        DROP FUNCTION IF EXISTS comments_search_vector_update();
+        DROP FUNCTION IF EXISTS posts_search_vector_update();
+        DROP INDEX IF EXISTS "idx_comments_search_vector";
+        DROP INDEX IF EXISTS "idx_posts_search_vector";
+        ALTER TABLE "comments" DROP COLUMN IF EXISTS "search_vector";
+        ALTER TABLE "posts" DROP COLUMN IF EXISTS "search_vector";"""
@@ -0,0 +1,28 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "jobs" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "kind" VARCHAR(50) NOT NULL,
+    "status" VARCHAR(9) NOT NULL DEFAULT 'queued',
+    "payload" JSONB NOT NULL,
+    "result" JSONB,
+    "error" TEXT,
+    "progress" INT NOT NULL DEFAULT 0,
+    "total" INT,
+    "attempts" INT NOT NULL DEFAULT 0,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "started_at" TIMESTAMPTZ,
+    "finished_at" TIMESTAMPTZ
+);
+        CREATE INDEX IF NOT EXISTS "idx_jobs_status_f35b2b" ON "jobs" ("status");
+        COMMENT ON COLUMN "jobs"."status" IS 'QUEUED: queued\\nRUNNING: running\\nSUCCEEDED: succeeded\\nFAILED: failed';
+        COMMENT ON TABLE "jobs" IS '백그라운드 작업 (재시작 후에도 남도록 DB 에 보관, app.core.jobs 가 실행)';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "jobs";"""
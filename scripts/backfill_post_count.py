@@ -0,0 +1,26 @@
+"""users.post_count 재계산 스크립트
+
+시그널이 발생하지 않는 경로(bulk_create, 쿼리셋 delete, 직접 SQL 등)로 게시글을
+적재/삭제한 뒤 실행한다.
+"""
+
+import asyncio
+
+from tortoise import Tortoise
+
+from app.database import TORTOISE_ORM
+from app.repositories.user_repository import UserRepository
+
+
+async def backfill_post_count():
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    print("Backfilling users.post_count...")
+    updated = await UserRepository().backfill_post_counts()
+    print(f"Updated {updated} users")
+
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_post_count())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""모니터링 미들웨어 요청당 오버헤드 마이크로 벤치마크
+
+app.main.read_root 하나만 등록한 앱을 세 가지 구성으로 만들어 ASGI 를 직접
+호출(HTTP 클라이언트/소켓 비용 제외)하고 요청당 평균 시간을 비교한다.
+
+- 미들웨어 없음 (기준선)
+- 이전 BaseHTTPMiddleware 구현
+- 현재 순수 ASGI 구현 (QueryMonitorMiddleware)
+- 순수 ASGI 구현 + 부하 제어 (AdmissionMiddleware: "/" 동시 실행 제한 + 속도 제한,
+  한도에 걸리지 않는 설정이므로 통과 경로 비용만 측정)
+
+사용법:
+    uv run python scripts/bench_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.admission import AdmissionController
+from app.core.metrics import MetricsRegistry
+from app.core.query_tracker import track_queries
+from app.main import read_root
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.query_monitor import QueryMonitorMiddleware
+
+
+class LegacyQueryMonitorMiddleware(BaseHTTPMiddleware):
+    """비교용: BaseHTTPMiddleware 기반 이전 구현"""
+
+    def __init__(self, app, registry: MetricsRegistry):
+        super().__init__(app)
+        self.registry = registry
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        with track_queries() as query_stats:
+            response = await call_next(request)
+        process_time = time.time() - start_time
+
+        route = request.scope.get("route")
+        self.registry.observe(
+            method=request.method,
+            route=getattr(route, "path", None),
+            status=response.status_code,
+            duration=process_time,
+            query_count=query_stats.count,
+            db_time=query_stats.total_time,
+        )
+        response.headers["X-Process-Time"] = str(process_time)
+        response.headers["X-Query-Count"] = str(query_stats.count)
+        response.headers["X-DB-Time"] = f"{query_stats.total_time:.6f}"
+        response.headers["X-Query-Max-Repeat"] = str(query_stats.max_repeat)
+        return response
+
+
+def build_app(middleware_class=None, admission: bool = False) -> FastAPI:
+    app = FastAPI()
+    app.get("/")(read_root)
+    if admission:
+        controller = AdmissionController(
+            {"GET /": 100},
+            max_queue=100,
+            queue_timeout=1.0,
+            rate_limit=1e9,
+            rate_burst=1_000_000,
+        )
+        app.add_middleware(AdmissionMiddleware, controller=controller)
+    if middleware_class is not None:
+        app.add_middleware(middleware_class, registry=MetricsRegistry())
+    return app
+
+
+async def run_requests(app, requests: int) -> float:
+    """요청당 평균 시간 (마이크로초)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # 워밍업 (미들웨어 스택 빌드, 라우트 컴파일 등)
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter_ns()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter_ns() - start) / requests / 1000
+
+
+async def main(requests: int, rounds: int) -> None:
+    variants = {
+        "미들웨어 없음": build_app(),
+        "BaseHTTPMiddleware (이전)": build_app(LegacyQueryMonitorMiddleware),
+        "순수 ASGI (현재)": build_app(QueryMonitorMiddleware),
+        "순수 ASGI + 부하 제어": build_app(QueryMonitorMiddleware, admission=True),
+    }
+
+    results = {}
+    for name, app in variants.items():
+        # 여러 라운드 중 최솟값 사용 (노이즈 제거)
+        results[name] = min([await run_requests(app, requests) for _ in range(rounds)])
+
+    baseline = results["미들웨어 없음"]
+    print(f"read_root 요청 {requests}회 x {rounds}라운드 (최솟값)")
+    print("=" * 60)
+    for name, per_request in results.items():
+        overhead = per_request - baseline
+        print(f"{name:28s} {per_request:8.1f}µs/req  오버헤드 {overhead:+7.1f}µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    # 요청 로그 비용은 측정에서 제외
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.requests, args.rounds))
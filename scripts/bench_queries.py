@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""리포지토리 조회 CPU 비용 벤치마크 (ORM QuerySet vs 컴파일된 SQL)
+
+같은 조회를 두 경로로 반복해 호출당 CPU 시간(process_time)을 비교한다.
+
+- 쿼리 생성: QuerySet 생성 + 조건 해석 + SQL 문자열 생성 / 캐시된 SQL 에 값 바인딩
+  (DB 를 실행하지 않으므로 순수하게 쿼리 생성 비용)
+- 전체 호출: SQLite 메모리 DB 에서 실행 + 모델 생성까지 포함 (드라이버 비용 포함)
+
+사용법:
+    uv run python scripts/bench_queries.py --calls 20000
+"""
+
+import argparse
+import asyncio
+import inspect
+import time
+
+from tortoise import Tortoise, connections
+
+from app.repositories.user_repository import USER_BY_ID, USERS_PAGE_AFTER
+
+
+def orm_sql(queryset) -> tuple[str, list]:
+    queryset._choose_db_if_not_chosen()
+    queryset._make_query()
+    return queryset.query.get_parameterized_sql()
+
+
+async def measure(fn, calls: int) -> float:
+    """호출당 CPU 시간 (마이크로초)"""
+    start = time.process_time()
+    for i in range(1, calls + 1):
+        result = fn(i)
+        if inspect.isawaitable(result):
+            await result
+    return (time.process_time() - start) / calls * 1_000_000
+
+
+async def run(args) -> None:
+    from app.models import Post, User
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["app.models"]})
+    await Tortoise.generate_schemas()
+    users = [User(name=f"User {i}", email=f"user{i}@example.com") for i in range(100)]
+    await User.bulk_create(users)
+    await Post.bulk_create(
+        [Post(title=f"Post {i}", content="c", user_id=i % 100 + 1) for i in range(300)]
+    )
+    conn = connections.get("default")
+
+    cases = {
+        "get_user_by_id": (
+            lambda i: orm_sql(User.filter(id=i % 100 + 1).limit(1)),
+            lambda i: USER_BY_ID.bind(conn, user_id=i % 100 + 1),
+            lambda i: User.filter(id=i % 100 + 1).first(),
+            lambda i: USER_BY_ID.first(user_id=i % 100 + 1),
+        ),
+        "users page": (
+            lambda i: orm_sql(User.filter(id__gt=i % 50).order_by("id").limit(21)),
+            lambda i: USERS_PAGE_AFTER.bind(conn, after_id=i % 50, limit=21),
+            lambda i: User.filter(id__gt=i % 50).order_by("id").limit(21),
+            lambda i: USERS_PAGE_AFTER.all(after_id=i % 50, limit=21),
+        ),
+    }
+
+    print(f"{'조회':<16}{'단계':<10}{'ORM(us)':>10}{'컴파일(us)':>12}{'배율':>8}")
+    for name, (orm_build, compiled_build, orm_call, compiled_call) in cases.items():
+        for stage, orm, compiled, calls in (
+            ("쿼리 생성", orm_build, compiled_build, args.calls),
+            ("전체 호출", orm_call, compiled_call, args.calls // 10),
+        ):
+            # 첫 호출(컴파일, TypeAdapter 등 초기화)은 제외
+            await measure(orm, 10)
+            await measure(compiled, 10)
+            orm_us = await measure(orm, calls)
+            compiled_us = await measure(compiled, calls)
+            print(
+                f"{name:<16}{stage:<10}{orm_us:>10.1f}{compiled_us:>12.1f}"
+                f"{orm_us / compiled_us:>7.1f}x"
+            )
+
+    await Tortoise.close_connections()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="ORM vs 컴파일된 SQL CPU 비용")
+    parser.add_argument("--calls", type=int, default=20000, help="쿼리 생성 반복 수")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
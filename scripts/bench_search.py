@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""전문 검색 벤치마크
+
+대량 데이터에서 역색인 검색(SearchRepository: PostgreSQL GIN/tsvector, SQLite FTS5)과
+색인 없는 부분 문자열 검색(icontains, LIKE '%단어%' 스캔)의 지연시간을 비교한다.
+
+- 흔한 단어/두 단어: create_test_data.py 의 단어 목록에서 고름. 대부분의 게시글이
+  일치하므로 LIKE 는 LIMIT 만큼 찾으면 멈추지만, 역색인 검색은 관련도 정렬을 위해
+  일치하는 행을 모두 점수화한다
+- 드문 단어/결과 없음: 몇 개 게시글에만 심은 단어와 없는 단어. LIKE 는 테이블 전체를
+  읽어야 하고 역색인은 색인에서 바로 찾는다
+
+--db-url 을 주지 않으면 임시 SQLite 파일에 create_test_data.py 로 데이터를 생성한다.
+
+사용법:
+    uv run python scripts/bench_search.py --users 20000 --rounds 20
+    # 이미 데이터가 있는 DB (마이그레이션 4번 적용 상태)
+    uv run python scripts/bench_search.py --db-url postgres://user:pw@localhost/bench
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark import percentile
+from create_test_data import WORDS, create_test_data
+from create_test_data import parse_args as parse_seed_args
+from tortoise import Tortoise, connections
+from tortoise.expressions import Q
+
+from app.core.search import install_search_schema, search_terms
+from app.database import TORTOISE_ORM
+from app.repositories.search_repository import SearchRepository
+
+# 생성 데이터에 없는 단어를 게시글 몇 개에만 심어 선택도가 낮은 검색을 재현
+NEEDLE = "zyzzyva"
+
+# 단어 빈도는 목록 앞쪽일수록 높다 (create_test_data.random_text)
+QUERIES = {
+    "흔한 단어": WORDS[0],
+    "두 단어": f"{WORDS[1]} {WORDS[len(WORDS) // 2]}",
+    "드문 단어": NEEDLE,
+    "결과 없음": "nonexistent",
+}
+
+
+async def plant_needles(count: int) -> None:
+    from app.models import Post, User
+
+    if await Post.filter(content__contains=NEEDLE).exists():
+        return
+    user_ids = await User.all().order_by("id").limit(count).values_list("id", flat=True)
+    for i, user_id in enumerate(user_ids):
+        await Post.create(title=f"Needle {i}", content=NEEDLE, user_id=user_id)
+
+
+async def indexed_search(query: str, limit: int) -> int:
+    hits, _ = await SearchRepository().search(search_terms(query), limit=limit)
+    return len(hits)
+
+
+async def substring_search(query: str, limit: int) -> int:
+    """색인 없이 제목/본문 부분 일치 (게시글만, 관련도 없이 최신순)"""
+    from app.models import Post
+
+    condition = Q()
+    for term in search_terms(query):
+        condition &= Q(title__icontains=term) | Q(content__icontains=term)
+    rows = await Post.filter(condition).order_by("-id").limit(limit).values("id")
+    return len(rows)
+
+
+async def measure(search, query: str, limit: int, rounds: int) -> dict:
+    latencies = []
+    hits = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hits = await search(query, limit)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "hits": hits,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+    }
+
+
+async def run(args) -> None:
+    db_url = args.db_url
+    workdir = None
+    if db_url is None:
+        workdir = tempfile.TemporaryDirectory()
+        db_url = f"sqlite://{Path(workdir.name) / 'search.sqlite3'}"
+        await create_test_data(
+            parse_seed_args(
+                [
+                    "--db-url",
+                    db_url,
+                    "--generate-schemas",
+                    "--users",
+                    str(args.users),
+                    "--posts-mean",
+                    str(args.posts_mean),
+                    "--comments-mean",
+                    str(args.comments_mean),
+                ]
+            )
+        )
+
+    try:
+        await Tortoise.init(config={**TORTOISE_ORM, "connections": {"default": db_url}})
+        await install_search_schema(connections.get("default"))
+        await plant_needles(args.needles)
+        print(f"\n{'검색어':<24}{'방식':<12}{'결과':>6}{'p50(ms)':>10}{'p95(ms)':>10}")
+        for name, query in QUERIES.items():
+            for label, search in (
+                ("역색인", indexed_search),
+                ("icontains", substring_search),
+            ):
+                result = await measure(search, query, args.limit, args.rounds)
+                print(
+                    f"{name + ' ' + repr(query):<24}{label:<12}{result['hits']:>6}"
+                    f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+                )
+    finally:
+        await Tortoise.close_connections()
+        if workdir is not None:
+            workdir.cleanup()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="전문 검색 벤치마크")
+    parser.add_argument("--db-url", help="기존 DB (없으면 임시 SQLite 에 데이터 생성)")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--posts-mean", type=float, default=5)
+    parser.add_argument("--comments-mean", type=float, default=3)
+    parser.add_argument("--needles", type=int, default=5, help="드문 단어 게시글 수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--rounds", type=int, default=20)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
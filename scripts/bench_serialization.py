@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""사용자 목록 JSON 직렬화 벤치마크
+
+ORM User 객체 N 개(기본 10만)를 응답 바이트로 만드는 세 가지 경로를 비교한다.
+
+- 이전 방식: dict 리스트 컴프리헨션 → jsonable_encoder → JSONResponse(json.dumps)
+- response_model: FastAPI 가 스키마 검증/직렬화 후 JSONResponse(json.dumps)
+- model_response: TypeAdapter 로 검증 + JSON 직렬화를 pydantic-core 에서 한 번에
+
+DB 는 사용하지 않는다 (모델 메타데이터를 위해 SQLite 메모리로 Tortoise 만 초기화).
+
+사용법:
+    uv run python scripts/bench_serialization.py --users 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi._compat import ModelField
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from pydantic.fields import FieldInfo
+from tortoise import Tortoise
+
+from app.core.responses import dump_json
+from app.schemas.user import UserListResponse
+
+
+def build_users(count: int) -> list:
+    from app.models import User
+
+    return [
+        User._init_from_db(
+            id=i,
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            post_count=i % 10,
+            created_at=None,
+            updated_at=None,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def legacy(users: list) -> bytes:
+    content = {
+        "message": "Users",
+        "users": [{"id": u.id, "name": u.name, "email": u.email} for u in users],
+        "next_cursor": None,
+    }
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+async def response_model(users: list, field: ModelField) -> bytes:
+    content = await serialize_response(
+        field=field,
+        response_content={"message": "Users", "users": users, "next_cursor": None},
+    )
+    return JSONResponse(content).body
+
+
+def pydantic_core(users: list) -> bytes:
+    return dump_json(
+        UserListResponse, {"message": "Users", "users": users, "next_cursor": None}
+    )
+
+
+async def measure(fn, rounds: int) -> tuple[float, int]:
+    """rounds 번 중 최소 시간(초)과 출력 크기"""
+    best = float("inf")
+    size = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        body = fn()
+        if asyncio.iscoroutine(body):
+            body = await body
+        best = min(best, time.perf_counter() - start)
+        size = len(body)
+    return best, size
+
+
+async def main(count: int, rounds: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["app.models"]},
+    )
+    try:
+        users = build_users(count)
+        field = ModelField(
+            name="Response_get_users",
+            field_info=FieldInfo(annotation=UserListResponse),
+            mode="serialization",
+        )
+        variants = {
+            "jsonable_encoder (이전)": lambda: legacy(users),
+            "response_model": lambda: response_model(users, field),
+            "TypeAdapter.dump_json (현재)": lambda: pydantic_core(users),
+        }
+
+        print(f"사용자 {count:,}명 직렬화, {rounds}라운드 중 최솟값")
+        print("=" * 60)
+        baseline = None
+        for name, fn in variants.items():
+            elapsed, size = await measure(fn, rounds)
+            baseline = baseline or elapsed
+            print(
+                f"{name:30s} {elapsed * 1000:8.1f}ms  {size / 1e6:5.1f}MB  "
+                f"x{baseline / elapsed:.1f}"
+            )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.rounds))
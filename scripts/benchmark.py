@@ -1,83 +1,260 @@
 #!/usr/bin/env python3
-"""API 성능 벤치마크 스크립트"""
+"""API 부하 벤치마크 스크립트
 
+엔드포인트별로 동시 요청을 보내 처리량(req/s), 지연시간 p50/p95/p99, 요청당 쿼리
+수(X-Query-Count)를 측정한다. 결과를 JSON 기준선으로 저장하고, 다음 실행에서
+기준선 대비 회귀가 임계값을 넘으면 종료 코드 1 로 실패한다.
+
+사용법:
+    # 실행 중인 서버 대상
+    uv run python scripts/benchmark.py --url http://localhost:8000 -c 20 -n 500
+
+    # 프로세스 내 ASGI 앱 대상 (SQLite 메모리 DB 에 데이터 생성)
+    uv run python scripts/benchmark.py --in-process --seed-users 1000
+
+    # 기준선 저장 / 비교
+    uv run python scripts/benchmark.py --in-process --save-baseline bench.json
+    uv run python scripts/benchmark.py --in-process --compare bench.json --threshold 0.2
+"""
+
+import argparse
 import asyncio
+import json
+import math
+import sys
 import time
-from statistics import mean, median
+from statistics import mean
+
+import httpx
+
+DEFAULT_ENDPOINTS = {
+    "사용자 페이지 (쿼리 1개)": "/api/v1/users/?optimized=false",
+    "사용자 페이지 + posts/profile prefetch (쿼리 3개)": "/api/v1/users/?optimized=true",
+    "사용자 상세 (게시글 포함)": "/api/v1/users/1?with_posts=true",
+    "사용자별 게시글 수": "/api/v1/users/stats/post-count",
+    "사용자별 게시글 수 (실시간 집계)": "/api/v1/users/stats/post-count?live=true",
+    "이름만 조회": "/api/v1/users/names-only",
+}
+
 
-import aiohttp
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank 분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
 
 
-async def measure_response_time(session, url, iterations=10):
-    """API 응답시간 측정"""
-    times = []
+async def run_endpoint(
+    client: httpx.AsyncClient, path: str, requests: int, concurrency: int
+) -> dict:
+    """path 에 requests 개 요청을 concurrency 개 워커로 보냄"""
+    latencies: list[float] = []
+    query_counts: list[int] = []
+    errors = 0
+    remaining = requests
 
-    for _ in range(iterations):
-        start_time = time.time()
-        async with session.get(url) as response:
-            await response.text()
-            end_time = time.time()
-            times.append(end_time - start_time)
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            if "x-query-count" in response.headers:
+                query_counts.append(int(response.headers["x-query-count"]))
 
-        # 요청 간 간격
-        await asyncio.sleep(0.1)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
 
+    latencies.sort()
     return {
-        "url": url,
-        "iterations": iterations,
-        "times": times,
-        "avg": mean(times),
-        "median": median(times),
-        "min": min(times),
-        "max": max(times),
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_avg": mean(latencies) if latencies else 0.0,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p95": percentile(latencies, 0.95),
+        "latency_p99": percentile(latencies, 0.99),
+        "queries_avg": mean(query_counts) if query_counts else None,
+        "queries_max": max(query_counts) if query_counts else None,
     }
 
 
-async def benchmark_apis():
-    """N+1 문제 전후 성능 비교"""
-    base_url = "http://localhost:8000/api/v1/users/"
+def compare(baseline: dict, results: dict, threshold: float) -> list[str]:
+    """기준선 대비 회귀 목록 (p95 지연/처리량/쿼리 수)"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["latency_p95"] > previous["latency_p95"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {previous['latency_p95'] * 1000:.1f}ms → "
+                f"{current['latency_p95'] * 1000:.1f}ms"
+            )
+        if current["throughput"] < previous["throughput"] * (1 - threshold):
+            regressions.append(
+                f"{name}: 처리량 {previous['throughput']:.1f} → "
+                f"{current['throughput']:.1f} req/s"
+            )
+        if (
+            current["queries_max"] is not None
+            and previous["queries_max"] is not None
+            and current["queries_max"] > previous["queries_max"]
+        ):
+            regressions.append(
+                f"{name}: 쿼리 수 {previous['queries_max']} → {current['queries_max']}"
+            )
+        if current["errors"] > previous["errors"]:
+            regressions.append(
+                f"{name}: 오류 {previous['errors']} → {current['errors']}"
+            )
+    return regressions
 
-    urls = {
-        "N+1 문제 (최적화 없음)": f"{base_url}?optimized=false",
-        "최적화됨 (prefetch_related)": f"{base_url}?optimized=true",
-        "사용자별 게시글 수": "http://localhost:8000/api/v1/users/stats/post-count",
-        "이름만 조회": "http://localhost:8000/api/v1/users/names-only",
-    }
 
-    async with aiohttp.ClientSession() as session:
+def print_result(name: str, result: dict) -> None:
+    print(f"📊 {name}  ({result['path']})")
+    print(
+        f"   처리량: {result['throughput']:.1f} req/s, "
+        f"오류: {result['errors']}/{result['requests']}"
+    )
+    print(
+        f"   지연: p50 {result['latency_p50'] * 1000:.2f}ms, "
+        f"p95 {result['latency_p95'] * 1000:.2f}ms, "
+        f"p99 {result['latency_p99'] * 1000:.2f}ms"
+    )
+    if result["queries_avg"] is not None:
+        print(
+            f"   쿼리 수: 평균 {result['queries_avg']:.1f}, 최대 {result['queries_max']}"
+        )
+    print()
+
+
+async def seed_in_memory_db(users: int, posts_per_user: int) -> None:
+    """프로세스 내 모드용 SQLite 메모리 DB 와 데이터 준비"""
+    from tortoise import Tortoise
+
+    from app.database import TORTOISE_ORM
+    from app.models import Post, Profile, User
+
+    config = {**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+
+    await User.bulk_create(
+        [
+            User(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                post_count=posts_per_user,
+            )
+            for i in range(1, users + 1)
+        ],
+        batch_size=1000,
+    )
+    user_ids = await User.all().order_by("id").values_list("id", flat=True)
+    await Profile.bulk_create(
+        [Profile(user_id=user_id, bio=f"Bio {user_id}") for user_id in user_ids],
+        batch_size=1000,
+    )
+    await Post.bulk_create(
+        [
+            Post(title=f"Post {j}", content="content", user_id=user_id)
+            for user_id in user_ids
+            for j in range(posts_per_user)
+        ],
+        batch_size=1000,
+    )
+
+
+async def benchmark_apis(args) -> int:
+    endpoints = (
+        {path: path for path in args.endpoint} if args.endpoint else DEFAULT_ENDPOINTS
+    )
+
+    if args.in_process:
+        from app.main import app
+
+        await seed_in_memory_db(args.seed_users, args.seed_posts)
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+    else:
+        transport = httpx.AsyncHTTPTransport(retries=0)
+        base_url = args.url
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
         print("🚀 API 성능 벤치마크 시작...")
+        print(f"   대상: {base_url}, 동시성 {args.concurrency}, 요청 {args.requests}개")
         print("=" * 60)
 
         results = {}
-        for name, url in urls.items():
-            try:
-                print(f"📊 {name} 측정 중...")
-                result = await measure_response_time(session, url, iterations=5)
-                results[name] = result
+        for name, path in endpoints.items():
+            # 워밍업 (커넥션/캐시/라우트 준비)
+            await run_endpoint(client, path, min(args.concurrency, 10), 1)
+            results[name] = await run_endpoint(
+                client, path, args.requests, args.concurrency
+            )
+            print_result(name, results[name])
 
-                print(f"   평균: {result['avg']:.4f}초")
-                print(f"   최소: {result['min']:.4f}초")
-                print(f"   최대: {result['max']:.4f}초")
-                print()
+    if args.in_process:
+        from tortoise import Tortoise
 
-            except Exception as e:
-                print(f"❌ {name} 측정 실패: {e}")
-                print()
+        await Tortoise.close_connections()
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준선 저장: {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"❌ 기준선 대비 회귀 (임계값 {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"✅ 기준선 대비 회귀 없음 (임계값 {args.threshold:.0%})")
+
+    return 0
 
-        # 비교 결과 출력
-        if (
-            "N+1 문제 (최적화 없음)" in results
-            and "최적화됨 (prefetch_related)" in results
-        ):
-            n_plus_1_time = results["N+1 문제 (최적화 없음)"]["avg"]
-            optimized_time = results["최적화됨 (prefetch_related)"]["avg"]
-            improvement = ((n_plus_1_time - optimized_time) / n_plus_1_time) * 100
 
-            print("📈 성능 개선 결과:")
-            print(f"   N+1 문제: {n_plus_1_time:.4f}초")
-            print(f"   최적화됨: {optimized_time:.4f}초")
-            print(f"   개선율: {improvement:.1f}% 향상")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 부하 벤치마크")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://localhost:8000", help="서버 주소")
+    target.add_argument(
+        "--in-process", action="store_true", help="프로세스 내 ASGI 앱 대상"
+    )
+    parser.add_argument(
+        "--endpoint", action="append", help="측정할 경로 (반복 지정, 기본: 주요 API)"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=10)
+    parser.add_argument("-n", "--requests", type=int, default=200, help="엔드포인트별")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed-users", type=int, default=200)
+    parser.add_argument("--seed-posts", type=int, default=3, help="사용자당 게시글")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)"
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    asyncio.run(benchmark_apis())
+    sys.exit(asyncio.run(benchmark_apis(parse_args())))
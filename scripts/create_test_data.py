@@ -1,51 +1,353 @@
-"""테스트 데이터 생성 스크립트"""
+"""테스트 데이터 생성 스크립트
 
+사용자/프로필/게시글/댓글을 설정한 규모와 분포로 생성한다.
+
+- 같은 --seed 면 워커 수와 상관없이 항상 같은 데이터가 생성된다
+  (배치마다 (seed, 테이블, 배치 번호) 로 난수 생성기를 만든다)
+- 사용자당 게시글 수, 게시글당 댓글 수는 로그정규 분포(--skew 로 치우침 조절)를 따른다
+- PostgreSQL 은 COPY(copy_records_to_table), SQLite 는 executemany 로 배치 적재하며
+  --workers 개 배치를 동시에 적재한다
+- id 를 직접 부여하므로 빈 테이블이 필요하다 (--truncate 로 기존 데이터 삭제)
+
+사용법:
+    uv run python scripts/create_test_data.py                    # 기본: 사용자 10명
+    uv run python scripts/create_test_data.py --users 1000000 --posts-mean 5 \\
+        --comments-mean 3 --skew 1.2 --workers 8 --truncate
+"""
+
+import argparse
 import asyncio
+import math
+import random
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
 
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
 
+from app.core.search import install_search_schema
 from app.database import TORTOISE_ORM
-from app.models import Comment, Post, Profile, User
 
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+TIME_SPAN_SECONDS = 365 * 24 * 3600
 
-async def create_test_data():
-    """N+1 문제 테스트를 위한 데이터 생성"""
-    await Tortoise.init(config=TORTOISE_ORM)
+WORDS = (
+    "fastapi tortoise orm query index cache python async database postgres "
+    "sqlite performance latency throughput prefetch batch stream cursor page "
+    "user post comment profile search rank token vector memory pool worker "
+    "request response header metric histogram benchmark profile optimize join "
+    "select insert update delete filter order limit offset count group sum "
+    "server client network socket event loop thread process schema migration "
+    "deploy docker nginx gunicorn uvicorn compress gzip json serialize model "
+    "field relation foreign key primary unique constraint trigger function"
+).split()
 
-    print("Creating test data...")
 
-    # 사용자 10명 생성
-    users = []
-    for i in range(1, 11):
-        user = await User.create(name=f"User {i}", email=f"user{i}@example.com")
-        users.append(user)
-
-        # 각 사용자마다 프로필 생성
-        await Profile.create(
-            user=user,
-            bio=f"Bio for user {i}",
-            avatar_url=f"https://example.com/avatar{i}.jpg",
-        )
+def lognormal_counts(rng: random.Random, n: int, mean: float, skew: float) -> list[int]:
+    """평균이 mean 인 로그정규 분포 정수 n 개 (skew=0 이면 모두 mean 근처)"""
+    if mean <= 0:
+        return [0] * n
+    if skew <= 0:
+        return [int(mean + rng.random()) for _ in range(n)]
+    mu = math.log(mean) - skew**2 / 2
+    return [int(rng.lognormvariate(mu, skew) + 0.5) for _ in range(n)]
+
+
+def batch_rng(seed: int, table: str, batch_no: int) -> random.Random:
+    return random.Random(f"{seed}:{table}:{batch_no}")
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    # 앞쪽 단어일수록 자주 등장 (Zipf 비슷한 분포)
+    return " ".join(WORDS[int(len(WORDS) * rng.random() ** 2)] for _ in range(words))
+
+
+def random_time(rng: random.Random) -> datetime:
+    return BASE_TIME + timedelta(seconds=rng.randrange(TIME_SPAN_SECONDS))
+
+
+class DataGenerator:
+    def __init__(self, args):
+        self.args = args
+        self.batch_size = args.batch_size
+        self.user_batches = math.ceil(args.users / self.batch_size)
 
-        # 각 사용자마다 게시글 3-5개 생성
-        for j in range(1, 4):
-            post = await Post.create(
-                title=f"Post {j} by User {i}",
-                content=f"Content of post {j} by user {i}",
-                user=user,
+        # 사용자별 게시글 수 (배치 단위 난수 → 결정적), 게시글 id 오프셋 계산용
+        self.posts_per_user: list[int] = []
+        for batch_no in range(self.user_batches):
+            rng = batch_rng(args.seed, "post_counts", batch_no)
+            size = min(self.batch_size, args.users - batch_no * self.batch_size)
+            self.posts_per_user += lognormal_counts(
+                rng, size, args.posts_mean, args.skew
             )
+        # 사용자 배치별 첫 게시글 id - 1
+        batch_totals = [
+            sum(self.posts_per_user[i : i + self.batch_size])
+            for i in range(0, args.users, self.batch_size)
+        ]
+        self.post_offsets = [0, *accumulate(batch_totals)]
+        self.total_posts = self.post_offsets[-1]
 
-            # 각 게시글마다 댓글 2-3개 생성
-            for k in range(1, 3):
-                await Comment.create(
-                    content=f"Comment {k} on post {j}",
-                    post=post,
-                    user=users[k % len(users)],  # 다른 사용자가 댓글 작성
+        # 게시글 구간별 댓글 수 합계 → 댓글 id 오프셋 (워커 순서와 무관한 id)
+        self.comment_batches = math.ceil(self.total_posts / self.batch_size)
+        comment_totals = [
+            sum(
+                self._comment_counts(
+                    batch_rng(args.seed, "comments", batch_no), batch_no
                 )
+            )
+            for batch_no in range(self.comment_batches)
+        ]
+        self.comment_offsets = [0, *accumulate(comment_totals)]
+
+    def user_batch_range(self, batch_no: int) -> range:
+        start = batch_no * self.batch_size + 1
+        return range(start, min(start + self.batch_size, self.args.users + 1))
+
+    def users(self, batch_no: int) -> list[tuple]:
+        rng = batch_rng(self.args.seed, "users", batch_no)
+        rows = []
+        for user_id in self.user_batch_range(batch_no):
+            created = random_time(rng)
+            rows.append(
+                (
+                    user_id,
+                    f"User {user_id}",
+                    f"user{user_id}@example.com",
+                    self.posts_per_user[user_id - 1],
+                    created,
+                    created,
+                )
+            )
+        return rows
+
+    def profiles(self, batch_no: int) -> list[tuple]:
+        rng = batch_rng(self.args.seed, "profiles", batch_no)
+        return [
+            (
+                user_id,
+                user_id,
+                random_text(rng, 12),
+                f"https://example.com/avatar{user_id}.jpg",
+            )
+            for user_id in self.user_batch_range(batch_no)
+            if rng.random() < self.args.profile_ratio
+        ]
+
+    def posts(self, batch_no: int) -> list[tuple]:
+        rng = batch_rng(self.args.seed, "posts", batch_no)
+        post_id = self.post_offsets[batch_no]
+        rows = []
+        for user_id in self.user_batch_range(batch_no):
+            for _ in range(self.posts_per_user[user_id - 1]):
+                post_id += 1
+                created = random_time(rng)
+                rows.append(
+                    (
+                        post_id,
+                        random_text(rng, 6),
+                        random_text(rng, self.args.content_words),
+                        created,
+                        created,
+                        user_id,
+                    )
+                )
+        return rows
+
+    def post_batch_range(self, batch_no: int) -> range:
+        start = batch_no * self.batch_size + 1
+        return range(start, min(start + self.batch_size, self.total_posts + 1))
+
+    def _comment_counts(self, rng: random.Random, batch_no: int) -> list[int]:
+        return lognormal_counts(
+            rng,
+            len(self.post_batch_range(batch_no)),
+            self.args.comments_mean,
+            self.args.skew,
+        )
 
-    print("Test data created successfully!")
+    def comments(self, batch_no: int) -> list[tuple]:
+        """게시글 id 구간 하나(batch_size 개)의 댓글"""
+        rng = batch_rng(self.args.seed, "comments", batch_no)
+        counts = self._comment_counts(rng, batch_no)
+        comment_id = self.comment_offsets[batch_no]
+        rows = []
+        for post_id, count in zip(self.post_batch_range(batch_no), counts, strict=True):
+            for _ in range(count):
+                comment_id += 1
+                rows.append(
+                    (
+                        comment_id,
+                        random_text(rng, 15),
+                        random_time(rng),
+                        post_id,
+                        rng.randint(1, self.args.users),
+                    )
+                )
+        return rows
+
+
+class Loader:
+    """dialect 별 배치 적재 (PostgreSQL: COPY, SQLite: executemany)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.is_postgres = conn.capabilities.dialect == "postgres"
+
+    async def insert(self, table: str, columns: tuple[str, ...], rows: list[tuple]):
+        if not rows:
+            return
+        if self.is_postgres:
+            async with self.conn.acquire_connection() as raw:
+                await raw.copy_records_to_table(table, records=rows, columns=columns)
+            return
+
+        rows = [
+            tuple(v.isoformat(" ") if isinstance(v, datetime) else v for v in row)
+            for row in rows
+        ]
+        column_sql = ", ".join(f'"{c}"' for c in columns)
+        placeholders = ", ".join("?" * len(columns))
+        await self.conn.execute_many(
+            f'INSERT INTO "{table}" ({column_sql}) VALUES ({placeholders})', rows
+        )
+
+    async def truncate(self):
+        if self.is_postgres:
+            await self.conn.execute_script(
+                'TRUNCATE "comments", "posts", "profiles", "users" '
+                "RESTART IDENTITY CASCADE"
+            )
+            return
+        for table in ("comments", "posts", "profiles", "users"):
+            await self.conn.execute_script(f'DELETE FROM "{table}"')
+
+    async def reset_sequences(self):
+        """id 를 직접 넣었으므로 다음 INSERT 가 충돌하지 않도록 시퀀스 이동"""
+        if not self.is_postgres:
+            return
+        for table in ("users", "profiles", "posts", "comments"):
+            await self.conn.execute_script(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f'COALESCE((SELECT MAX("id") FROM "{table}"), 0) + 1, false)'
+            )
+
+
+async def load_phase(
+    loader: Loader,
+    name: str,
+    table: str,
+    columns: tuple[str, ...],
+    batches: int,
+    make_rows: Callable[[int], list[tuple]],
+    workers: int,
+) -> None:
+    """batches 개 배치를 workers 개 워커로 동시에 적재"""
+    started = time.perf_counter()
+    total = 0
+    batch_numbers: Iterator[int] = iter(range(batches))
+
+    async def worker():
+        nonlocal total
+        for batch_no in batch_numbers:
+            rows = make_rows(batch_no)
+            await loader.insert(table, columns, rows)
+            total += len(rows)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0.0
+    print(f"  {name}: {total:,} rows in {elapsed:.1f}s ({rate:,.0f} rows/s)")
+
+
+async def create_test_data(args):
+    """설정한 규모/분포로 데이터 생성"""
+    config = TORTOISE_ORM
+    if args.db_url:
+        config = {**TORTOISE_ORM, "connections": {"default": args.db_url}}
+    await Tortoise.init(config=config)
+    if args.generate_schemas:
+        await Tortoise.generate_schemas()
+
+    loader = Loader(connections.get("default"))
+    if args.truncate:
+        await loader.truncate()
+
+    print("Creating test data...")
+    started = time.perf_counter()
+    generator = DataGenerator(args)
+    user_batches = generator.user_batches
+
+    await load_phase(
+        loader,
+        "users",
+        "users",
+        ("id", "name", "email", "post_count", "created_at", "updated_at"),
+        user_batches,
+        generator.users,
+        args.workers,
+    )
+    await load_phase(
+        loader,
+        "profiles",
+        "profiles",
+        ("id", "user_id", "bio", "avatar_url"),
+        user_batches,
+        generator.profiles,
+        args.workers,
+    )
+    await load_phase(
+        loader,
+        "posts",
+        "posts",
+        ("id", "title", "content", "created_at", "updated_at", "user_id"),
+        user_batches,
+        generator.posts,
+        args.workers,
+    )
+    await load_phase(
+        loader,
+        "comments",
+        "comments",
+        ("id", "content", "created_at", "post_id", "user_id"),
+        generator.comment_batches,
+        generator.comments,
+        args.workers,
+    )
+    await loader.reset_sequences()
+    if args.generate_schemas:
+        # 적재 후 검색 색인을 한 번에 생성 (행마다 트리거로 색인하는 것보다 빠름)
+        started_index = time.perf_counter()
+        await install_search_schema(loader.conn)
+        print(f"  search index: {time.perf_counter() - started_index:.1f}s")
+
+    print(f"Test data created successfully! ({time.perf_counter() - started:.1f}s)")
     await Tortoise.close_connections()
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="테스트 데이터 생성")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--posts-mean", type=float, default=3, help="사용자당 평균")
+    parser.add_argument("--comments-mean", type=float, default=2, help="게시글당 평균")
+    parser.add_argument(
+        "--skew", type=float, default=0.0, help="로그정규 sigma (0: 균등, 1~2: 치우침)"
+    )
+    parser.add_argument("--profile-ratio", type=float, default=1.0)
+    parser.add_argument("--content-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--db-url", help="TORTOISE_ORM 대신 사용할 DB URL")
+    parser.add_argument("--truncate", action="store_true", help="기존 데이터 삭제")
+    parser.add_argument(
+        "--generate-schemas",
+        action="store_true",
+        help="테이블 생성 (마이그레이션 없이)",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    asyncio.run(create_test_data())
+    asyncio.run(create_test_data(parse_args()))
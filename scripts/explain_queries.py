@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""저장소 쿼리 실행 계획 점검 (PostgreSQL)
+
+UserRepository / 로더의 읽기 메서드를 실제로 호출해 실행된 SELECT 를 바인드 값과
+함께 수집하고, 각각을 EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 으로 다시 실행한다.
+행 수(pg_class.reltuples)가 --min-rows 이상인 테이블의 Seq Scan 을 찾아 표시하고,
+전체 조회가 의도된 메서드(목록 전체, 집계 등)가 아닌 곳에서 발견되면 종료 코드 1.
+
+쓰기 경로(INSERT/COPY/backfill UPDATE)는 실제로 실행되므로 점검하지 않는다.
+create_test_data.py 로 데이터를 만든 로컬 PostgreSQL 을 대상으로 실행한다.
+
+사용법:
+    uv run python scripts/explain_queries.py
+    uv run python scripts/explain_queries.py --db-url postgres://user:pw@localhost:5432/db \\
+        --min-rows 5000 --verbose
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from tortoise import Tortoise, connections
+from tortoise.backends.asyncpg import AsyncpgDBClient
+
+from app.core.projection import Projection
+from app.core.query_tracker import fingerprint
+from app.database import TORTOISE_ORM
+from app.models import User
+from app.repositories.loaders import load_posts_by_user
+from app.repositories.search_repository import SearchRepository
+from app.repositories.user_repository import UserRepository
+
+PAGE_SIZE = 50
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[[], Awaitable[object]]
+    # 테이블 전체를 읽는 것이 의도된 메서드 (Seq Scan 을 실패로 보지 않음)
+    full_scan: bool = False
+
+
+@dataclass
+class CapturedQuery:
+    scenario: Scenario
+    sql: str
+    values: list = field(default_factory=list)
+
+
+@contextmanager
+def capture_selects(sink: list[tuple[str, list]]) -> Iterator[None]:
+    """asyncpg 클라이언트로 실행되는 SELECT 를 (sql, values) 로 수집"""
+    originals = {
+        name: getattr(AsyncpgDBClient, name)
+        for name in ("execute_query", "execute_query_dict")
+    }
+
+    def wrap(method):
+        async def wrapper(self, query, values=None):
+            if query.lstrip().upper().startswith("SELECT"):
+                sink.append((query, list(values or [])))
+            return await method(self, query, values)
+
+        return wrapper
+
+    for name, method in originals.items():
+        setattr(AsyncpgDBClient, name, wrap(method))
+    try:
+        yield
+    finally:
+        for name, method in originals.items():
+            setattr(AsyncpgDBClient, name, method)
+
+
+async def build_scenarios() -> list[Scenario]:
+    repo = UserRepository()
+    last_ids = await User.all().order_by("-id").limit(1).values_list("id", flat=True)
+    middle_id = (last_ids[0] if last_ids else 0) // 2
+    page_ids = list(range(middle_id, middle_id + PAGE_SIZE))
+
+    async def first_export_batch():
+        batches = repo.iter_users(batch_size=PAGE_SIZE)
+        try:
+            return await anext(batches)
+        finally:
+            await batches.aclose()
+
+    projection = Projection(
+        columns=("id", "name"),
+        relations={"posts": ("id", "title"), "profile": ("bio",)},
+    )
+
+    async def users_page_with_relations():
+        users, _ = await repo.get_users_page(PAGE_SIZE, after_id=middle_id)
+        await repo.prefetch_page_relations(users)
+
+    async def users_page_fields():
+        rows, _ = await repo.get_users_page_rows(
+            PAGE_SIZE, projection, after_id=middle_id
+        )
+        await repo.get_posts_version([row["id"] for row in rows])
+        await repo.attach_relations(rows, projection)
+
+    return [
+        Scenario("get_all_users_optimized", repo.get_all_users_optimized, True),
+        Scenario("get_users_page + prefetch_page_relations", users_page_with_relations),
+        Scenario("get_users_page_rows + attach_relations", users_page_fields),
+        Scenario("iter_users (first batch)", first_export_batch),
+        Scenario("get_user_by_id", lambda: repo.get_user_by_id(middle_id)),
+        Scenario("get_post_threads", lambda: repo.get_post_threads(middle_id, 20, 10)),
+        Scenario("search", lambda: SearchRepository().search(["query", "index"])),
+        Scenario(
+            "get_users_with_post_count", lambda: repo.get_users_with_post_count(), True
+        ),
+        Scenario(
+            "get_users_with_post_count(live)",
+            lambda: repo.get_users_with_post_count(live=True),
+            True,
+        ),
+        Scenario("get_user_names_only", repo.get_user_names_only, True),
+        Scenario("load_posts_by_user", lambda: load_posts_by_user(page_ids)),
+    ]
+
+
+async def collect_queries(scenarios: list[Scenario]) -> list[CapturedQuery]:
+    """시나리오별 SELECT 수집 (같은 SQL 형태는 처음 한 번만)"""
+    queries: list[CapturedQuery] = []
+    seen: set[str] = set()
+    for scenario in scenarios:
+        captured: list[tuple[str, list]] = []
+        with capture_selects(captured):
+            await scenario.run()
+        for sql, values in captured:
+            shape = fingerprint(sql)
+            if shape in seen:
+                continue
+            seen.add(shape)
+            queries.append(CapturedQuery(scenario, sql, values))
+    return queries
+
+
+def iter_plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from iter_plan_nodes(child)
+
+
+async def table_sizes(conn) -> dict[str, float]:
+    rows = await conn.execute_query_dict(
+        "SELECT relname, reltuples FROM pg_class "
+        "WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+    )
+    return {row["relname"]: row["reltuples"] for row in rows}
+
+
+async def explain(conn, query: CapturedQuery) -> dict:
+    rows = await conn.execute_query_dict(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query.sql}", query.values
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def main(args) -> int:
+    config = TORTOISE_ORM
+    if args.db_url:
+        config = {**TORTOISE_ORM, "connections": {"default": args.db_url}}
+        config.pop("routers", None)
+    await Tortoise.init(config=config)
+    try:
+        conn = connections.get("default")
+        if not isinstance(conn, AsyncpgDBClient):
+            print("EXPLAIN (ANALYZE, BUFFERS) 는 PostgreSQL(asyncpg) 에서만 지원합니다")
+            return 2
+
+        if not args.skip_analyze:
+            # 방금 적재한 데이터도 플래너 통계에 반영
+            await conn.execute_script("ANALYZE")
+        sizes = await table_sizes(conn)
+        queries = await collect_queries(await build_scenarios())
+
+        failures = 0
+        print(f"{len(queries)} queries, seq scan threshold {args.min_rows:,} rows")
+        print("=" * 72)
+        for query in queries:
+            plan = await explain(conn, query)
+            root = plan["Plan"]
+            seq_scans = [
+                node["Relation Name"]
+                for node in iter_plan_nodes(root)
+                if node["Node Type"] == "Seq Scan"
+                and sizes.get(node["Relation Name"], 0) >= args.min_rows
+            ]
+            if seq_scans and query.scenario.full_scan:
+                status = "FULL"
+            elif seq_scans:
+                status = "SEQ!"
+                failures += 1
+            else:
+                status = "ok"
+
+            print(
+                f"[{status:4s}] {query.scenario.name:40s} "
+                f"{plan['Execution Time']:9.2f}ms  "
+                f"hit={root.get('Shared Hit Blocks', 0)} "
+                f"read={root.get('Shared Read Blocks', 0)}"
+            )
+            if seq_scans:
+                print(f"       seq scan: {', '.join(sorted(set(seq_scans)))}")
+            if args.verbose or (seq_scans and not query.scenario.full_scan):
+                print(f"       {fingerprint(query.sql)}")
+
+        print("=" * 72)
+        if failures:
+            print(f"{failures} queries scan large tables sequentially")
+            return 1
+        print("No unexpected sequential scans")
+        return 0
+    finally:
+        await Tortoise.close_connections()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="저장소 쿼리 실행 계획 점검")
+    parser.add_argument("--db-url", help="기본: 설정의 DATABASE_URL")
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=10_000,
+        help="이 행 수 이상인 테이블의 Seq Scan 만 표시",
+    )
+    parser.add_argument(
+        "--skip-analyze", action="store_true", help="점검 전 ANALYZE 생략"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="모든 SQL 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -1,4 +1,12 @@
 #!/bin/sh
 set -e
-# aerich upgrade  # 현재는 주석 처리 (tortoise-orm 설정 후 활성화)
-uv run uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
\ No newline at end of file
+
+# exec: 셸 대신 서버가 PID 1 이 되어 SIGTERM/SIGHUP 을 직접 받음 (graceful 종료/재시작)
+if [ "${ENVIRONMENT:-development}" = "production" ]; then
+    # 스키마는 마이그레이션으로 관리 (DB_GENERATE_SCHEMAS=False), 워커 fork 전에 한 번만 실행
+    uv run aerich upgrade
+    # 워커 수/preload/루프 설정은 gunicorn.conf.py 참고
+    exec uv run --group prod gunicorn app.main:app -c gunicorn.conf.py
+else
+    exec uv run uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+fi
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from app.api.jobs import get_job_runner
+from app.core.config import settings
+from app.core.jobs import JOB_HANDLERS, JobRunner
+from app.main import app
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    """워커 없는 실행기 (테스트에서 run_job 으로 직접 실행)"""
+    monkeypatch.setattr(settings, "job_output_dir", str(tmp_path))
+    job_runner = JobRunner(workers=0, max_pending=2, stale_seconds=60)
+    app.dependency_overrides[get_job_runner] = lambda: job_runner
+    yield job_runner
+    app.dependency_overrides.pop(get_job_runner)
+
+
+async def test_bulk_create_job(client, runner):
+    """대량 생성 작업이 202 로 등록되고 실행 후 보고서/진행률을 남기는지 확인"""
+    from app.models import User
+
+    users = [{"name": f"Job {i}", "email": f"job-{i}@example.com"} for i in range(5)]
+    users.append({"name": "", "email": "invalid"})
+    response = client.post(
+        "/api/v1/jobs/users/bulk", params={"batch_size": 2}, json=users
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert response.headers["location"].endswith(f"/api/v1/jobs/{job['id']}")
+
+    assert await runner.run_job(job["id"]) is True
+    # 이미 끝난 작업은 다시 선점하지 않음
+    assert await runner.run_job(job["id"]) is False
+
+    job = client.get(f"/api/v1/jobs/{job['id']}").json()
+    assert job["status"] == "succeeded"
+    assert (job["progress"], job["total"], job["attempts"]) == (6, 6, 1)
+    assert job["result"]["inserted"] == 5
+    assert job["result"]["invalid"] == 1
+    assert await User.filter(email__startswith="job-").count() == 5
+    assert client.get("/api/v1/jobs/999999999").status_code == 404
+
+
+async def test_export_job_download_and_pending_limit(client, runner):
+    """내보내기 작업 결과 파일을 받고, 대기 작업 상한을 넘으면 503 인지 확인"""
+    from app.models import User
+
+    await User.create(name="Exported", email="exported@example.com")
+    export = client.post("/api/v1/jobs/users/export", params={"format": "ndjson"})
+    backfill = client.post("/api/v1/jobs/users/backfill-post-count")
+    assert (export.status_code, backfill.status_code) == (202, 202)
+
+    response = client.post("/api/v1/jobs/users/backfill-post-count")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "30"
+
+    export_id = export.json()["id"]
+    assert client.get(f"/api/v1/jobs/{export_id}/download").status_code == 409
+    await runner.run_job(export_id)
+
+    response = client.get(f"/api/v1/jobs/{export_id}/download")
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {"name": "Exported", "email": "exported@example.com"}.items() <= next(
+        row for row in rows if row["email"] == "exported@example.com"
+    ).items()
+    job = client.get(f"/api/v1/jobs/{export_id}").json()
+    assert job["result"]["rows"] == len(rows) == job["total"]
+    assert set(JOB_HANDLERS) >= {"users.bulk_create", "users.export"}
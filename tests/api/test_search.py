@@ -0,0 +1,83 @@
+async def test_search_ranks_title_matches_first(client):
+    """제목 일치가 본문 일치보다 앞서고 게시글/댓글이 함께 검색되는지 확인"""
+    from app.models import Comment, Post, User
+
+    user = await User.create(name="Searcher", email="searcher@example.com")
+    in_content = await Post.create(
+        title="Weekly notes", content="a quokka appeared", user=user
+    )
+    in_title = await Post.create(
+        title="Quokka sighting", content="photos inside", user=user
+    )
+    comment = await Comment.create(content="QUOKKA again!", post=in_title, user=user)
+    await Post.create(title="Unrelated", content="nothing here", user=user)
+
+    response = client.get("/api/v1/search", params={"q": "quokka"})
+    assert response.status_code == 200
+    hits = response.json()["hits"]
+    assert [(hit["kind"], hit["id"]) for hit in hits][0] == ("post", in_title.id)
+    assert {(hit["kind"], hit["id"]) for hit in hits} == {
+        ("post", in_title.id),
+        ("post", in_content.id),
+        ("comment", comment.id),
+    }
+    comment_hit = next(hit for hit in hits if hit["kind"] == "comment")
+    assert comment_hit["post_id"] == in_title.id
+    assert comment_hit["title"] is None
+
+    response = client.get("/api/v1/search", params={"q": "quokka", "scope": "posts"})
+    assert {hit["kind"] for hit in response.json()["hits"]} == {"post"}
+    # 모든 단어를 포함해야 일치
+    response = client.get("/api/v1/search", params={"q": "quokka photos"})
+    assert [hit["id"] for hit in response.json()["hits"]] == [in_title.id]
+
+
+async def test_search_index_follows_updates_and_deletes(client):
+    """트리거로 색인이 수정/삭제를 따라가는지 확인"""
+    from app.models import Post, User
+
+    user = await User.create(name="Editor", email="search-editor@example.com")
+    post = await Post.create(title="Draft", content="axolotl facts", user=user)
+
+    def found(q: str) -> list[int]:
+        response = client.get("/api/v1/search", params={"q": q, "scope": "posts"})
+        return [hit["id"] for hit in response.json()["hits"]]
+
+    assert found("axolotl") == [post.id]
+
+    post.content = "narwhal facts"
+    await post.save()
+    assert found("axolotl") == []
+    assert found("narwhal") == [post.id]
+
+    await post.delete()
+    assert found("narwhal") == []
+
+
+async def test_search_pagination_and_invalid_query(client):
+    """offset 페이지가 겹치지 않고, 단어가 없는 검색어는 400 인지 확인"""
+    from app.models import Post, User
+
+    user = await User.create(name="Pager", email="search-pager@example.com")
+    created = {
+        (await Post.create(title=f"Pangolin {i}", content="x", user=user)).id
+        for i in range(5)
+    }
+
+    seen = []
+    offset = 0
+    while offset is not None:
+        response = client.get(
+            "/api/v1/search", params={"q": "pangolin", "limit": 2, "offset": offset}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["hits"]) <= 2
+        seen += [hit["id"] for hit in body["hits"]]
+        offset = body["next_offset"]
+
+    assert sorted(seen) == sorted(created)
+    # FTS 연산자/구두점만 있는 검색어
+    assert client.get("/api/v1/search", params={"q": '"*" -'}).status_code == 400
+    response = client.get("/api/v1/search", params={"q": "pangolin OR NOT"})
+    assert response.status_code == 200
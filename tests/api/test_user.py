@@ -10,3 +10,301 @@ def test_users_endpoint_exists(client):
     response = client.get("/api/v1/users/?optimized=false")
     # 데이터베이스 연결 문제로 500이 나올 수 있지만, 엔드포인트는 존재함
     assert response.status_code in [200, 500]
+
+
+async def test_users_keyset_pagination(client):
+    """next_cursor 를 따라가면 중복/누락 없이 전체 사용자를 순회하는지 확인"""
+    from app.models import User
+
+    created = [
+        (await User.create(name=f"Page {i}", email=f"page-{i}@example.com")).id
+        for i in range(5)
+    ]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/users/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["users"]) <= 2
+        seen += [u["id"] for u in body["users"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sorted(set(seen))
+    assert set(created) <= set(seen)
+
+
+async def test_users_page_prefetch_query_count(client):
+    """optimized 페이지는 페이지 크기와 무관하게 쿼리 3개로 조회되는지 확인"""
+    from app.models import User
+
+    for i in range(3):
+        await User.create(name=f"Prefetch {i}", email=f"prefetch-{i}@example.com")
+
+    for limit in (1, 3):
+        response = client.get(
+            "/api/v1/users/", params={"optimized": True, "limit": limit}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["users"]) == limit
+        assert response.headers["X-Query-Count"] == "3"
+
+
+async def test_users_field_projection(client):
+    """fields= 로 선택한 컬럼만 반환하고 관계마다 쿼리 하나만 추가되는지 확인"""
+    from app.models import Post, Profile, User
+
+    users = [
+        await User.create(name=f"Projection {i}", email=f"projection-{i}@example.com")
+        for i in range(3)
+    ]
+    await Post.create(title="First", content="...", user=users[0])
+    await Post.create(title="Second", content="...", user=users[0])
+    await Profile.create(bio="Hello", user=users[1])
+
+    cursor = None
+    seen = {}
+    while True:
+        params = {"limit": 2, "fields": "name,posts.title,profile.bio"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/users/", params=params)
+        assert response.status_code == 200
+        # users + profile + posts 버전 집계(ETag) + posts
+        assert response.headers["X-Query-Count"] == "4"
+        body = response.json()
+        for row in body["users"]:
+            assert set(row) == {"name", "posts", "profile"}
+            seen[row["name"]] = row
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen["Projection 0"]["posts"] == [{"title": "First"}, {"title": "Second"}]
+    assert seen["Projection 0"]["profile"] is None
+    assert seen["Projection 1"] == {
+        "name": "Projection 1",
+        "posts": [],
+        "profile": {"bio": "Hello"},
+    }
+
+    response = client.get("/api/v1/users/", params={"fields": "id,email"})
+    assert response.headers["X-Query-Count"] == "1"
+    assert all(set(row) == {"id", "email"} for row in response.json()["users"])
+
+
+def test_users_unknown_field(client):
+    """허용하지 않은 필드는 400 을 반환하는지 확인"""
+    for fields in ("password", "posts.secret", "comments.id", ","):
+        response = client.get("/api/v1/users/", params={"fields": fields})
+        assert response.status_code == 400
+
+
+def test_users_invalid_cursor(client):
+    """잘못된 커서는 400 을 반환하는지 확인"""
+    response = client.get("/api/v1/users/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+async def test_export_users_streams_all_rows(client):
+    """NDJSON/JSON 내보내기가 배치 경계와 무관하게 전체 행을 내보내는지 확인"""
+    import json
+
+    from app.models import User
+
+    for i in range(5):
+        await User.create(name=f"Export {i}", email=f"export-{i}@example.com")
+    total = await User.all().count()
+
+    response = client.get("/api/v1/users/export", params={"batch_size": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == total
+    assert set(rows[0]) == {"id", "name", "email"}
+
+    response = client.get(
+        "/api/v1/users/export", params={"format": "json", "batch_size": 3}
+    )
+    assert len(response.json()) == total
+
+
+def test_names_only_route_not_shadowed(client):
+    """/users/names-only 가 /users/{user_id} 에 가로채이지 않는지 확인"""
+    response = client.get("/api/v1/users/names-only")
+    assert response.status_code == 200
+    assert "names" in response.json()
+
+
+async def test_user_detail_response_schema(client):
+    """상세 응답이 UserOut / UserWithPosts 스키마를 따르는지 확인"""
+    from app.models import Post, User
+
+    user = await User.create(name="Detail", email="detail-schema@example.com")
+    await Post.create(title="First", content="c", user=user)
+
+    response = client.get(f"/api/v1/users/{user.id}")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "id": user.id,
+        "name": "Detail",
+        "email": "detail-schema@example.com",
+    }
+
+    response = client.get(f"/api/v1/users/{user.id}", params={"with_posts": True})
+    posts = response.json()["posts"]
+    assert [post["title"] for post in posts] == ["First"]
+    assert set(posts[0]) == {"id", "title"}
+
+
+async def test_user_detail_conditional_get(client):
+    """If-None-Match 가 일치하면 304, 게시글이 바뀌면 ETag 가 바뀌는지 확인"""
+    from app.models import Post, User
+
+    user = await User.create(name="ETag", email="etag-detail@example.com")
+    url = f"/api/v1/users/{user.id}"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    response = client.get(url, headers={"If-None-Match": f'W/"other", W/{etag}'})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    # 쿼리 파라미터가 다르면 다른 표현
+    response = client.get(url, params={"with_posts": True})
+    posts_etag = response.headers["ETag"]
+    assert posts_etag != etag
+    assert (
+        client.get(
+            url, params={"with_posts": True}, headers={"If-None-Match": posts_etag}
+        ).status_code
+        == 304
+    )
+
+    await Post.create(title="New", content="c", user=user)
+    response = client.get(
+        url, params={"with_posts": True}, headers={"If-None-Match": posts_etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != posts_etag
+
+
+async def test_conditional_get_skips_relations_and_serialization(client):
+    """ETag 가 일치하면 관계 prefetch/조회 없이 304 를 반환하는지 확인"""
+    from app.models import Post, User
+
+    user = await User.create(name="Lazy", email="lazy-etag@example.com")
+    cases = {
+        # users 페이지만 (posts/profile prefetch 생략)
+        "/api/v1/users/?optimized=true": "1",
+        # users + profile + posts 버전 집계 (posts 본문 생략)
+        "/api/v1/users/?fields=name,posts.content,profile.bio": "3",
+    }
+    for path, query_count in cases.items():
+        etag = client.get(path).headers["ETag"]
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304, path
+        assert response.headers["X-Query-Count"] == query_count, path
+
+    # posts 는 본문 대신 집계로 버전을 보므로 게시글이 추가되면 ETag 가 바뀜
+    path = "/api/v1/users/?fields=name,posts.content"
+    etag = client.get(path).headers["ETag"]
+    await Post.create(title="t", content="new", user=user)
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert {"content": "new"} in response.json()["users"][-1]["posts"]
+
+
+def test_collection_conditional_get(client):
+    """목록/집계 엔드포인트가 304 를 반환하고 사용자 생성 후 ETag 가 바뀌는지 확인"""
+    paths = [
+        "/api/v1/users/?limit=5",
+        "/api/v1/users/?limit=5&fields=id,name",
+        "/api/v1/users/names-only",
+        "/api/v1/users/stats/post-count",
+        "/api/v1/users/stats/post-count?live=true",
+    ]
+    etags = {path: client.get(path).headers["ETag"] for path in paths}
+    for path, etag in etags.items():
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304, path
+
+    client.post(
+        "/api/v1/users/", params={"name": "ETag", "email": "etag-list@example.com"}
+    )
+    for path, etag in etags.items():
+        if path.startswith("/api/v1/users/?"):
+            continue  # 첫 페이지는 새 사용자(마지막 id)를 포함하지 않을 수 있음
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200, path
+        assert response.headers["ETag"] != etag
+
+
+def test_bulk_create_users(client):
+    """bulk_create 결과가 응답 스키마로 직렬화되는지 확인"""
+    response = client.post(
+        "/api/v1/users/bulk",
+        json=[
+            {"name": "Bulk 1", "email": "bulk-1@example.com"},
+            {"name": "Bulk 2", "email": "bulk-2@example.com"},
+        ],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"] == "Created 2 users using bulk_create"
+    assert [u["email"] for u in body["users"]] == [
+        "bulk-1@example.com",
+        "bulk-2@example.com",
+    ]
+
+
+async def test_user_threads_query_count_is_constant(client):
+    """게시글/댓글이 늘어도 트리 조회 쿼리 수가 같고 단계별 제한이 적용되는지 확인"""
+    from app.models import Comment, Post, User
+
+    author = await User.create(name="Thread", email="thread-author@example.com")
+    commenters = [
+        await User.create(name=f"Commenter {i}", email=f"commenter-{i}@example.com")
+        for i in range(3)
+    ]
+    url = f"/api/v1/users/{author.id}/threads"
+    params = {"posts_limit": 3, "comments_limit": 2}
+
+    query_counts = []
+    for round_ in range(3):
+        for p in range(2):
+            post = await Post.create(title=f"R{round_}P{p}", content="c", user=author)
+            for commenter in commenters:
+                await Comment.create(content="hi", post=post, user=commenter)
+
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        query_counts.append(response.headers["X-Query-Count"])
+
+    # 사용자(게시글 생성 시 캐시 무효화) + 게시글 + 댓글
+    assert query_counts == ["3", "3", "3"]
+    assert int(query_counts[0]) <= 3
+
+    body = response.json()
+    assert body["has_more_posts"] is True
+    assert [post["title"] for post in body["posts"]] == ["R2P1", "R2P0", "R1P1"]
+    for post in body["posts"]:
+        assert post["comment_count"] == 3
+        assert len(post["comments"]) == 2
+        # 최신 댓글 순, 작성자 포함
+        assert [c["author"]["name"] for c in post["comments"]] == [
+            "Commenter 2",
+            "Commenter 1",
+        ]
+
+    response = client.get(url, params={"posts_limit": 100, "comments_limit": 1})
+    assert len(response.json()["posts"]) == 6
+    assert response.json()["has_more_posts"] is False
+    assert client.get("/api/v1/users/999999999/threads").status_code == 404
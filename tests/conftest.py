@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
+from anyio.from_thread import start_blocking_portal
 from fastapi.testclient import TestClient
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
 
+from app.core.search import install_search_schema
 from app.main import app
 
 
@@ -16,15 +20,43 @@ async def initialize_tests():
                 "app.models.post",
                 "app.models.comment",
                 "app.models.profile",
+                "app.models.job",
             ]
         },
     )
     await Tortoise.generate_schemas()
+    await install_search_schema(connections.get("default"))
     yield
     await Tortoise.close_connections()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(initialize_tests):
-    """FastAPI 테스트 클라이언트"""
-    return TestClient(app)
+    """FastAPI 테스트 클라이언트
+
+    요청마다 새 이벤트 루프를 만들면 SQLite 커넥션의 asyncio.Lock 이 다른 루프에
+    묶여 동시 쿼리(prefetch 등)에서 실패하므로, 세션 동안 하나의 portal 을 공유한다.
+    """
+    test_client = TestClient(app)
+    with start_blocking_portal(**test_client.async_backend) as portal:
+        test_client.portal = portal
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_lock(initialize_tests):
+    """SQLite 커넥션 lock 을 테스트마다 새로 생성
+
+    asyncio.Lock 은 처음 경합이 발생한 이벤트 루프에 묶이는데, 비동기 테스트는
+    테스트마다 다른 루프에서 실행되므로 테스트 사이(lock 이 비어 있을 때)에 교체한다.
+    """
+    connections.get("default")._lock = asyncio.Lock()
+
+
+@pytest.fixture(autouse=True)
+async def clear_cache():
+    """테스트 간 읽기 캐시 공유 방지"""
+    from app.core.cache import cache
+
+    await cache.clear()
+    yield
@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from app.core.admission import AdmissionController, ConcurrencyLimiter
+from app.middleware.admission import AdmissionMiddleware
+
+
+async def test_limiter_queue_and_timeout():
+    """상한을 넘으면 대기열에서 기다리고, 대기열 초과/timeout 은 거절되는지 확인"""
+    limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=0.05)
+    assert await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+    # 대기열이 가득 차면 기다리지 않고 바로 거절
+    assert not await limiter.acquire()
+    # 차례가 오지 않으면 timeout 후 거절
+    assert not await waiter
+    assert limiter.rejected == {"queue_full": 1, "timeout": 1}
+    assert limiter.queued == 0
+
+    # 반납 시 대기자에게 순서대로 넘김
+    first = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    assert await first
+    assert limiter.active == 1
+    limiter.release()
+    assert limiter.active == 0
+
+
+async def test_middleware_sheds_load_per_route():
+    """제한 route 만 503 + Retry-After 로 거절되고 다른 요청은 통과하는지 확인"""
+    started = asyncio.Event()
+    proceed = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow(optimized: bool = False):
+        if not optimized:
+            started.set()
+            await proceed.wait()
+        return {"ok": True}
+
+    @app.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    controller = AdmissionController(
+        {"GET /slow": 1, "GET /slow?optimized=true": 0},
+        max_queue=0,
+        queue_timeout=1.0,
+        retry_after=3,
+    )
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        blocked = asyncio.create_task(ac.get("/slow"))
+        await started.wait()
+
+        rejected = await ac.get("/slow")
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "3"
+        # 쿼리 조건으로 제한에서 제외된 변형과 다른 route 는 통과
+        assert (await ac.get("/slow?optimized=true")).status_code == 200
+        assert (await ac.get("/fast")).status_code == 200
+
+        proceed.set()
+        assert (await blocked).status_code == 200
+        assert (await ac.get("/slow")).status_code == 200
+
+    assert controller.limiters["GET /slow"].active == 0
+    assert 'admission_rejected_total{route="GET /slow",reason="queue_full"} 1' in (
+        controller.render_prometheus()
+    )
+
+
+async def test_middleware_rate_limits_per_client():
+    """클라이언트별 토큰이 떨어지면 429 + Retry-After 를 반환하는지 확인"""
+    app = FastAPI()
+    app.get("/")(lambda: {"ok": True})
+    controller = AdmissionController(
+        {}, max_queue=0, queue_timeout=1.0, rate_limit=0.5, rate_burst=2
+    )
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    responses = []
+    for client in (("10.0.0.1", 1), ("10.0.0.1", 1), ("10.0.0.1", 1), ("10.0.0.2", 1)):
+        transport = httpx.ASGITransport(app=app, client=client)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+            responses.append(await ac.get("/"))
+
+    assert [r.status_code for r in responses] == [200, 200, 429, 200]
+    assert responses[2].headers["Retry-After"] == "2"
+    assert controller.rate_limiter.limited == 1
+
+
+async def test_rate_limit_uses_forwarded_client_from_trusted_proxy():
+    """신뢰하는 프록시 뒤의 클라이언트는 X-Forwarded-For 별로 버킷이 나뉘는지 확인"""
+    app = FastAPI()
+    app.get("/")(lambda: {"ok": True})
+    controller = AdmissionController(
+        {}, max_queue=0, queue_timeout=1.0, rate_limit=0.5, rate_burst=1
+    )
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    # 배포환경 uvicorn 워커가 forwarded_allow_ips 로 적용하는 처리
+    proxied = ProxyHeadersMiddleware(app, trusted_hosts="172.16.0.0/12")
+
+    async def get(peer: str, forwarded_for: str) -> int:
+        transport = httpx.ASGITransport(app=proxied, client=(peer, 1))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+            response = await ac.get("/", headers={"X-Forwarded-For": forwarded_for})
+            return response.status_code
+
+    nginx = "172.18.0.5"
+    assert await get(nginx, "198.51.100.1") == 200
+    assert await get(nginx, "198.51.100.2") == 200
+    assert await get(nginx, "198.51.100.1") == 429
+    # 신뢰하지 않는 주소에서 온 헤더는 무시 (위조한 값으로 버킷을 바꿀 수 없음)
+    assert await get("203.0.113.9", "198.51.100.3") == 200
+    assert await get("203.0.113.9", "198.51.100.4") == 429
+    assert len(controller.rate_limiter) == 3
+
+
+def test_route_limiter_parses_bool_query_values():
+    """bool 쿼리 조건은 FastAPI 와 같게 해석해 1/True 도 같은 limiter 를 쓰는지 확인"""
+    controller = AdmissionController(
+        {"GET /users/": 4, "GET /users/?optimized=true": 2},
+        max_queue=0,
+        queue_timeout=1.0,
+    )
+    optimized = controller.limiters["GET /users/?optimized=true"]
+    default = controller.limiters["GET /users/"]
+
+    for query in (
+        b"optimized=true",
+        b"optimized=1",
+        b"optimized=True",
+        b"x=1&optimized=yes",
+    ):
+        assert controller.route_limiter("GET", "/users/", query) is optimized
+    for query in (b"", b"optimized=false", b"optimized=0", b"optimized=False"):
+        assert controller.route_limiter("GET", "/users/", query) is default
@@ -0,0 +1,158 @@
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CODECS, Codec, CompressedBodyCache, negotiate
+from app.middleware.compression import CompressionMiddleware
+
+PAYLOAD = json.dumps([{"id": i, "name": f"User {i}"} for i in range(200)]).encode()
+
+
+def make_app(cache: CompressedBodyCache, **options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, cache=cache, **options)
+
+    @app.get("/large")
+    async def large():
+        return Response(
+            PAYLOAD, media_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/image")
+    async def image():
+        return Response(PAYLOAD, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f'{{"chunk":{i}}}\n'.encode()
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+def test_negotiate_accept_encoding():
+    """q 값과 서버 선호 순서로 코덱을 고르는지 확인"""
+    gzip_only = {"gzip": CODECS["gzip"]}
+    assert negotiate("gzip, deflate", gzip_only).name == "gzip"
+    assert negotiate("*", gzip_only).name == "gzip"
+    assert negotiate("gzip;q=0, *", gzip_only) is None
+    assert negotiate("identity, deflate", gzip_only) is None
+    assert negotiate(None, gzip_only) is None
+
+    codecs = {name: Codec(name, None, None) for name in ("zstd", "br", "gzip")}
+    assert negotiate("gzip, br, zstd", codecs) is codecs["zstd"]
+    assert negotiate("gzip, br;q=0.9, zstd;q=0.5", codecs) is codecs["gzip"]
+
+
+def test_compresses_large_json_only():
+    """임계값 이상 압축 가능한 응답만 gzip 으로 압축하는지 확인"""
+    client = TestClient(make_app(CompressedBodyCache(1 << 20), minimum_size=500))
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(PAYLOAD)
+    assert response.content == PAYLOAD
+
+    for path in ("/small", "/image"):
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+
+
+def test_reuses_compressed_body_by_etag():
+    """강한 ETag 응답은 압축 결과를 캐시에서 재사용하는지 확인"""
+    cache = CompressedBodyCache(1 << 20)
+    # threadpool_min_size=0: 모든 압축을 스레드 풀에서 실행
+    client = TestClient(make_app(cache, minimum_size=500, threadpool_min_size=0))
+
+    for _ in range(3):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.content == PAYLOAD
+
+    assert (cache.misses, cache.hits) == (1, 2)
+    assert len(cache) == 1
+    assert "compression_cache_hits_total 2" in cache.render_prometheus()
+    assert 'compression_responses_total{encoding="gzip"} 3' in (
+        cache.render_prometheus()
+    )
+
+
+def test_same_etag_different_body_is_not_reused():
+    """ETag 가 같아도 본문이 바뀌면 캐시된 압축 결과를 쓰지 않는지 확인"""
+    cache = CompressedBodyCache(1 << 20)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, cache=cache, minimum_size=500)
+    bodies = [PAYLOAD, PAYLOAD.replace(b"User", b"Resu")]
+
+    @app.get("/versioned")
+    async def versioned():
+        return Response(
+            bodies.pop(0), media_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    client = TestClient(app)
+    first = client.get("/versioned", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/versioned", headers={"Accept-Encoding": "gzip"})
+    assert first.content == PAYLOAD
+    assert second.content == PAYLOAD.replace(b"User", b"Resu")
+    assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_streaming_response_compressed_per_chunk():
+    """스트리밍 응답은 Content-Length 없이 청크 단위로 압축되는지 확인"""
+    client = TestClient(make_app(CompressedBodyCache(1 << 20)))
+
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode().splitlines() == [
+        '{"chunk":0}',
+        '{"chunk":1}',
+        '{"chunk":2}',
+    ]
+
+
+def test_cache_is_bounded_by_bytes():
+    """압축 본문 캐시가 max_bytes 를 넘지 않게 오래된 항목을 버리는지 확인"""
+    cache = CompressedBodyCache(max_bytes=10)
+    cache.set(b"a", "gzip", b"12345")
+    cache.set(b"b", "gzip", b"12345")
+    cache.set(b"c", "gzip", b"12345")
+    cache.set(b"d", "gzip", b"x" * 11)  # 상한보다 큰 본문은 저장하지 않음
+
+    assert cache.get(b"a", "gzip") is None
+    assert cache.get(b"c", "gzip") == b"12345"
+    assert (cache.size, cache.evictions) == (10, 1)
+
+
+def test_conditional_get_with_compressed_etag(client):
+    """압축 응답의 약한 ETag 로 보낸 If-None-Match 도 304 를 받는지 확인"""
+    response = client.get(
+        "/api/v1/users/stats/post-count", headers={"Accept-Encoding": "gzip"}
+    )
+    # 본문이 임계값 미만이면 강한 ETag 그대로이므로 약한 형태로 맞춰 보냄
+    etag = "W/" + response.headers["etag"].removeprefix("W/")
+
+    response = client.get(
+        "/api/v1/users/stats/post-count",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
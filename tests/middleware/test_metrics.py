@@ -0,0 +1,148 @@
+import asyncio
+
+from app.core.db_pool import PoolRegistry
+from app.core.metrics import OVERFLOW_ROUTE, Histogram, MetricsRegistry
+from app.core.metrics_store import MetricsStore
+from app.core.query_tracker import track_queries
+
+
+def test_histogram_quantiles():
+    """버킷 보간으로 분위수를 추정하는지 확인"""
+    histogram = Histogram((0.01, 0.1, 1.0))
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    assert histogram.quantile(0.5) <= 0.01
+    assert 0.1 < histogram.quantile(0.99) <= 1.0
+    assert histogram.cumulative()[-1] == ("+Inf", 100)
+
+
+def test_registry_is_bounded():
+    """시계열 수가 max_series 를 넘지 않는지 확인"""
+    registry = MetricsRegistry(max_series=3)
+    for i in range(100):
+        registry.observe("GET", f"/route/{i}", 200, 0.01, query_count=1)
+
+    snapshot = registry.snapshot()
+    assert len(snapshot) == 4  # 3개 + overflow
+    overflow = next(s for s in snapshot if s["route"] == OVERFLOW_ROUTE)
+    assert overflow["count"] == 97
+
+
+def test_metrics_endpoint_uses_route_template(client):
+    """/metrics 가 route 템플릿 기준으로 집계되는지 확인"""
+    client.get("/api/v1/users/12345")
+    client.get("/api/v1/users/67890")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'route="/api/v1/users/{user_id}"' in body
+    assert "/api/v1/users/12345" not in body
+    assert "http_request_duration_seconds_bucket" in body
+    assert 'quantile="0.99"' in body
+
+
+async def test_metrics_store_merges_workers(tmp_path):
+    """워커 파일을 합산하고, 종료된 워커는 counter 만 archive 에 남기는지 확인"""
+
+    def worker_text(requests: int, in_flight: int, p99: float) -> str:
+        return (
+            "# HELP http_requests_total Total HTTP requests.\n"
+            "# TYPE http_requests_total counter\n"
+            f'http_requests_total{{route="GET /a b",status="2xx"}} {requests}\n'
+            "# HELP admission_in_flight Requests holding a slot.\n"
+            "# TYPE admission_in_flight gauge\n"
+            f"admission_in_flight {in_flight}\n"
+            "# HELP latency_quantile_seconds Estimated quantiles.\n"
+            "# TYPE latency_quantile_seconds gauge\n"
+            f'latency_quantile_seconds{{quantile="0.99"}} {p99}\n'
+        )
+
+    store = MetricsStore(str(tmp_path))
+    store.clear()
+    (tmp_path / "101-1.prom").write_text(worker_text(5, 2, 0.5))
+
+    body = await store.collect(worker_text(3, 1, 0.25))
+    assert 'http_requests_total{route="GET /a b",status="2xx"} 8' in body
+    assert "admission_in_flight 3" in body
+    assert 'latency_quantile_seconds{quantile="0.99"} 0.5' in body
+    assert body.count("# TYPE http_requests_total counter") == 1
+
+    # 마스터가 종료된 워커를 archive: counter 는 유지, gauge 는 빠짐
+    store.archive(101)
+    assert not (tmp_path / "101-1.prom").exists()
+    body = await store.collect(worker_text(4, 0, 0.25))
+    assert 'http_requests_total{route="GET /a b",status="2xx"} 9' in body
+    assert "admission_in_flight 0" in body
+    assert 'latency_quantile_seconds{quantile="0.99"} 0.25' in body
+
+
+async def test_metrics_store_disabled_returns_own_metrics():
+    store = MetricsStore(None)
+    assert await store.collect("up 1\n") == "up 1\n"
+
+
+class FakePool:
+    """asyncpg.Pool 의 acquire/release/크기 조회만 흉내 낸 풀"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.idle = max_size
+        self._slots = asyncio.Semaphore(max_size)
+
+    async def acquire(self, *, timeout=None):
+        await self._slots.acquire()
+        self.idle -= 1
+        return object()
+
+    async def release(self, connection, *, timeout=None):
+        self.idle += 1
+        self._slots.release()
+
+    def get_size(self):
+        return self.max_size
+
+    def get_max_size(self):
+        return self.max_size
+
+    def get_idle_size(self):
+        return self.idle
+
+
+async def test_pool_gauges_track_waiters_and_wait_time():
+    """풀이 가득 찼을 때 대기자 수와 대기 시간이 집계되는지 확인"""
+    registry = PoolRegistry()
+    pool = registry.register("default", FakePool(max_size=1))
+
+    first = await pool.acquire()
+    with track_queries() as stats:
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        snapshot = registry.snapshot()["default"]
+        assert snapshot["waiters"] == 1
+        assert snapshot["in_use"] == 1
+        assert snapshot["idle"] == 0
+
+        await pool.release(first)
+        second = await waiter
+    assert stats.pool_wait >= 0.01
+
+    await pool.release(second)
+    snapshot = registry.snapshot()["default"]
+    assert snapshot["waiters"] == 0
+    assert snapshot["in_use"] == 0
+    assert snapshot["acquire_count"] == 2
+
+    body = registry.render_prometheus()
+    assert 'db_pool_waiters{connection="default"} 0' in body
+    assert 'db_pool_acquire_wait_seconds_count{connection="default"} 2' in body
+
+
+def test_pool_wait_header(client):
+    """응답 헤더에 요청의 풀 대기 시간이 포함되는지 확인"""
+    response = client.get("/api/v1/users/names-only")
+    assert float(response.headers["x-db-pool-wait"]) == 0.0
@@ -0,0 +1,74 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.metrics import MetricsRegistry
+from app.core.pagination import encode_cursor
+from app.core.query_tracker import fingerprint, track_queries
+from app.middleware.query_monitor import QueryMonitorMiddleware
+from app.models import Post, Profile, User
+
+
+def test_fingerprint_strips_literals():
+    """리터럴/파라미터가 달라도 같은 SQL 형태로 묶이는지 확인"""
+    a = fingerprint('SELECT "id" FROM "posts" WHERE "user_id"=1 LIMIT 10')
+    b = fingerprint('SELECT "id" FROM "posts" WHERE "user_id"=42 LIMIT 10')
+    c = fingerprint('SELECT "id" FROM "posts" WHERE "user_id" IN ($1,$2,$3)')
+    assert a == b
+    assert c == 'SELECT "id" FROM "posts" WHERE "user_id" IN (...)'
+
+
+async def test_track_queries_detects_repeated_shape(client):
+    """N+1 패턴이 같은 SQL 형태의 반복으로 집계되는지 확인"""
+    for i in range(3):
+        user = await User.create(name=f"N1 {i}", email=f"n1-{i}@example.com")
+        await Post.create(title="t", content="c", user=user)
+
+    with track_queries() as stats:
+        users = await User.filter(email__startswith="n1-")
+        for user in users:
+            await user.posts.all()
+
+    assert stats.count == 4
+    assert stats.max_repeat == 3
+    assert stats.repeated(3)[0][1] == 3
+    assert stats.slowest_sql is not None
+
+
+async def test_query_count_header(client):
+    """응답 헤더에 실제 쿼리 수가 기록되는지 확인"""
+    # 사용자 페이지 + posts + profile prefetch = 3 (다른 테스트의 데이터와 무관하게)
+    user = await User.create(name="Header", email="header@example.com")
+    await Post.create(title="t", content="c", user=user)
+    await Profile.create(bio="bio", user=user)
+
+    response = client.get(
+        f"/api/v1/users/?optimized=true&limit=1&cursor={encode_cursor(user.id - 1)}"
+    )
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "3"
+    assert [u["id"] for u in response.json()["users"]] == [user.id]
+    assert float(response.headers["X-DB-Time"]) >= 0
+
+    response = client.get("/")
+    assert response.headers["X-Query-Count"] == "0"
+
+
+def test_streaming_response_passthrough():
+    """스트리밍 응답이 버퍼링 없이 헤더와 함께 전달되는지 확인"""
+
+    async def chunks():
+        for i in range(3):
+            yield f"chunk{i}\n".encode()
+
+    app = FastAPI()
+    app.add_middleware(QueryMonitorMiddleware, registry=MetricsRegistry())
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    response = TestClient(app).get("/stream")
+    assert response.text == "chunk0\nchunk1\nchunk2\n"
+    assert response.headers["X-Query-Count"] == "0"
+    assert "X-Process-Time" in response.headers
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from datetime import datetime
+
+from app.core.cache import MISSING, Cache, InMemoryCache, cache
+from app.models import Post, User
+from app.repositories.cached_user_repository import CachedUserRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_in_memory_cache_ttl_and_lru():
+    """TTL 만료와 LRU 축출 확인"""
+    clock = FakeClock()
+    backend = InMemoryCache(max_entries=2, default_ttl=10, clock=clock)
+
+    await backend.set("a", 1)
+    await backend.set("b", 2)
+    assert await backend.get("a") == 1  # a 가 최근 사용으로 이동
+    await backend.set("c", 3)  # b 축출
+    assert await backend.get("b") is MISSING
+    assert backend.evictions == 1
+
+    clock.now = 11
+    assert await backend.get("a") is MISSING
+
+
+async def test_single_flight_runs_loader_once():
+    """동시 miss 에 대해 로더가 한 번만 실행되는지 확인"""
+    cache = Cache(InMemoryCache())
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["value"]
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("key", loader) for _ in range(10))
+    )
+    assert calls == 1
+    assert all(r == ["value"] for r in results)
+    assert cache.misses == 10
+
+    assert await cache.get_or_load("key", loader) == ["value"]
+    assert cache.hits == 1
+
+
+async def test_cancelled_loader_does_not_cancel_waiters():
+    """로딩하던 요청이 취소되면 대기자 중 하나가 다시 로딩하는지 확인"""
+    cache = Cache(InMemoryCache())
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    leader = asyncio.create_task(cache.get_or_load("key", loader))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_load("key", loader))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    assert not follower.done()
+    release.set()
+
+    assert await follower == 2
+    assert leader.cancelled()
+    assert await cache.get_or_load("key", loader) == 2
+
+
+async def test_create_user_invalidates_list_cache(client):
+    """사용자 생성 시 목록 캐시가 무효화되는지 확인"""
+    repo = CachedUserRepository(Cache(InMemoryCache()))
+
+    before = await repo.get_user_names_only()
+    assert await repo.get_user_names_only() is before  # 캐시 hit
+
+    user = await repo.create_user(name="Cached", email="cached@example.com")
+    after = await repo.get_user_names_only()
+    assert {"id": user.id, "name": "Cached"} in after
+
+    cached_user = await repo.get_user_by_id(user.id)
+    assert cached_user.email == "cached@example.com"
+    hit = await repo.get_user_by_id(user.id)
+    assert (hit.id, hit.updated_at) == (user.id, cached_user.updated_at)
+    assert isinstance(hit.updated_at, datetime)
+    assert repo.cache.hits == 2
+
+    # 직렬화하는 외부 백엔드에서도 저장할 수 있는 값만 캐시
+    await repo.get_users_version()
+    await repo.get_users_with_post_count()
+    for _, value in repo.cache.backend._entries.values():
+        json.dumps(value)
+
+
+async def test_post_signals_invalidate_post_count_cache(client):
+    """게시글 생성/삭제 시 post_count 가 들어간 캐시가 무효화되는지 확인"""
+    user = await User.create(name="Counted", email="counted@example.com")
+    repo = CachedUserRepository(cache)
+    url = "/api/v1/users/stats/post-count"
+
+    def post_count(response) -> int:
+        stats = response.json()["stats"]
+        return next(s["post_count"] for s in stats if s["id"] == user.id)
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert post_count(response) == 0
+    assert (await repo.get_user_by_id(user.id)).post_count == 0
+
+    post = await Post.create(title="t", content="c", user=user)
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert post_count(response) == 1
+    assert (await repo.get_user_by_id(user.id)).post_count == 1
+
+    await post.delete()
+    assert post_count(client.get(url)) == 0
+    assert (await repo.get_user_by_id(user.id)).post_count == 0
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.core.dataloader import DataLoader
+from app.core.query_tracker import track_queries
+from app.models import Post, User
+from app.repositories.loaders import UserLoaders
+
+
+async def test_loads_in_same_tick_are_batched(client):
+    """같은 틱의 load() 호출이 IN 쿼리 하나로 합쳐지고 결과가 캐시되는지 확인"""
+    users = [
+        await User.create(name=f"Loader {i}", email=f"loader-{i}@example.com")
+        for i in range(4)
+    ]
+    for user in users[:3]:
+        await Post.create(title=f"by {user.id}", content="c", user=user)
+
+    loaders = UserLoaders()
+    with track_queries() as stats:
+        posts, first = await asyncio.gather(
+            loaders.posts.load_many(u.id for u in users),
+            loaders.posts.load(users[0].id),
+        )
+        await loaders.posts.load(users[0].id)  # 캐시 hit
+
+    assert stats.count == 1
+    assert [len(p) for p in posts] == [1, 1, 1, 0]
+    assert first == posts[0]
+
+
+async def test_get_user_with_posts_query_count(client):
+    """게시글 포함 상세 조회가 중복 fetch 없이 실행되는지 확인"""
+    user = await User.create(name="Detail", email="detail@example.com")
+    await Post.create(title="first", content="c", user=user)
+
+    response = client.get(f"/api/v1/users/{user.id}", params={"with_posts": True})
+    assert response.status_code == 200
+    assert response.json()["posts"][0]["title"] == "first"
+    assert response.headers["X-Query-Count"] == "2"
+
+
+async def test_cancelled_caller_does_not_cancel_shared_load():
+    """한 호출자의 취소가 같은 키를 기다리는 다른 호출자에게 전파되지 않는지 확인"""
+    release = asyncio.Event()
+
+    async def batch_load(keys):
+        await release.wait()
+        return {key: key * 10 for key in keys}
+
+    loader = DataLoader(batch_load)
+    cancelled = asyncio.create_task(loader.load(1))
+    waiting = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == 10
+    assert cancelled.cancelled()
+
+
+async def test_cancelled_batch_fails_waiters():
+    """배치 태스크가 취소되면 대기자가 멈추지 않고 오류를 받는지 확인"""
+
+    async def batch_load(keys):
+        await asyncio.Event().wait()
+
+    loader = DataLoader(batch_load)
+    waiter = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0.01)
+    for task in loader._tasks:
+        task.cancel()
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await asyncio.wait_for(waiter, timeout=1)
+
+    # 시작 전에 취소된 배치도 같음
+    waiter = asyncio.create_task(loader.load(2))
+    while not loader._tasks:
+        await asyncio.sleep(0)
+    for task in loader._tasks:
+        task.cancel()
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await asyncio.wait_for(waiter, timeout=1)
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from tortoise import connections
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.router import router
+from tortoise.utils import get_schema_sql
+
+from app.core.db_router import ReplicaRouter, get_routing_state, routing_scope
+from app.middleware.read_your_writes import STICKY_COOKIE, ReadYourWritesMiddleware
+from app.models import User
+from app.repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+async def replica(initialize_tests, tmp_path):
+    """세션 메모리 DB 를 primary, 임시 SQLite 파일을 복제본으로 라우팅"""
+    client = SqliteClient(str(tmp_path / "replica.sqlite3"), connection_name="replica1")
+    token = connections.set("replica1", client)
+    # primary 와 같은 스키마 (모델이 default 커넥션에 묶여 있으므로 SQL 을 복사)
+    await client.execute_script(get_schema_sql(connections.get("default"), safe=True))
+    router.init_routers([lambda: ReplicaRouter(["replica1"], sticky_seconds=60)])
+    try:
+        yield client
+    finally:
+        router.init_routers([])
+        await client.close()
+        connections.reset(token)
+        connections.discard("replica1")
+
+
+async def test_reads_go_to_replica_writes_to_primary(replica):
+    """읽기는 복제본, 쓰기는 primary 로 가고 쓰기 후에는 primary 를 읽는지 확인"""
+    await User.create(
+        id=999_999,
+        name="Replica Only",
+        email="replica-only@example.com",
+        using_db=replica,
+    )
+    repo = UserRepository()
+
+    with routing_scope():
+        names = [row["name"] for row in await repo.get_user_names_only()]
+        assert names == ["Replica Only"]
+
+        user = await repo.create_user("Primary", "primary-routing@example.com")
+        assert (
+            not await User.filter(id=user.id, email=user.email)
+            .using_db(replica)
+            .exists()
+        )
+        # read-your-writes: 쓰기 직후 읽기는 primary
+        assert get_routing_state().primary_until > 0
+        assert (await repo.get_user_by_id(user.id)).email == user.email
+
+    with routing_scope():
+        # 새 요청(고정 기간 없음)은 다시 복제본을 읽음
+        assert await repo.get_user_by_id(user.id) is None
+
+
+def test_sticky_cookie_carries_writes_across_requests():
+    """쓰기가 있었던 응답만 쿠키를 내려 주고 다음 요청이 primary 를 읽는지 확인"""
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=5)
+    replica_router = ReplicaRouter(["replica1"], sticky_seconds=5)
+
+    @app.get("/read")
+    async def read():
+        return {"db": replica_router.db_for_read(User)}
+
+    @app.post("/write")
+    async def write():
+        return {"db": replica_router.db_for_write(User)}
+
+    test_client = TestClient(app)
+    response = test_client.get("/read")
+    assert response.json() == {"db": "replica1"}
+    assert STICKY_COOKIE not in response.cookies
+
+    response = test_client.post("/write")
+    assert response.json() == {"db": "default"}
+    assert STICKY_COOKIE in response.cookies
+
+    # TestClient 가 쿠키를 유지하므로 다음 읽기는 primary
+    assert test_client.get("/read").json() == {"db": "default"}
+    test_client.cookies.clear()
+    assert test_client.get("/read").json() == {"db": "replica1"}
@@ -0,0 +1,82 @@
+import importlib
+import re
+
+from tortoise import connections
+from tortoise.utils import get_schema_sql
+
+from app.core.compiled_query import Param
+from app.models import Post, User
+from app.repositories.user_repository import USER_BY_ID, UserRepository
+
+
+async def test_post_count_column_tracks_posts(client):
+    """게시글 생성/삭제 시 post_count 가 갱신되고 backfill 로 보정되는지 확인"""
+    user = await User.create(name="Counter", email="counter@example.com")
+    post = await Post.create(title="a", content="c", user=user)
+    await Post.create(title="b", content="c", user=user)
+    await user.refresh_from_db()
+    assert user.post_count == 2
+
+    await post.delete()
+    await user.refresh_from_db()
+    assert user.post_count == 1
+
+    # 시그널이 발생하지 않는 경로
+    await Post.bulk_create([Post(title="c", content="c", user=user)])
+    repo = UserRepository()
+    stats = {s["id"]: s for s in await repo.get_users_with_post_count()}
+    live = {s["id"]: s for s in await repo.get_users_with_post_count(live=True)}
+    assert stats[user.id]["post_count"] == 1
+    assert live[user.id]["post_count"] == 2
+
+    await repo.backfill_post_counts()
+    stats = {s["id"]: s for s in await repo.get_users_with_post_count()}
+    assert stats == live
+
+
+async def test_model_indexes_match_migration(initialize_tests):
+    """모델에 선언한 인덱스가 마이그레이션에도 같은 이름으로 있는지 확인"""
+    migrations = [
+        importlib.import_module(f"migrations.models.{name}")
+        for name in (
+            "3_20261018130000_add_post_comment_indexes",
+            "5_20261018150000_add_jobs",
+        )
+    ]
+    index_pattern = re.compile(r'CREATE INDEX IF NOT EXISTS "(\w+)" ON "\w+" \(.+?\);')
+
+    model_indexes = set(
+        index_pattern.findall(get_schema_sql(connections.get("default"), safe=True))
+    )
+    migrated = {
+        name
+        for migration in migrations
+        for name in index_pattern.findall(await migration.upgrade(None))
+    }
+    assert {"idx_posts_user_id_0499f5", "idx_comments_post_id_019422"} <= migrated
+    assert model_indexes == migrated
+
+
+async def test_compiled_queries_match_orm(initialize_tests):
+    """컴파일된 SQL 을 재사용하면서 ORM 쿼리와 같은 결과를 반환하는지 확인"""
+    user = await User.create(name="Compiled", email="compiled@example.com")
+    for title in ("a", "b"):
+        await Post.create(title=title, content="c", user=user)
+    repo = UserRepository()
+
+    found = await repo.get_user_by_id(user.id)
+    assert (found.id, found.email, found.created_at) == (
+        user.id,
+        user.email,
+        (await User.get(id=user.id)).created_at,
+    )
+    assert await repo.get_user_by_id(999999999) is None
+
+    page, has_more = await repo.get_users_page(limit=1, after_id=user.id - 1)
+    assert ([u.id for u in page], has_more) == ([user.id], False)
+
+    # 값은 바인딩만 하고 SQL 은 dialect 별로 한 번만 생성
+    sql, values = USER_BY_ID.compile(connections.get("default"))
+    assert USER_BY_ID.compile(connections.get("default"))[0] is sql
+    assert '"id"=?' in sql
+    assert isinstance(values[0], Param) and values[0].name == "user_id"
@@ -0,0 +1,103 @@
+import asyncio
+
+from app.core.jobs import JobRunner
+from app.models import Job, JobStatus
+
+
+async def test_worker_pool_limits_concurrency():
+    """워커 수만큼만 동시에 실행하고 실패한 작업은 오류를 기록하는지 확인"""
+    running = 0
+    peak = 0
+
+    async def sleep(job, context):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        await context.set_progress(1, 1)
+        return {"slept": job.payload["n"]}
+
+    async def fail(job, context):
+        raise RuntimeError("boom")
+
+    runner = JobRunner(
+        workers=2,
+        max_pending=10,
+        stale_seconds=60,
+        handlers={"test.sleep": sleep, "test.fail": fail},
+    )
+    await runner.start()
+    try:
+        jobs = [await runner.submit("test.sleep", {"n": i}) for i in range(5)]
+        failed = await runner.submit("test.fail", {})
+        await runner.join()
+    finally:
+        await runner.stop()
+
+    assert peak == 2
+    for job in jobs:
+        await job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result == {"slept": job.payload["n"]}
+        assert job.progress == job.total == 1
+    await failed.refresh_from_db()
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "RuntimeError: boom"
+    assert runner.pending == 0
+
+
+async def test_interrupted_jobs_are_requeued():
+    """종료로 취소된 작업과 오래 갱신되지 않은 running 작업이 다시 실행되는지 확인"""
+    started = asyncio.Event()
+
+    async def block(job, context):
+        started.set()
+        await asyncio.Event().wait()
+
+    runner = JobRunner(
+        workers=1, max_pending=10, stale_seconds=60, handlers={"test.block": block}
+    )
+    await runner.start()
+    job = await runner.submit("test.block", {})
+    await started.wait()
+    await runner.stop()
+    await job.refresh_from_db()
+    assert job.status == JobStatus.QUEUED
+    assert job.attempts == 1
+
+    # 다른 프로세스가 실행하다 죽은 작업 (updated_at 이 stale_seconds 보다 오래됨)
+    crashed = await Job.create(kind="test.block", status=JobStatus.RUNNING)
+    await Job.filter(id=crashed.id).update(
+        updated_at=crashed.created_at.replace(year=2000)
+    )
+    recovered = await runner.recover()
+    assert {job.id, crashed.id} <= set(recovered)
+    await crashed.refresh_from_db()
+    assert crashed.status == JobStatus.QUEUED
+
+    await Job.filter(id__in=[job.id, crashed.id]).delete()
+
+
+async def test_repeatedly_interrupted_job_is_failed():
+    """max_attempts 번 실행되다 중단된 작업은 다시 넣지 않고 failed 로 기록하는지 확인"""
+    runner = JobRunner(workers=0, max_pending=10, stale_seconds=60, max_attempts=3)
+    retried = await Job.create(kind="test.crash", status=JobStatus.RUNNING, attempts=2)
+    exhausted = await Job.create(
+        kind="test.crash", status=JobStatus.RUNNING, attempts=3
+    )
+    await Job.filter(id__in=[retried.id, exhausted.id]).update(
+        updated_at=retried.created_at.replace(year=2000)
+    )
+
+    recovered = await runner.recover()
+    assert retried.id in recovered
+    assert exhausted.id not in recovered
+    await retried.refresh_from_db()
+    assert retried.status == JobStatus.QUEUED
+    await exhausted.refresh_from_db()
+    assert exhausted.status == JobStatus.FAILED
+    assert exhausted.error == "Interrupted 3 times"
+    assert exhausted.finished_at is not None
+
+    await Job.filter(id__in=[retried.id, exhausted.id]).delete()
@@ -0,0 +1,96 @@
+import json
+
+from app.models import User
+from app.services.user_service import iter_lines
+
+
+def test_ingest_ndjson_reports_conflicts(client):
+    """NDJSON 적재 시 배치별 email 충돌과 잘못된 행을 보고하는지 확인"""
+    client.post(
+        "/api/v1/users/", params={"name": "Existing", "email": "ingest-0@example.com"}
+    )
+    lines = [
+        {"name": "Ingest 0", "email": "ingest-0@example.com"},  # 기존 사용자와 충돌
+        {"name": "Ingest 1", "email": "ingest-1@example.com"},
+        {"name": "Ingest 2", "email": "ingest-2@example.com"},
+        {"name": "Dup", "email": "ingest-2@example.com"},  # 같은 배치 안 중복
+        {"name": "", "email": "not-an-email"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{broken\n"
+
+    response = client.post(
+        "/api/v1/users/bulk/ingest",
+        params={"batch_size": 2},
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["received"] == 6
+    assert report["inserted"] == 2
+    assert report["conflicts"] == 2
+    assert report["invalid"] == 2
+    assert [b["rows"] for b in report["batches"]] == [2, 2]
+    assert report["batches"][0]["conflicts"] == ["ingest-0@example.com"]
+    assert report["batches"][1]["conflicts"] == ["ingest-2@example.com"]
+    assert {e["line"] for e in report["errors"]} == {5, 6}
+
+
+async def test_ingest_csv(client):
+    """CSV(따옴표 안 줄바꿈 포함) 적재 확인"""
+    body = 'name,email\n"Csv, One",csv-1@example.com\n"Csv\nTwo",csv-2@example.com\n'
+
+    response = client.post(
+        "/api/v1/users/bulk/ingest",
+        content=body.encode(),
+        headers={"Content-Type": "text/csv; charset=utf-8"},
+    )
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 2
+    user = await User.get(email="csv-2@example.com")
+    assert user.name == "Csv\nTwo"
+
+
+def test_ingest_rejects_unknown_content_type(client):
+    response = client.post(
+        "/api/v1/users/bulk/ingest",
+        content=b"[]",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 415
+
+
+async def test_iter_lines_across_chunks():
+    """청크 경계에 걸친 긴 줄과 마지막 줄(줄바꿈 없음)을 한 줄로 모으는지 확인"""
+    long_name = "x" * 10_000
+
+    async def chunks():
+        body = f"{long_name}\r\n\nlast".encode()
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    lines = [line async for line in iter_lines(chunks())]
+    assert lines == [(1, long_name), (2, ""), (3, "last")]
+
+
+def test_ingest_reports_invalid_utf8_line_and_continues(client):
+    """UTF-8 이 아닌 줄은 오류 행으로 보고하고, 앞뒤 배치는 그대로 적재되는지 확인"""
+    body = b"\n".join(
+        [
+            json.dumps({"name": "Utf 1", "email": "utf-1@example.com"}).encode(),
+            b'{"name": "\xff\xfe", "email": "utf-bad@example.com"}',
+            json.dumps({"name": "Utf 2", "email": "utf-2@example.com"}).encode(),
+        ]
+    )
+
+    response = client.post(
+        "/api/v1/users/bulk/ingest",
+        params={"batch_size": 1},
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["invalid"] == 1
+    assert report["errors"] == [{"line": 2, "error": "Line is not valid UTF-8"}]